@@ -0,0 +1,228 @@
+"""
+Regression check and micro-benchmark comparing the lyric markup handling previously spread through the song editor and
+the pagination code with the single-pass normalizer in dataHandling.lyricMarkup, over the songs in lyric_corpus. The
+check fails if the new code gives different slide text for any song. Run from the src directory:
+
+    python -m benchmarks.benchmark_lyric_markup
+"""
+import re
+import sys
+import time
+
+from benchmarks.lyric_corpus import SONGS, to_qt_html, to_openlp_lyrics, to_simplified_lyrics
+from dataHandling.lyricMarkup import get_lyric_segments, normalize_lyrics, encode_lyrics, decode_lyrics, \
+    get_plain_text, get_structured_lyrics
+
+ITERATIONS = 200
+
+
+def old_get_simplified_text(lyrics):
+    """
+    Method reproducing the html simplification previously done in EditWidget.get_simplified_text
+    :param str lyrics: The lyrics
+    :return str: The simplified lyrics
+    """
+    break_tag = '<br />'
+
+    if lyrics.startswith('<!'):
+        lyrics_split = re.split('<body.*?>', lyrics)
+        lyrics = lyrics_split[1].replace('</body></html>', '').strip()
+
+        paragraphs = re.findall('<p.*?>.*?</p>', lyrics)
+        lyrics = ''
+        for i in range(len(paragraphs)):
+            line = re.sub('<p.*?>', '', paragraphs[i])
+            line = line.replace('</p>', '').strip()
+            if i < len(paragraphs) - 1:
+                if line != '<br />':
+                    lyrics += line + break_tag
+                else:
+                    lyrics += line
+            elif line != '<br />':
+                lyrics += line
+    else:
+        lyrics = re.sub('\n', break_tag, lyrics)
+    lyrics = re.sub('<br.*?/>', break_tag, lyrics)
+
+    style_substrings = re.findall('<span.*?</span>', lyrics)
+    for substring in style_substrings:
+        prefix = ''
+        suffix = ''
+        if 'font-weight' in substring:
+            prefix += '<b>'
+            suffix += '</b>'
+        if 'font-style' in substring:
+            prefix += '<i>'
+            suffix += '</i>'
+        if 'text-decoration' in substring:
+            prefix += '<u>'
+            suffix += '</u>'
+
+        new_substring = prefix + re.sub('<.*?>', '', substring) + suffix
+        lyrics = lyrics.replace(substring, new_substring)
+
+    return lyrics
+
+
+def old_get_segments(lyrics):
+    """
+    Method reproducing the segment markup previously done in paginate_song, before the segments were measured
+    :param str lyrics: The song's stored lyrics
+    :return dict: {abbreviated marker: segment text}
+    """
+    lyric_dictionary = {}
+    if '<body' in lyrics:
+        lyrics_split = re.split('<body.*?>', lyrics)
+        lyrics = lyrics_split[1].split('</body>')[0].strip()
+        lyrics = re.sub('<p.*?>', '<p style="text-align: center;">', lyrics)
+
+    segment_markers = re.findall(r'\[.*?]', lyrics)
+    segment_split = re.split(r'\[.*?]', lyrics)
+
+    if len(segment_markers) > 0:
+        for i in range(len(segment_markers)):
+            lyric_dictionary.update({segment_markers[i]: segment_split[i + 1].strip()})
+    else:
+        lyrics_split = lyrics.split('<br /><br />')
+        for i in range(len(lyrics_split)):
+            if len(lyrics_split[i].strip()) > 0:
+                lyric_dictionary.update({f'[Verse {i + 1}]': lyrics_split[i].strip()})
+
+    new_dict = {}
+    for key in lyric_dictionary:
+        if ' ' in key:
+            key_text = key.replace('[', '').replace(']', '')
+            new_key = key_text.split(' ')[0][0].lower() + key_text.split(' ')[1]
+            new_dict['[' + new_key + ']'] = lyric_dictionary[key]
+        else:
+            new_dict[key] = lyric_dictionary[key]
+
+    segments = {}
+    for key in new_dict:
+        segment_text = new_dict[key].strip()
+        segment_text = re.sub('<p.*?>', '', segment_text)
+        segment_text = segment_text.replace('</p>', '')
+        segment_text = segment_text.replace('\n', '<br />')
+        segment_text = segment_text.replace('&quot;', '"')
+
+        while segment_text.startswith('<br />'):
+            segment_text = segment_text[6:]
+        while segment_text.endswith('<br />'):
+            segment_text = segment_text[:len(segment_text) - 6]
+
+        if 'span' in segment_text and 'italic' in segment_text:
+            italicized_text = re.findall('<span style=" font-style:italic;">.*?</span>', segment_text)
+            for text in italicized_text:
+                new_text = re.sub('<span.*?italic.*?>', '<i>', text)
+                new_text = re.sub('</span>', '</i>', new_text)
+                segment_text = segment_text.replace(text, new_text)
+
+        if 'span' in segment_text and 'font-weight' in segment_text:
+            bold_text = re.findall('<span style=" font-weight:700;">.*?</span>', segment_text)
+            for text in bold_text:
+                new_text = re.sub('<span.*?font-weight.*?>', '<b>', text)
+                new_text = re.sub('</span>', '</b>', new_text)
+                segment_text = segment_text.replace(text, new_text)
+
+        if 'span' in segment_text and 'text-decoration' in segment_text:
+            underline_text = re.findall('<span.*?text-decoration.*?5px;">.*?</span>', segment_text)
+            for text in underline_text:
+                new_text = re.sub('<span.*?text-decoration.*?>', '<u>', text)
+                new_text = re.sub('</span>', '</u>', new_text)
+                segment_text = segment_text.replace(text, new_text)
+
+        segment_text = re.sub('<span.*?>', '', segment_text)
+        segment_text = re.sub('</span>', '', segment_text)
+        segments[key] = segment_text
+    return segments
+
+
+def check_regressions():
+    """
+    Method to check that the new code gives the same stored lyrics and the same segments as the old code for every song
+    in the corpus
+    :return list of str: A description of each difference found
+    """
+    failures = []
+    for song in SONGS:
+        html = to_qt_html(song)
+
+        old_stored = old_get_simplified_text(html)
+        new_stored = normalize_lyrics(html)
+        if new_stored != to_simplified_lyrics(song):
+            failures.append(f'{song["title"]}: stored lyrics differ from the corpus\n  new: {new_stored}')
+
+        # the old code closed the tags of a span with several styles in the order it opened them, i.e. <b><i>x</b></i>,
+        # so its lyrics are compared once the structured form has put their tags back in order
+        if decode_lyrics(encode_lyrics(old_stored)) != new_stored:
+            failures.append(f'{song["title"]}: stored lyrics differ\n  old: {old_stored}\n  new: {new_stored}')
+
+        old_segments = old_get_segments(new_stored)
+        new_segments = get_lyric_segments(new_stored)
+        if old_segments != new_segments:
+            failures.append(f'{song["title"]}: segments differ\n  old: {old_segments}\n  new: {new_segments}')
+
+        # the new code also reads the html directly, as older versions of the program sometimes stored it
+        if get_lyric_segments(html) != new_segments:
+            failures.append(f'{song["title"]}: segments read from html differ from those read from stored lyrics')
+
+        # lyrics stored in the structured form must read back with the same text and styling, and the same slides
+        stored = encode_lyrics(new_stored)
+        read_back = decode_lyrics(stored)
+        if (encode_lyrics(read_back) != stored or get_plain_text(read_back) != get_plain_text(new_stored)
+                or get_lyric_segments(read_back).keys() != new_segments.keys()):
+            failures.append(f'{song["title"]}: structured lyrics don\'t round-trip\n  stored: {stored}')
+
+        # songs imported from OpenLP have their segment markers inline, which must still start tagged segments
+        openlp_lyrics = to_openlp_lyrics(song)
+        stored = encode_lyrics(openlp_lyrics)
+        if (any(tag is None for tag, lines in get_structured_lyrics(stored)['segments'])
+                or get_lyric_segments(decode_lyrics(stored)) != get_lyric_segments(openlp_lyrics)):
+            failures.append(f'{song["title"]}: OpenLP lyrics don\'t keep their segments\n  stored: {stored}')
+    return failures
+
+
+def time_function(function, *args):
+    """
+    Method to run a function ITERATIONS times and return the average time per call
+    :return float: The average time, in ms
+    """
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        function(*args)
+    return (time.perf_counter() - start) * 1000 / ITERATIONS
+
+
+def main():
+    failures = check_regressions()
+    for failure in failures:
+        print(failure)
+    if failures:
+        print(f'regression check: {len(failures)} difference(s) found')
+    else:
+        print(f'regression check: all {len(SONGS)} songs unchanged')
+
+    html_songs = [to_qt_html(song) for song in SONGS]
+    stored_songs = [old_get_simplified_text(html) for html in html_songs]
+
+    old_save_time = time_function(lambda: [old_get_simplified_text(html) for html in html_songs])
+    new_save_time = time_function(lambda: [normalize_lyrics(html) for html in html_songs])
+    structured_songs = [encode_lyrics(lyrics) for lyrics in stored_songs]
+    read_time = time_function(lambda: [decode_lyrics(lyrics) for lyrics in structured_songs])
+    old_segment_time = time_function(lambda: [old_get_segments(lyrics) for lyrics in stored_songs])
+    new_segment_time = time_function(lambda: [get_lyric_segments(lyrics) for lyrics in stored_songs])
+
+    print(f'simplify editor html (old): {old_save_time:.3f} ms/corpus')
+    print(f'simplify editor html (new): {new_save_time:.3f} ms/corpus')
+    print(f'segment stored lyrics (old): {old_segment_time:.3f} ms/corpus')
+    print(f'segment stored lyrics (new): {new_segment_time:.3f} ms/corpus')
+    print(f'read structured lyrics:      {read_time:.3f} ms/corpus')
+    print(f'stored size: editor html {sum(len(html) for html in html_songs)} chars, simplified markup '
+          f'{sum(len(lyrics) for lyrics in stored_songs)} chars, structured '
+          f'{sum(len(lyrics) for lyrics in structured_songs)} chars')
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
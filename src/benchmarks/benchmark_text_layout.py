@@ -0,0 +1,104 @@
+"""
+Micro-benchmark comparing the old per-word QPainterPath.boundingRect line wrapping with the cached-advance wrapping in
+dataHandling.textLayout. Run from the src directory:
+
+    python -m benchmarks.benchmark_text_layout
+"""
+import re
+import sys
+import time
+
+from PyQt5.QtCore import QPointF
+from PyQt5.QtGui import QFont, QFontMetrics, QPainterPath, QGuiApplication
+
+from dataHandling.textLayout import FontMetricsCache, wrap_text
+
+SAMPLE_SLIDE = (
+    'Amazing grace how <b>sweet</b> the sound<br />'
+    'That saved a wretch like me<br />'
+    'I once was <i>lost</i> but now am found<br />'
+    'Was blind but <u>now I see</u><br />'
+    'Twas grace that taught my heart to fear and grace my fears relieved how precious did that grace appear the hour '
+    'I first believed'
+)
+FONT_FAMILY = 'Arial'
+FONT_SIZE = 60
+MAX_WIDTH = 1880
+ITERATIONS = 200
+
+
+def old_wrap(text, family, size, max_width):
+    """
+    Method reproducing the line wrapping previously done in LyricDisplayWidget.calculate_painted_text
+    :param str text: The marked-up text
+    :param str family: The font family
+    :param int size: The font's point size
+    :param float max_width: The width, in px, that lines must fit within
+    :return list of QPainterPath: The wrapped lines
+    """
+    font = QFont(family, size)
+    space_width = QFontMetrics(font).horizontalAdvance(' ')
+    painter_paths = []
+    word_path = QPainterPath()
+    path_index = -1
+    for line in text.split('<br />'):
+        x = 0
+        painter_paths.append(QPainterPath())
+        path_index += 1
+        for word in line.split(' '):
+            word_path.clear()
+            if '<b>' in word:
+                font.setWeight(QFont.Weight.Bold)
+            if '<i>' in word:
+                font.setItalic(True)
+            if '<u>' in word:
+                font.setUnderline(True)
+
+            word_path.addText(QPointF(x, 0), font, re.sub('<.*?>', '', word))
+            if painter_paths[path_index].boundingRect().width() + word_path.boundingRect().width() > max_width:
+                painter_paths.append(QPainterPath())
+                x = 0
+                path_index += 1
+            painter_paths[path_index].addText(QPointF(x, 0), font, re.sub('<.*?>', '', word))
+            x = painter_paths[path_index].boundingRect().width() + space_width
+
+            if '</b>' in word:
+                font.setWeight(QFont.Weight.Normal)
+            if '</i>' in word:
+                font.setItalic(False)
+            if '</u>' in word:
+                font.setUnderline(False)
+    return painter_paths
+
+
+def time_function(function, *args):
+    """
+    Method to run a function ITERATIONS times and return the average time per call
+    :return float: The average time, in ms
+    """
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        function(*args)
+    return (time.perf_counter() - start) * 1000 / ITERATIONS
+
+
+def main():
+    # fonts can only be measured while the application exists, so it's kept referenced until the benchmark is done
+    app = QGuiApplication(sys.argv)
+
+    old_time = time_function(old_wrap, SAMPLE_SLIDE, FONT_FAMILY, FONT_SIZE, MAX_WIDTH)
+    cold_time = time_function(
+        lambda: wrap_text(SAMPLE_SLIDE, FONT_FAMILY, FONT_SIZE, MAX_WIDTH, FontMetricsCache()))
+    cache = FontMetricsCache()
+    warm_time = time_function(wrap_text, SAMPLE_SLIDE, FONT_FAMILY, FONT_SIZE, MAX_WIDTH, cache)
+
+    print(f'old per-word boundingRect wrap: {old_time:.3f} ms/slide')
+    print(f'cached-advance wrap (cold):     {cold_time:.3f} ms/slide')
+    print(f'cached-advance wrap (warm):     {warm_time:.3f} ms/slide')
+    print(f'old lines: {len(old_wrap(SAMPLE_SLIDE, FONT_FAMILY, FONT_SIZE, MAX_WIDTH))}, '
+          f'new lines: {len(wrap_text(SAMPLE_SLIDE, FONT_FAMILY, FONT_SIZE, MAX_WIDTH, cache))}')
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Load test for the web remote server. Connects N simulated remote clients to a running ProjectOn instance, repeatedly
+POSTs slide_forward/slide_back commands to /remote the way the remote page does, and reports how long it takes for the
+resulting 'change_current_slide' broadcast to reach each client.
+
+Start ProjectOn with a service loaded and an item live, then run from the src directory:
+
+    python -m benchmarks.load_test_remote --host 192.168.1.10 --clients 20 --commands 50
+"""
+import argparse
+import math
+import statistics
+import threading
+import time
+
+import requests
+import socketio
+
+
+class SimulatedRemote:
+    """
+    Provides a Socket.IO client that records when each slide change broadcast arrives
+    :param str url: The base url of the server
+    """
+    def __init__(self, url):
+        """
+        :param str url: The base url of the server
+        """
+        self.client = socketio.Client(reconnection=False)
+        self.received = []
+        self.event = threading.Event()
+        self.client.on('change_current_slide', self.slide_changed)
+        self.client.connect(url, headers={'Referer': url + '/remote'}, wait_timeout=10)
+        self.client.emit('subscribe', {'channels': ['remote-state']})
+
+    def slide_changed(self, data):
+        self.received.append(time.perf_counter())
+        self.event.set()
+
+
+def percentile(values, percent):
+    """
+    Method to get the given percentile of a list of values using the nearest-rank method
+    :param list values: The values
+    :param float percent: The percentile, from 0 to 100
+    :return float: The value at that percentile
+    """
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the ProjectOn web remote server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=15171)
+    parser.add_argument('--clients', type=int, default=10, help='number of simulated remote clients')
+    parser.add_argument('--commands', type=int, default=20, help='number of slide commands to send')
+    parser.add_argument('--timeout', type=float, default=5, help='seconds to wait for each broadcast')
+    args = parser.parse_args()
+
+    url = f'http://{args.host}:{args.port}'
+    remotes = []
+    for i in range(args.clients):
+        remotes.append(SimulatedRemote(url))
+    print(f'connected {len(remotes)} clients to {url}')
+
+    latencies = []
+    request_times = []
+    missed = 0
+    for i in range(args.commands):
+        # alternate directions so the test can't run off the end of the slides
+        command = 'slide_forward' if i % 2 == 0 else 'slide_back'
+        for remote in remotes:
+            remote.event.clear()
+            remote.received.clear()
+
+        start = time.perf_counter()
+        requests.post(url + '/remote', data=command)
+        request_times.append((time.perf_counter() - start) * 1000)
+
+        for remote in remotes:
+            if remote.event.wait(args.timeout) and remote.received:
+                latencies.append((remote.received[0] - start) * 1000)
+            else:
+                missed += 1
+        time.sleep(0.1)
+
+    for remote in remotes:
+        remote.client.disconnect()
+
+    print(f'POST /remote: p50 {percentile(request_times, 50):.1f} ms, p95 {percentile(request_times, 95):.1f} ms')
+    if latencies:
+        print(f'broadcast latency over {len(latencies)} deliveries: '
+              f'p50 {percentile(latencies, 50):.1f} ms, '
+              f'p90 {percentile(latencies, 90):.1f} ms, '
+              f'p99 {percentile(latencies, 99):.1f} ms, '
+              f'max {max(latencies):.1f} ms, '
+              f'mean {statistics.mean(latencies):.1f} ms')
+    print(f'missed broadcasts: {missed}')
+
+
+if __name__ == '__main__':
+    main()
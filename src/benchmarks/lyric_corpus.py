@@ -0,0 +1,234 @@
+"""
+A corpus of real (public domain) songs for checking and timing the lyric markup handling in dataHandling.lyricMarkup.
+Each song is given in the simplified lyric markup, and to_qt_html produces the html that a QTextEdit's toHtml gives for
+the same lyrics in the song editor, which is the form songs are saved from. to_openlp_lyrics produces the form that
+songs imported from OpenLP were stored in, with each segment marker inline before its paragraph.
+"""
+import re
+
+SONGS = [
+    {
+        'title': 'Amazing Grace',
+        'verse_order': 'v1 v2 v3 v4',
+        'segments': [
+            ('Verse 1', [
+                'Amazing grace! How <b>sweet</b> the sound',
+                'That saved a wretch like me!',
+                'I once was lost, but now am found;',
+                'Was blind, but now I see.'
+            ]),
+            ('Verse 2', [
+                '’Twas grace that taught my heart to fear,',
+                'And grace my fears relieved;',
+                'How <i>precious</i> did that grace appear',
+                'The hour I first believed.'
+            ]),
+            ('Verse 3', [
+                'Through many dangers, toils and snares,',
+                'I have already come;',
+                '’Tis grace hath brought me safe thus far,',
+                'And grace will lead me home.'
+            ]),
+            ('Verse 4', [
+                'When we’ve been there ten thousand years,',
+                'Bright shining as the sun,',
+                'We’ve no less days to sing God’s praise',
+                'Than when we’d first <u>begun</u>.'
+            ])
+        ]
+    },
+    {
+        'title': 'It Is Well with My Soul',
+        'verse_order': 'v1 c1 v2 c1 v3 c1 v4 c1',
+        'segments': [
+            ('Verse 1', [
+                'When peace like a river attendeth my way,',
+                'When sorrows like sea billows roll;',
+                'Whatever my lot, Thou hast taught me to say,',
+                '&quot;It is well, it is well with my soul.&quot;'
+            ]),
+            ('Chorus 1', [
+                '<i>It is well</i> (it is well)',
+                'With my soul (with my soul)',
+                '<b><i>It is well, it is well with my soul.</i></b>'
+            ]),
+            ('Verse 2', [
+                'Though Satan should buffet, though trials should come,',
+                'Let this blest assurance control,',
+                'That Christ hath regarded my helpless estate,',
+                'And hath shed His own blood for my soul.'
+            ]),
+            ('Verse 3', [
+                'My sin, oh, the bliss of this glorious thought!',
+                'My sin, not in part but the whole,',
+                'Is nailed to the cross, and I bear it no more,',
+                'Praise the Lord, praise the Lord, O my soul!'
+            ]),
+            ('Verse 4', [
+                'And Lord, haste the day when my faith shall be sight,',
+                'The clouds be rolled back as a scroll;',
+                'The trump shall resound, and the Lord shall descend,',
+                'Even so, it is well with my soul.'
+            ])
+        ]
+    },
+    {
+        'title': 'Holy, Holy, Holy',
+        'verse_order': '',
+        'segments': [
+            ('Verse 1', [
+                '<b>Holy, holy, holy!</b> Lord God Almighty!',
+                'Early in the morning our song shall rise to Thee;',
+                'Holy, holy, holy, merciful and mighty!',
+                'God in three Persons, blessed Trinity!'
+            ]),
+            ('Verse 2', [
+                'Holy, holy, holy! All the saints adore Thee,',
+                'Casting down their golden crowns around the glassy sea;',
+                'Cherubim and seraphim falling down before Thee,',
+                'Who wert, and art, and evermore shalt be.'
+            ]),
+            ('Verse 3', [
+                'Holy, holy, holy! though the darkness hide Thee,',
+                'Though the eye of sinful man Thy glory may not see;',
+                'Only Thou art holy; there is none beside Thee,',
+                'Perfect in power, in love &amp; purity.'
+            ])
+        ]
+    },
+    {
+        'title': 'Come Thou Fount of Every Blessing',
+        'verse_order': 'v1 v2 v3 e1',
+        'segments': [
+            ('Verse 1', [
+                'Come, Thou Fount of every blessing,',
+                'Tune my heart to sing Thy grace;',
+                'Streams of mercy, never ceasing,',
+                'Call for songs of loudest praise.',
+                'Teach me some melodious sonnet,',
+                'Sung by flaming tongues above.',
+                'Praise the mount! I’m fixed upon it,',
+                'Mount of Thy redeeming love.'
+            ]),
+            ('Verse 2', [
+                'Here I raise my Ebenezer;',
+                'Hither by Thy help I’m come;',
+                'And I hope, by Thy good pleasure,',
+                'Safely to arrive at home.',
+                'Jesus sought me when a stranger,',
+                'Wandering from the fold of God;',
+                'He, to rescue me from danger,',
+                'Interposed His precious blood.'
+            ]),
+            ('Verse 3', [
+                'O to grace how great a debtor',
+                'Daily I’m constrained to be!',
+                'Let Thy goodness, like a fetter,',
+                'Bind my wandering heart to Thee.',
+                'Prone to wander, Lord, I feel it,',
+                'Prone to leave the God I love;',
+                'Here’s my heart, O take and seal it,',
+                'Seal it for Thy courts above.'
+            ]),
+            ('Ending 1', [
+                '<u>Seal it for Thy courts above.</u>'
+            ])
+        ]
+    },
+    {
+        'title': 'Be Thou My Vision',
+        'verse_order': 'v1 v2 v3 v4',
+        'segments': [
+            ('Verse 1', [
+                'Be Thou my Vision, O Lord of my heart;',
+                'Naught be all else to me, save that Thou art.',
+                'Thou my best Thought, by day or by night,',
+                'Waking or sleeping, Thy presence my light.'
+            ]),
+            ('Verse 2', [
+                'Be Thou my Wisdom, and Thou my true Word;',
+                'I ever with Thee and Thou with me, Lord;',
+                'Thou my great Father, I Thy true son;',
+                'Thou in me dwelling, and I with Thee one.'
+            ]),
+            ('Verse 3', [
+                'Riches I heed not, nor man’s empty praise,',
+                'Thou mine Inheritance, now and always:',
+                'Thou and Thou only, first in my heart,',
+                'High King of Heaven, my Treasure Thou art.'
+            ]),
+            ('Verse 4', [
+                'High King of Heaven, my victory won,',
+                'May I reach Heaven’s joys, O bright Heaven’s Sun!',
+                'Heart of my own heart, whatever befall,',
+                'Still be my Vision, O <b>Ruler of all</b>.'
+            ])
+        ]
+    }
+]
+
+QT_HTML_HEADER = (
+    '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" "http://www.w3.org/TR/REC-html40/strict.dtd">\n'
+    '<html><head><meta name="qrichtext" content="1" /><style type="text/css">\n'
+    'p, li { white-space: pre-wrap; }\n'
+    '</style></head><body style=" font-family:\'Arial\'; font-size:12pt; font-weight:400; font-style:normal;">\n'
+)
+QT_PARAGRAPH = ('<p style=" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; '
+                'text-indent:0px;">')
+QT_EMPTY_PARAGRAPH = ('<p style="-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; '
+                      'margin-right:0px; -qt-block-indent:0; text-indent:0px;"><br /></p>')
+QT_SPANS = {
+    'b': '<span style=" font-weight:700;">',
+    'i': '<span style=" font-style:italic;">',
+    'u': '<span style=" text-decoration: underline;">',
+    'bi': '<span style=" font-weight:700; font-style:italic;">'
+}
+
+
+def to_qt_line(line):
+    """
+    Method to convert a line of simplified markup into the spans a QTextEdit's toHtml uses for its styling
+    :param str line: The line
+    :return str: The line as QTextEdit html
+    """
+    line = line.replace('<b><i>', QT_SPANS['bi']).replace('</i></b>', '</span>')
+    return re.sub('<([biu])>(.*?)</\\1>', lambda match: QT_SPANS[match.group(1)] + match.group(2) + '</span>', line)
+
+
+def to_qt_html(song):
+    """
+    Method to create the html that the song editor's QTextEdit gives for a song's lyrics, with its segment markers
+    colored and a blank line between segments
+    :param dict song: The song, from SONGS
+    :return str: The html
+    """
+    paragraphs = []
+    for marker, lines in song['segments']:
+        paragraphs.append(QT_PARAGRAPH + f'<span style=" color:#006400;">[{marker}]</span></p>')
+        for line in lines:
+            paragraphs.append(QT_PARAGRAPH + to_qt_line(line) + '</p>')
+        paragraphs.append(QT_EMPTY_PARAGRAPH)
+    return QT_HTML_HEADER + '\n'.join(paragraphs[:-1]) + '</body></html>'
+
+
+def to_simplified_lyrics(song):
+    """
+    Method to give a song's lyrics in the simplified lyric markup, with a blank line between segments, as they should be
+    stored after being saved from the song editor
+    :param dict song: The song, from SONGS
+    :return str: The lyrics
+    """
+    return '<br /><br />'.join('<br />'.join([f'[{marker}]'] + lines) for marker, lines in song['segments'])
+
+
+def to_openlp_lyrics(song):
+    """
+    Method to create the lyrics the way songs imported from OpenLP were stored, i.e. [v1]<p>line<br />line</p>[c1]<p>...
+    :param dict song: The song, from SONGS
+    :return str: The lyrics
+    """
+    lyrics = ''
+    for marker, lines in song['segments']:
+        marker_split = marker.split(' ')
+        lyrics += '[' + marker_split[0][0].lower() + marker_split[1] + ']<p>' + '<br />'.join(lines) + '</p>'
+    return lyrics
@@ -20,7 +20,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import threading
 import json
-import logging
 import os.path
 import shutil
 import socket
@@ -33,17 +32,22 @@ from datetime import datetime
 from os.path import exists
 from xml.etree import ElementTree
 
-from PyQt5.QtCore import Qt, QThreadPool, pyqtSignal, QObject, QPoint, QCoreApplication, QtMsgType, \
+from PyQt5.QtCore import Qt, QThreadPool, pyqtSignal, QObject, QCoreApplication, QtMsgType, \
     qInstallMessageHandler, QThread
-from PyQt5.QtGui import QPixmap, QFont, QPainter, QBrush, QColor, QPen, QIcon
-from PyQt5.QtWidgets import QApplication, QLabel, QListWidgetItem, QWidget, QVBoxLayout, QFileDialog, QMessageBox, \
-    QProgressBar, QHBoxLayout, QDialog, QLineEdit, QPushButton, QAction
+from PyQt5.QtGui import QPixmap, QFont, QIcon
+from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout, QFileDialog, QMessageBox, \
+    QProgressBar, QHBoxLayout, QDialog, QLineEdit, QPushButton, QAction, QProgressDialog
 
 from dataHandling.declarations import SLIDE_DATA_DEFAULTS, SQL_COLUMN_TO_DICTIONARY_SONG, SLIDE_DICTIONARY_TO_CUSTOM_SQL_COLUMN, \
-    SLIDE_DICTIONARY_TO_SONG_SQL_COLUMN, DB_STRUCTURE, SLIDE_DATA_DATA_TYPES, SQL_COLUMN_TO_DICTIONARY_CUSTOM
+    SLIDE_DICTIONARY_TO_SONG_SQL_COLUMN, DB_STRUCTURE, SLIDE_DATA_DATA_TYPES, SQL_COLUMN_TO_DICTIONARY_CUSTOM, \
+    STRUCTURED_LYRICS_DB_VERSION
+from dataHandling.lyricMarkup import decode_lyrics, encode_lyrics, is_structured_lyrics
+from dataHandling.serviceFormat import SERVICE_FORMAT_VERSION, serialize_item
 from gui.gui import GUI
 from core.runnables import SaveSettings, ServerCheckTimer
-from gui.widgets.widgets import SimpleSplash, StandardItemWidget
+from core.serviceLoader import ServiceLoader
+from core.songImporter import SongImporter
+from gui.widgets.widgets import SimpleSplash
 from core.webRemote import RemoteServer
 
 
@@ -60,6 +64,8 @@ class ProjectOn(QObject):
     get_scripture = None
     settings = None
     remote_server = None
+    service_loader = None
+    song_importer = None
     splash_widget = None
     status_label = None
     update_status_signal = pyqtSignal(str, str)
@@ -132,6 +138,7 @@ class ProjectOn(QObject):
         self.remote_server = RemoteServer(self.gui)
         self.server_thread = threading.Thread(target=self.remote_server.start_server, daemon=True)
         self.server_thread.start()
+        self.app.aboutToQuit.connect(self.remote_server.stop_server)
 
         self.splash_widget.deleteLater()
         self.settings['last_status_count'] = self.status_update_count
@@ -243,9 +250,10 @@ class ProjectOn(QObject):
         self.splash_widget.raise_()
         self.splash_widget.setFocus()
 
-    def get_all_songs(self):
+    def get_all_songs(self, title=None):
         """
         Retrieves all song data from the ProjectOn database's 'songs' table
+        :param str title: Optional: only retrieve the song with this title
         :return: list of str result
         """
         connection = None
@@ -264,7 +272,10 @@ class ProjectOn(QObject):
             if not updated_table:
                 self.update_table(connection, cursor, 'songs')
 
-            result = cursor.execute('SELECT * FROM songs ORDER BY title').fetchall()
+            if title is None:
+                result = cursor.execute('SELECT * FROM songs ORDER BY title').fetchall()
+            else:
+                result = cursor.execute('SELECT * FROM songs WHERE title=?', (title,)).fetchall()
 
             # there's been enough variation in how data is stored across versions that we're going to
             # convert the stored sql data to the standardized slide data, including making sure the
@@ -282,6 +293,10 @@ class ProjectOn(QObject):
                         data[SQL_COLUMN_TO_DICTIONARY_SONG[i]] = False
                     elif song[i] is not None:
                         data[SQL_COLUMN_TO_DICTIONARY_SONG[i]] = SLIDE_DATA_DATA_TYPES[SQL_COLUMN_TO_DICTIONARY_SONG[i]](song[i])
+
+                # lyrics are stored in a structured form, but kept in memory as simplified markup
+                if data['text']:
+                    data['text'] = decode_lyrics(data['text'])
                 all_songs.append(data)
 
             return all_songs
@@ -302,9 +317,10 @@ class ProjectOn(QObject):
             cursor.execute(f'UPDATE {table} SET {name[0]}={str(name[1])}')
         connection.commit()
 
-    def get_all_custom_slides(self):
+    def get_all_custom_slides(self, title=None):
         """
         Retrieves all custom slide data from the ProjectOn database's 'customSlides' table
+        :param str title: Optional: only retrieve the custom slide with this title
         :return: list of str result
         """
         connection = None
@@ -323,7 +339,10 @@ class ProjectOn(QObject):
             if not updated_table:
                 self.update_table(connection, cursor, 'customSlides')
 
-            result = cursor.execute('SELECT * FROM customSlides ORDER BY title').fetchall()
+            if title is None:
+                result = cursor.execute('SELECT * FROM customSlides ORDER BY title').fetchall()
+            else:
+                result = cursor.execute('SELECT * FROM customSlides WHERE title=?', (title,)).fetchall()
 
             # there's been enough variation in how data is stored across versions that we're going to
             # convert the stored sql data to the standardized slide data, including making sure the
@@ -460,6 +479,10 @@ class ProjectOn(QObject):
         """
         connection = None
         try:
+            data = data.copy()
+            if 'text' in data.keys() and data['text']:
+                data['text'] = encode_lyrics(data['text'])
+
             for key in data.keys():
                 if type(data[key]) == str:
                     data[key] = data[key].replace('"', '""')
@@ -493,6 +516,75 @@ class ProjectOn(QObject):
             if connection:
                 connection.close()
 
+    def save_songs(self, songs):
+        """
+        Inserts a batch of new songs into the database in a single transaction, so that either all of them are saved or
+        none are. Unlike save_song, errors are raised rather than logged, so that this can be called from a runnable.
+        :param list of dict songs: The songs' data
+        :return int: The number of songs saved
+        """
+        columns = list(SLIDE_DICTIONARY_TO_SONG_SQL_COLUMN.keys())
+        rows = []
+        for song_data in songs:
+            row = []
+            for key in columns:
+                value = song_data.get(key, SLIDE_DATA_DEFAULTS.get(key))
+                if key == 'text' and value:
+                    value = encode_lyrics(value)
+                row.append('' if value is None else str(value))
+            rows.append(row)
+
+        sql = (f'INSERT INTO songs ({", ".join(SLIDE_DICTIONARY_TO_SONG_SQL_COLUMN[key] for key in columns)}) '
+               f'VALUES ({", ".join("?" for key in columns)})')
+
+        connection = sqlite3.connect(self.database)
+        try:
+            connection.executemany(sql, rows)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        return len(rows)
+
+    def migrate_song_lyrics(self):
+        """
+        Converts the lyrics of any songs still stored as html or simplified markup, as older versions of the program
+        stored them, to the structured form, all in one transaction. The conversion is recorded in the database's
+        user_version so that it runs only once per database; lyrics that are already structured are never rewritten.
+        Lyrics that haven't been converted can still be read, and a database restored from an older backup has an older
+        user_version, so it is converted the next time the program starts.
+        """
+        connection = None
+        try:
+            connection = sqlite3.connect(self.database)
+            cursor = connection.cursor()
+            if cursor.execute('PRAGMA user_version').fetchone()[0] >= STRUCTURED_LYRICS_DB_VERSION:
+                connection.close()
+                return
+
+            result = cursor.execute('SELECT rowid, lyrics FROM songs').fetchall()
+
+            updates = []
+            for row_id, lyrics in result:
+                if lyrics and not is_structured_lyrics(lyrics):
+                    updates.append((encode_lyrics(lyrics), row_id))
+
+            if len(updates) > 0:
+                cursor.executemany('UPDATE songs SET lyrics = ? WHERE rowid = ?', updates)
+            cursor.execute(f'PRAGMA user_version = {STRUCTURED_LYRICS_DB_VERSION}')
+            connection.commit()
+            if len(updates) > 0:
+                self.error_log(
+                    f'\n{time.ctime(time.time())}:\n    converted the lyrics of {len(updates)} songs to the structured '
+                    f'lyric format')
+            connection.close()
+        except Exception:
+            self.error_log()
+            if connection:
+                connection.close()
+
     def get_song_titles(self):
         """
         Retrieves just the titles of all songs in the database.
@@ -670,6 +762,7 @@ class ProjectOn(QObject):
                 QMessageBox.StandardButton.Ok
             )
             self.gui.media_widget.song_list.clear()
+            self.gui.media_widget.catalog.set_items('song', [])
         except Exception:
             self.error_log()
             if connection:
@@ -698,6 +791,7 @@ class ProjectOn(QObject):
 
         try:
             service_items = {
+                'format_version': SERVICE_FORMAT_VERSION,
                 'global_song_background': self.settings['global_song_background'],
                 'global_bible_background': self.settings['global_bible_background'],
                 'song_font_face': self.settings['song_font_face'],
@@ -726,16 +820,13 @@ class ProjectOn(QObject):
                 'bible_shade_opacity': self.settings['bible_shade_opacity']
             }
 
+            # embed each item's data and pagination so the service can be loaded without parsing it again
+            embed_data = 'embed_service_data' not in self.settings.keys() or self.settings['embed_service_data']
             for i in range(self.gui.oos_widget.oos_list_widget.count()):
                 item_data = self.gui.oos_widget.oos_list_widget.item(i).data(Qt.ItemDataRole.UserRole)
-                service_items[i] = {
-                    'title': item_data['title'],
-                    'type': item_data['type']
-                }
-                if self.gui.oos_widget.oos_list_widget.item(i).data(Qt.ItemDataRole.UserRole)['type'] == 'custom_bible':
-                    service_items[i]['text'] = item_data['parsed_text']
-                elif self.gui.oos_widget.oos_list_widget.item(i).data(Qt.ItemDataRole.UserRole)['type'] == 'custom':
-                    service_items[i]['text'] = item_data['parsed_text']
+                if not item_data:  # a placeholder item in oos will not have any data
+                    continue
+                service_items[i] = serialize_item(self.gui, item_data, embed_data)
 
             dialog_needed = True
             if self.gui.current_file:
@@ -838,295 +929,134 @@ class ProjectOn(QObject):
         else:
             result = [filename]
 
-        # because songs and bible verses are parsed as the order of service is being loaded, and this can take a bit,
-        # provide a splash
+        # the file is read and its items resolved in a runnable, then inserted into the order of service as they arrive;
+        # show the progress and allow the user to cancel a long load
         if len(result[0]) > 0:
-            wait_widget = SimpleSplash(self.gui, 'Loading service...')
-            service_dict = None
-
-            try:
-                with open(result[0], 'r') as file:
-                    service_dict = json.load(file)
-
-                json.dumps(service_dict, indent=4)
-            except Exception:
-                logging.exception('')
-
-            if not service_dict:
-                QMessageBox.information(
-                    self.gui.main_window,
-                    'Error Loading Service',
-                    'Unable to load service. Please check that the file has not moved.',
-                    QMessageBox.StandardButton.Ok
-                )
-                return
-
-            if 'global_song_background' in service_dict.keys():
-                self.settings['global_song_background'] = service_dict['global_song_background']
-            if 'global_bible_background' in service_dict.keys():
-                self.settings['global_bible_background'] = service_dict['global_bible_background']
-
-            slide_types = ['song', 'bible']
-            for slide_type in slide_types:
-                if f'{slide_type}_font_face' in service_dict.keys():
-                    self.settings[f'{slide_type}_font_face'] = service_dict[f'{slide_type}_font_face']
-                if f'{slide_type}_font_size' in service_dict.keys():
-                    self.settings[f'{slide_type}_font_size'] = service_dict[f'{slide_type}_font_size']
-                if f'{slide_type}_font_color' in service_dict.keys():
-                    self.settings[f'{slide_type}_font_color'] = service_dict[f'{slide_type}_font_color']
-                if f'{slide_type}_use_shadow' in service_dict.keys():
-                    self.settings[f'{slide_type}_use_shadow'] = service_dict[f'{slide_type}_use_shadow']
-                if f'{slide_type}_shadow_color' in service_dict.keys():
-                    self.settings[f'{slide_type}_shadow_color'] = service_dict[f'{slide_type}_shadow_color']
-                if f'{slide_type}_shadow_offset' in service_dict.keys():
-                    self.settings[f'{slide_type}_shadow_offset'] = service_dict[f'{slide_type}_shadow_offset']
-                if f'{slide_type}_use_outline' in service_dict.keys():
-                    self.settings[f'{slide_type}_use_outline'] = service_dict[f'{slide_type}_use_outline']
-                if f'{slide_type}_outline_color' in service_dict.keys():
-                    self.settings[f'{slide_type}_outline_color'] = service_dict[f'{slide_type}_outline_color']
-                if f'{slide_type}_outline_width' in service_dict.keys():
-                    self.settings[f'{slide_type}_outline_width'] = service_dict[f'{slide_type}_outline_width']
-                if f'{slide_type}_use_shade' in service_dict.keys():
-                    self.settings[f'{slide_type}_use_shade'] = service_dict[f'{slide_type}_use_shade']
-                if f'{slide_type}_shade_color' in service_dict.keys():
-                    self.settings[f'{slide_type}_shade_color'] = service_dict[f'{slide_type}_shade_color']
-                if f'{slide_type}_shade_opacity' in service_dict.keys():
-                    self.settings[f'{slide_type}_shade_opacity'] = service_dict[f'{slide_type}_shade_opacity']
-
-            self.gui.apply_settings()
-
-            # walk through the items saved in the file and load their QListWidgetItems into the order of service widget
-            self.gui.oos_widget.oos_list_widget.clear()
-            for key in service_dict:
-                if key.isnumeric():
-                    if service_dict[key]['type'] == 'song':
-                        try:
-                            song_item = self.gui.media_widget.song_list.findItems(
-                                service_dict[key]['title'], Qt.MatchFlag.MatchExactly)[0].clone()
-                        except IndexError:
-                            song_item = None
-
-                        if not song_item:
-                            title = service_dict[key]['title']
-                            QMessageBox.information(
-                                None,
-                                'Song Missing',
-                                f'Saved song "{title}" not found in current database. '
-                                f'Inserting placeholder.',
-                                QMessageBox.StandardButton.Ok
-                            )
-                            item = QListWidgetItem('Missing song: ' + service_dict[key]['title'])
-                            self.gui.oos_widget.oos_list_widget.addItem(item)
-                        else:
-                            self.gui.media_widget.add_song_to_service(song_item, from_load_service=True)
-
-                    elif service_dict[key]['type'] == 'bible':
-                        if not self.gui.main.get_scripture:
-                            from dataHandling.getScripture import GetScripture
-                            self.get_scripture = GetScripture(self)
-                        passages = self.get_scripture.get_passage(service_dict[key]['title'])
-
-                        if passages[0] == -1:
-                            QMessageBox.information(
-                                self.gui.main_window,
-                                'Error Loading Scripture',
-                                'Unable to load scripture passage "' + service_dict[key]['title'] + '". "' + passages[1] + '"',
-                                QMessageBox.StandardButton.Ok
-                            )
-                        else:
-                            reference = service_dict[key]['title']
-                            version = self.gui.media_widget.bible_selector_combobox.currentText()
-                            self.gui.add_scripture_item(reference, passages[1], version, scripture_edited=False)
-                    elif service_dict[key]['type'] == 'custom_bible':
-                        try:
-                            reference = service_dict[key]['title']
-                            text = service_dict[key]['text']
-                            passages = []
-                            for item in text:
-                                passage_split = item.split()
-                                passages.append([passage_split[0], ' '.join(passage_split[1:])])
-                            version = self.gui.media_widget.bible_selector_combobox.currentText()
-                            self.gui.add_scripture_item(reference, passages, version, scripture_edited=True)
-                        except KeyError:
-                            pass
-
-                    elif service_dict[key]['type'] == 'custom':
-                        try:
-                            custom_item = self.gui.media_widget.custom_list.findItems(
-                                service_dict[key]['title'], Qt.MatchFlag.MatchExactly)[0]
-                        except IndexError:
-                            custom_item = None
-
-                        if not custom_item:
-                            title = service_dict[key]['title']
-                            QMessageBox.information(
-                                None,
-                                'Custom Slide Missing',
-                                f'Saved custom slide "{title}" not found in current database. '
-                                f'Inserting placeholder.',
-                                QMessageBox.StandardButton.Ok
-                            )
-                            item = QListWidgetItem('Missing custom slide: ' + service_dict[key]['title'])
-                            self.gui.oos_widget.oos_list_widget.addItem(item)
-                        else:
-                            widget_item = QListWidgetItem()
-                            item_data = custom_item.data(Qt.ItemDataRole.UserRole).copy()
-                            widget_item.setData(Qt.ItemDataRole.UserRole, item_data)
-
-                            if item_data['override_global'] == 'False' or not item_data['background']:
-                                pixmap = self.gui.global_bible_background_pixmap
-                                pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio,
-                                                       Qt.TransformationMode.SmoothTransformation)
-                            elif item_data['background'] == 'global_song':
-                                pixmap = self.gui.global_song_background_pixmap
-                                pixmap = pixmap.scaled(
-                                    50, 27, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                            elif item_data['background'] == 'global_bible':
-                                pixmap = self.gui.global_bible_background_pixmap
-                                pixmap = pixmap.scaled(
-                                    50, 27, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                            elif 'rgb(' in item_data['background']:
-                                pixmap = QPixmap(50, 27)
-                                painter = QPainter(pixmap)
-                                brush = QBrush(QColor(item_data['background']))
-                                painter.fillRect(pixmap.rect(), brush)
-                                painter.end()
-                            else:
-                                pixmap = QPixmap(
-                                    self.gui.main.background_dir + '/' + item_data['background'])
-                                pixmap = pixmap.scaled(
-                                    50, 27, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-
-                            widget = StandardItemWidget(
-                                self.gui, item_data['title'], 'Custom', pixmap)
-
-                            widget_item.setSizeHint(widget.sizeHint())
-                            self.gui.oos_widget.oos_list_widget.addItem(widget_item)
-                            self.gui.oos_widget.oos_list_widget.setItemWidget(widget_item, widget)
-
-                    elif service_dict[key]['type'] == 'image':
-                        image_item = None
-                        for i in range(self.gui.media_widget.image_list.count()):
-                            if (self.gui.media_widget.image_list.item(i).data(Qt.ItemDataRole.UserRole)['title']
-                                    == service_dict[key]['title']):
-                                image_item = self.gui.media_widget.image_list.item(i).clone()
-                                break
-
-                        if not image_item:
-                            title = service_dict[key]['title']
-                            QMessageBox.information(
-                                self.gui.main_window,
-                                'Custom Slide Missing',
-                                f'Saved image slide "{title}" not found in current database. '
-                                f'Inserting placeholder.',
-                                QMessageBox.StandardButton.Ok
-                            )
-                            item = QListWidgetItem('Missing image slide: ' + service_dict[key]['title'])
-                            self.gui.oos_widget.oos_list_widget.addItem(item)
-                        else:
-                            pixmap = QPixmap(image_item.data(Qt.ItemDataRole.UserRole)['thumbnail'])
-                            pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio,
-                                                   Qt.TransformationMode.SmoothTransformation)
-
-                            widget = StandardItemWidget(
-                                self.gui, image_item.data(Qt.ItemDataRole.UserRole)['title'], 'Image', pixmap)
-
-                            image_item.setSizeHint(widget.sizeHint())
-                            self.gui.oos_widget.oos_list_widget.addItem(image_item)
-                            self.gui.oos_widget.oos_list_widget.setItemWidget(image_item, widget)
-
-                    elif service_dict[key]['type'] == 'video':
-                        video_item = None
-                        for i in range(self.gui.media_widget.video_list.count()):
-                            if (self.gui.media_widget.video_list.item(i).data(Qt.ItemDataRole.UserRole)['title']
-                                    == service_dict[key]['title']):
-                                video_item = self.gui.media_widget.video_list.item(i).clone()
-
-                        if not video_item:
-                            title = service_dict[key]['title']
-                            QMessageBox.information(
-                                self.gui.main_window,
-                                'Custom Slide Missing',
-                                f'Saved video "{title}" not found in current database. '
-                                f'Inserting placeholder.',
-                                QMessageBox.StandardButton.Ok
-                            )
-                            item = QListWidgetItem('Missing video: ' + service_dict[key]['title'])
-                            self.gui.oos_widget.oos_list_widget.addItem(item)
-                        else:
-                            pixmap = QPixmap(
-                                self.gui.main.video_dir + '/' + video_item.data(Qt.ItemDataRole.UserRole)['file_name'].split('.')[
-                                    0] + '.jpg')
-                            pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio,
-                                                   Qt.TransformationMode.SmoothTransformation)
-
-                            widget = StandardItemWidget(
-                                self.gui, video_item.data(Qt.ItemDataRole.UserRole)['title'], 'Video', pixmap)
-
-                            video_item.setSizeHint(widget.sizeHint())
-                            self.gui.oos_widget.oos_list_widget.addItem(video_item)
-                            self.gui.oos_widget.oos_list_widget.setItemWidget(video_item, widget)
-
-                    elif service_dict[key]['type'] == 'web':
-                        web_item = None
-                        for i in range(self.gui.media_widget.web_list.count()):
-                            if (self.gui.media_widget.web_list.item(i).data(Qt.ItemDataRole.UserRole)['title']
-                                    == service_dict[key]['title']):
-                                web_item = self.gui.media_widget.web_list.item(i)
-
-                        if not web_item:
-                            title = service_dict[key]['title']
-                            QMessageBox.information(
-                                self.gui.main_window,
-                                'Web Slide Missing',
-                                f'Saved web slide "{title}" not found in current database. '
-                                f'Inserting placeholder.',
-                                QMessageBox.StandardButton.Ok
-                            )
-                            item = QListWidgetItem('Missing web slide: ' + service_dict[key]['title'])
-                            self.gui.oos_widget.oos_list_widget.addItem(item)
-                        else:
-                            item = QListWidgetItem()
-                            item.setData(Qt.ItemDataRole.UserRole, web_item.data(Qt.ItemDataRole.UserRole).copy())
-
-                            pixmap = QPixmap(50, 27)
-                            painter = QPainter(pixmap)
-                            brush = QBrush(Qt.GlobalColor.black)
-                            pen = QPen(Qt.GlobalColor.white)
-                            painter.setPen(pen)
-                            painter.setBrush(brush)
-                            painter.fillRect(pixmap.rect(), brush)
-                            painter.setFont(self.gui.bold_font)
-                            painter.drawText(QPoint(2, 20), 'WWW')
-                            painter.end()
-
-                            widget = StandardItemWidget(
-                                self.gui, web_item.data(Qt.ItemDataRole.UserRole)['title'], 'Web', pixmap)
-
-                            item.setSizeHint(widget.sizeHint())
-                            self.gui.oos_widget.oos_list_widget.addItem(item)
-                            self.gui.oos_widget.oos_list_widget.setItemWidget(item, widget)
-
-            self.gui.current_file = result[0]
-
-            self.gui.preview_widget.slide_list.clear()
-            self.gui.live_widget.slide_list.clear()
-
-            # set the last used directory in settings
-            file_dir = os.path.dirname(result[0])
-            file_name = result[0].replace(file_dir, '').replace('/', '').replace('\\', '')
-            self.settings['last_save_dir'] = file_dir
-
-            # add this file to the recently used services menu
-            self.add_to_recently_used(file_dir, file_name)
+            if self.service_loader:
+                self.service_loader.cancel()
+
+            self.service_loader = ServiceLoader(self, result[0])
+            progress_dialog = QProgressDialog('Loading service...', 'Cancel', 0, 0, self.gui.main_window)
+            progress_dialog.setWindowTitle('Loading Service')
+            progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+            progress_dialog.setMinimumDuration(500)
+            progress_dialog.setAutoClose(False)
+            progress_dialog.setAutoReset(False)
+            progress_dialog.canceled.connect(self.service_loader.cancel)
+            self.service_loader.progress_signal.connect(
+                lambda loaded, total: self.update_load_progress(progress_dialog, loaded, total))
+            self.service_loader.finished_signal.connect(lambda cancelled: self.service_load_finished(progress_dialog))
+            self.service_loader.start()
+
+    def update_load_progress(self, progress_dialog, loaded, total):
+        """
+        Method to show the progress of a service file being loaded
+        :param QProgressDialog progress_dialog: The dialog showing the progress
+        :param int loaded: The number of items inserted into the order of service so far
+        :param int total: The number of items in the service file
+        """
+        progress_dialog.setMaximum(total)
+        progress_dialog.setValue(loaded)
+        progress_dialog.setLabelText(f'Loading service... ({loaded} of {total} items)')
 
-            # apply any settings changes
-            self.gui.apply_settings()
+    def service_load_finished(self, progress_dialog):
+        """
+        Method to clean up once a service file has finished loading or loading was cancelled
+        :param QProgressDialog progress_dialog: The dialog that showed the progress
+        """
+        progress_dialog.canceled.disconnect()
+        progress_dialog.close()
+        progress_dialog.deleteLater()
+        self.service_loader = None
 
-            self.gui.changes = False
-            wait_widget.widget.deleteLater()
+    def import_songs(self, sources, parse_function):
+        """
+        Provides a method for importing a batch of songs into the song library, showing the import's progress and
+        allowing the user to cancel it
+        :param list sources: The sources to import, such as file names or database records
+        :param function parse_function: The function that reads a source into song data
+        """
+        if self.song_importer:
+            self.song_importer.cancel()
+
+        song_importer = SongImporter(self, sources, parse_function)
+        self.song_importer = song_importer
+        progress_dialog = QProgressDialog('Importing songs...', 'Cancel', 0, 0, self.gui.main_window)
+        progress_dialog.setWindowTitle('Importing Songs')
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(500)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setAutoReset(False)
+        progress_dialog.canceled.connect(song_importer.cancel)
+        song_importer.progress_signal.connect(
+            lambda parsed, total: self.update_import_progress(progress_dialog, parsed, total))
+        song_importer.finished_signal.connect(
+            lambda cancelled: self.song_import_finished(progress_dialog, song_importer))
+        song_importer.start()
+
+    def update_import_progress(self, progress_dialog, parsed, total):
+        """
+        Method to show the progress of a song import
+        :param QProgressDialog progress_dialog: The dialog showing the progress
+        :param int parsed: The number of songs read so far
+        :param int total: The number of songs being imported
+        """
+        progress_dialog.setMaximum(total)
+        progress_dialog.setValue(parsed)
+        if parsed < total:
+            progress_dialog.setLabelText(f'Importing songs... ({parsed} of {total} songs)')
+        else:
+            progress_dialog.setLabelText('Saving songs...')
 
-            self.gui.main_window.setWindowTitle(f'ProjectOn - {file_name}')
+    def song_import_finished(self, progress_dialog, song_importer):
+        """
+        Method to clean up once a song import has finished or was cancelled
+        :param QProgressDialog progress_dialog: The dialog that showed the progress
+        :param SongImporter song_importer: The importer that finished
+        """
+        progress_dialog.canceled.disconnect()
+        progress_dialog.close()
+        progress_dialog.deleteLater()
+        # an import that was replaced by a newer one can finish after the newer one has started
+        if self.song_importer is song_importer:
+            self.song_importer = None
+
+    def apply_service_settings(self, service_dict):
+        """
+        Method to apply the global backgrounds and font settings saved in a service file
+        :param dict service_dict: The contents of the service file
+        """
+        if 'global_song_background' in service_dict.keys():
+            self.settings['global_song_background'] = service_dict['global_song_background']
+        if 'global_bible_background' in service_dict.keys():
+            self.settings['global_bible_background'] = service_dict['global_bible_background']
+
+        slide_types = ['song', 'bible']
+        for slide_type in slide_types:
+            if f'{slide_type}_font_face' in service_dict.keys():
+                self.settings[f'{slide_type}_font_face'] = service_dict[f'{slide_type}_font_face']
+            if f'{slide_type}_font_size' in service_dict.keys():
+                self.settings[f'{slide_type}_font_size'] = service_dict[f'{slide_type}_font_size']
+            if f'{slide_type}_font_color' in service_dict.keys():
+                self.settings[f'{slide_type}_font_color'] = service_dict[f'{slide_type}_font_color']
+            if f'{slide_type}_use_shadow' in service_dict.keys():
+                self.settings[f'{slide_type}_use_shadow'] = service_dict[f'{slide_type}_use_shadow']
+            if f'{slide_type}_shadow_color' in service_dict.keys():
+                self.settings[f'{slide_type}_shadow_color'] = service_dict[f'{slide_type}_shadow_color']
+            if f'{slide_type}_shadow_offset' in service_dict.keys():
+                self.settings[f'{slide_type}_shadow_offset'] = service_dict[f'{slide_type}_shadow_offset']
+            if f'{slide_type}_use_outline' in service_dict.keys():
+                self.settings[f'{slide_type}_use_outline'] = service_dict[f'{slide_type}_use_outline']
+            if f'{slide_type}_outline_color' in service_dict.keys():
+                self.settings[f'{slide_type}_outline_color'] = service_dict[f'{slide_type}_outline_color']
+            if f'{slide_type}_outline_width' in service_dict.keys():
+                self.settings[f'{slide_type}_outline_width'] = service_dict[f'{slide_type}_outline_width']
+            if f'{slide_type}_use_shade' in service_dict.keys():
+                self.settings[f'{slide_type}_use_shade'] = service_dict[f'{slide_type}_use_shade']
+            if f'{slide_type}_shade_color' in service_dict.keys():
+                self.settings[f'{slide_type}_shade_color'] = service_dict[f'{slide_type}_shade_color']
+            if f'{slide_type}_shade_opacity' in service_dict.keys():
+                self.settings[f'{slide_type}_shade_opacity'] = service_dict[f'{slide_type}_shade_opacity']
 
     def add_to_recently_used(self, directory, file_name):
         """
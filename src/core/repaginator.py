@@ -0,0 +1,147 @@
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+
+from core.runnables import RepaginateItem, WarmPaginationCache
+
+# the types of order of service items whose slides depend on the display's size and the global fonts
+REPAGINATED_TYPES = ('song', 'bible', 'custom_bible')
+
+
+class Repaginator(QObject):
+    """
+    Splits every song and scripture passage in the order of service into slides again after the global fonts or the
+    display have changed. Each item is paginated by its own RepaginateItem runnable so that the items are worked on in
+    parallel, and each item's new slides replace its old ones on the GUI thread as soon as they are ready. The live
+    display is left alone, so it keeps showing the slides it was sent until the item is next sent live. Starting a new
+    job supersedes any job still running.
+    :param ProjectOn main: The current instance of ProjectOn
+    """
+    item_paginated_signal = pyqtSignal(int, object)
+    finished_signal = pyqtSignal()
+
+    def __init__(self, main):
+        """
+        Splits every song and scripture passage in the order of service into slides again after the global fonts or the
+        display have changed.
+        :param ProjectOn main: The current instance of ProjectOn
+        """
+        super().__init__()
+        self.main = main
+        self.gui = main.gui
+        self.generation = 0
+        self.total = 0
+        self.done = 0
+        self.preview_outdated = False
+
+        self.item_paginated_signal.connect(self.item_paginated)
+
+    def is_current(self, generation):
+        """
+        Method for the runnables to check whether the job they belong to has been superseded
+        :param int generation: The job's generation
+        :return bool: Whether the job is still the current one
+        """
+        return generation == self.generation
+
+    def start(self, layout):
+        """
+        Method to start paginating the order of service's items for a new layout, and to warm the pagination cache for
+        the whole song library if the user has chosen to
+        :param PaginationLayout layout: The new layout
+        """
+        self.generation += 1
+        self.done = 0
+        self.preview_outdated = False
+
+        oos_list_widget = self.gui.oos_widget.oos_list_widget
+        items = []
+        for i in range(oos_list_widget.count()):
+            item = oos_list_widget.item(i)
+            item_data = item.data(Qt.ItemDataRole.UserRole)
+            if item_data and item_data.get('type') in REPAGINATED_TYPES:
+                items.append((item, item_data))
+
+        self.total = len(items)
+        for item, item_data in items:
+            self.main.thread_pool.start(
+                RepaginateItem(self, self.generation, item, item_data, layout, self.gui.pagination_cache))
+
+        settings = self.main.settings
+        if 'warm_pagination_cache' in settings.keys() and settings['warm_pagination_cache']:
+            songs = self.gui.media_widget.catalog.get_items('song')
+            self.main.thread_pool.start(
+                WarmPaginationCache(self, self.generation, songs, layout, self.gui.pagination_cache))
+
+        if self.total == 0:
+            self.finish()
+        else:
+            self.gui.oos_widget.show_repagination_progress(0, self.total)
+
+    def item_paginated(self, generation, result):
+        """
+        Method to replace an item's slides with the ones a runnable has made, provided that the job is still current and
+        the item hasn't been removed or changed in the meantime
+        :param int generation: The generation of the job the runnable belongs to
+        :param dict result: The item, its data as it was paginated, and its new slides, or None if pagination failed
+        """
+        if not self.is_current(generation):
+            return
+
+        try:
+            self.apply_result(result)
+        except Exception:
+            self.main.error_log()
+
+        self.done += 1
+        if self.done < self.total:
+            self.gui.oos_widget.show_repagination_progress(self.done, self.total)
+        else:
+            self.finish()
+
+    def apply_result(self, result):
+        """
+        Method to store an item's new slides in its order of service data
+        :param dict result: The item, its data as it was paginated, and its new slides
+        """
+        if not result['parsed_text']:
+            return
+
+        item = result['item']
+        oos_list_widget = self.gui.oos_widget.oos_list_widget
+        try:
+            if oos_list_widget.row(item) == -1:
+                return
+        except RuntimeError:
+            # the item was deleted along with its row
+            return
+
+        item_data = item.data(Qt.ItemDataRole.UserRole)
+        if not item_data:
+            return
+
+        # don't overwrite the slides of an item that was edited while it was being paginated
+        old_data = {key: value for key, value in result['data'].items() if key != 'parsed_text'}
+        current_data = {key: value for key, value in item_data.items() if key != 'parsed_text'}
+        if old_data != current_data:
+            return
+
+        item_data['parsed_text'] = result['parsed_text']
+        item.setData(Qt.ItemDataRole.UserRole, item_data)
+
+        if item is oos_list_widget.currentItem():
+            self.preview_outdated = True
+
+    def finish(self):
+        """
+        Method to wrap up a job: show the preview's item with its new slides, keeping the same slide selected
+        """
+        self.gui.oos_widget.show_repagination_progress(0, 0)
+
+        if self.preview_outdated:
+            self.preview_outdated = False
+            current_row = self.gui.preview_widget.slide_list.currentRow()
+            self.gui.send_to_preview(self.gui.oos_widget.oos_list_widget.currentItem())
+            slide_count = self.gui.preview_widget.slide_list.count()
+            if 0 < current_row < slide_count:
+                self.gui.preview_widget.slide_list.setCurrentRow(current_row)
+
+        self.finished_signal.emit()
@@ -3,15 +3,20 @@ import os
 import shutil
 import sqlite3
 import sys
+import threading
 import time
 from datetime import datetime
 from os.path import exists
 
+import numpy
 import requests
-from PyQt5.QtCore import QRunnable, Qt, QByteArray, QBuffer, QIODevice, QTimer
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import QRunnable, Qt, QByteArray, QBuffer, QIODevice, QTimer, QRect
+from PyQt5.QtGui import QPixmap, QImage
 from PyQt5.QtWidgets import QMessageBox, QFileDialog
 
+from dataHandling.pagination import paginate_song, paginate_scripture_by_verse
+from dataHandling.serviceFormat import get_pagination_layout_fingerprint
+
 
 class CheckFiles(QRunnable):
     """
@@ -208,6 +213,7 @@ class IndexImages(QRunnable):
         Does the work of adding the file name and image blob to the proper table in the program's database.
         :param str file: The file location
         :param str type: 'background' or 'image' file
+        :return bytes: The thumbnail that was stored
         """
         table = ''
         if type == 'background':
@@ -231,12 +237,15 @@ class IndexImages(QRunnable):
         cursor.execute('INSERT INTO ' + table + ' (fileName, image) VALUES("' + file_name + '", ?)', (blob,))
         connection.commit()
         connection.close()
+        return blob
 
 
 class ServerCheckTimer(QTimer):
     """
-    Implements QTimer to periodically check that the three servers are up and running. Emits the GUI's
-    server_alert_signal if the check fails.
+    Implements QTimer to periodically check that the remote server is up and running. Emits the GUI's
+    server_alert_signal if the check fails. The check itself never blocks the GUI thread: each time, it starts a
+    ServerProbe on the thread pool to request /health with a timeout, and checks that the server's heartbeat, which is
+    stamped whenever the server answers a request, is recent enough to show that the probes are being answered.
     Args:
         remote_server (RemoteServer): The current instance of RemoteServer
         gui (GUI): The current instance of GUI
@@ -247,29 +256,65 @@ class ServerCheckTimer(QTimer):
         self.gui = gui
         self.setInterval(5000)
         self.timeout.connect(self.check_server)
+        self.probe_running = False
+        # set by a ServerProbe, which can't stop this timer from its own thread, when the probe fails
+        self.probe_error = None
 
     def check_server(self):
-        if self.remote_server.socketio:
-            remote_response = requests.get('http://' + self.remote_server.gui.main.ip + ':15171/remote')
-            mremote_response = requests.get('http://' + self.remote_server.gui.main.ip + ':15171/mremote')
-            stage_response = requests.get('http://' + self.remote_server.gui.main.ip + ':15171/stage')
-
-            if remote_response and mremote_response and stage_response:
-                if not (remote_response.status_code == 200
-                        and mremote_response.status_code == 200
-                        and stage_response.status_code == 200):
-                    self.keep_checking = False
-                    error_text = (str(time.time()) + ' - '
-                                  + 'server error: remote-' + str(remote_response.status_code)
-                                  + ', mremote-' + str(mremote_response.status_code)
-                                  + ', stage-' + str(stage_response.status_code))
-
-                    self.gui.main.error_log(error_text)
-                    self.gui.server_alert_signal.emit()
-            else:
-                self.keep_checking = False
-                self.gui.main.error_log('unknown server error')
-                self.gui.server_alert_signal.emit()
+        if not self.remote_server.socketio:
+            return
+
+        if self.probe_error:
+            self.server_failed(self.probe_error)
+            return
+
+        # a probe is started every interval, so allowing for one slow check, the last answer should be no older than two
+        # intervals plus a probe's timeout
+        if not self.remote_server.is_healthy(self.interval() / 1000 * 2 + ServerProbe.timeout):
+            self.server_failed(str(time.time()) + ' - server error: heartbeat stopped - '
+                               + str(self.remote_server.get_health()))
+            return
+
+        if not self.probe_running:
+            self.probe_running = True
+            self.gui.main.thread_pool.start(ServerProbe(self))
+
+    def server_failed(self, error_text):
+        """
+        Method to log a failed check and alert the user, stopping further checks so the alert is only shown once
+        :param str error_text: The reason the check failed
+        """
+        self.stop()
+        self.gui.main.error_log(error_text)
+        self.gui.server_alert_signal.emit()
+
+
+class ServerProbe(QRunnable):
+    """
+    Requests the remote server's /health endpoint from the thread pool, with a timeout, to confirm that it is actually
+    answering HTTP requests. Failures are reported back to the ServerCheckTimer to be handled on the GUI thread.
+    :param ServerCheckTimer server_check_timer: The ServerCheckTimer that started this probe
+    """
+    timeout = 3
+
+    def __init__(self, server_check_timer):
+        """
+        :param ServerCheckTimer server_check_timer: The ServerCheckTimer that started this probe
+        """
+        super().__init__()
+        self.server_check_timer = server_check_timer
+
+    def run(self):
+        main = self.server_check_timer.gui.main
+        try:
+            response = requests.get(f'http://{main.ip}:{main.port}/health', timeout=self.timeout)
+            if not response.status_code == 200:
+                self.server_check_timer.probe_error = (
+                    f'{time.time()} - server error: health probe returned {response.status_code}')
+        except requests.exceptions.RequestException as ex:
+            self.server_check_timer.probe_error = f'{time.time()} - server error: health probe failed - {ex}'
+        finally:
+            self.server_check_timer.probe_running = False
 
 
 class SaveSettings(QRunnable):
@@ -330,6 +375,558 @@ class TimedPreviewUpdate(QRunnable):
             time.sleep(sleep_time)
 
 
+class StageFrameEncoder:
+    """
+    Hands grabs of the display widget off to the thread pool to be scaled and JPEG-encoded for the stage view, so that
+    encoding never happens on the GUI thread. Frames are only encoded for the resolutions that subscribed stage clients
+    have asked for, once per resolution. Only one frame is encoded at a time. A frame submitted while another is in
+    flight waits in a single slot, replacing (dropping) any frame that was already waiting.
+    :param ProjectOn main: The current instance of ProjectOn
+    """
+    min_quality = 30
+    max_quality = 85
+    # the frame size the adaptive quality tries to stay under
+    max_frame_bytes = 150000
+    # frames are diffed in square tiles of this size; a multiple of 16 keeps tile edges on JPEG block boundaries
+    tile_size = 128
+    # send a full frame instead of tiles once this fraction of the tiles has changed
+    max_changed_tile_ratio = 0.6
+    # send a full frame at least this often so that out-of-sync clients recover
+    keyframe_interval = 100
+
+    def __init__(self, main):
+        """
+        :param ProjectOn main: The current instance of ProjectOn
+        """
+        self.main = main
+        self.lock = threading.Lock()
+        self.in_flight = False
+        self.waiting_frame = None
+        self.quality = 70
+        self.dropped_frames = 0
+
+        # per stage image width: the last frame sent, as a numpy array of its RGB32 pixel rows, for diffing against
+        # the next frame; the slide info last sent; and the number of tile updates sent since the last full frame
+        self.previous_frames = {}
+        self.previous_slide_info = {}
+        self.frames_since_keyframe = {}
+
+    def has_subscribers(self):
+        """
+        Method to check whether any stage clients are subscribed to images
+        :return bool: Whether there are subscribers
+        """
+        return self.main.remote_server and len(self.main.remote_server.get_stage_image_widths()) > 0
+
+    def submit(self, image, slide_info):
+        """
+        Method to queue a frame of the display for encoding. Does nothing if no stage clients are subscribed to images.
+        :param QImage image: The frame; a QImage rather than a QPixmap as it will be used outside the GUI thread
+        :param str slide_info: The slide info text to be sent along with the frame
+        """
+        if not self.has_subscribers():
+            return
+
+        with self.lock:
+            if self.in_flight:
+                if self.waiting_frame:
+                    self.dropped_frames += 1
+                self.waiting_frame = (image, slide_info)
+                return
+            self.in_flight = True
+        self.main.thread_pool.start(EncodeStageFrame(self, image, slide_info))
+
+    def frame_finished(self):
+        """
+        Method called by EncodeStageFrame when its frame has been sent. Starts encoding the waiting frame, if any.
+        """
+        with self.lock:
+            if not self.waiting_frame:
+                self.in_flight = False
+                return
+            image, slide_info = self.waiting_frame
+            self.waiting_frame = None
+        self.main.thread_pool.start(EncodeStageFrame(self, image, slide_info))
+
+    def adapt_quality(self, encode_time, frame_bytes):
+        """
+        Method to lower the JPEG quality when frames are taking too long to encode or are too large, and raise it again
+        when there is room to spare
+        :param float encode_time: The time, in seconds, the last frame took to scale and encode
+        :param int frame_bytes: The size of the largest version of the last encoded frame
+        """
+        frame_interval = 0.1
+        if 'update_fps' in self.main.settings.keys() and self.main.settings['update_fps'] > 0:
+            frame_interval = 1 / self.main.settings['update_fps']
+
+        if encode_time > frame_interval / 2 or frame_bytes > self.max_frame_bytes:
+            self.quality = max(self.min_quality, self.quality - 5)
+        elif encode_time < frame_interval / 4 and frame_bytes < self.max_frame_bytes / 2:
+            self.quality = min(self.max_quality, self.quality + 5)
+
+
+class EncodeStageFrame(QRunnable):
+    """
+    Scales and JPEG-encodes a single display grab for each resolution requested by the stage clients and sends it to
+    the clients subscribed at that resolution. When possible, only the tiles that changed since the previous frame are
+    sent.
+    :param StageFrameEncoder encoder: The StageFrameEncoder this frame was submitted to
+    :param QImage image: The grab of the display widget
+    :param str slide_info: The slide info text to be sent along with the frame
+    """
+    def __init__(self, encoder, image, slide_info):
+        """
+        :param StageFrameEncoder encoder: The StageFrameEncoder this frame was submitted to
+        :param QImage image: The grab of the display widget
+        :param str slide_info: The slide info text to be sent along with the frame
+        """
+        super().__init__()
+        self.encoder = encoder
+        self.image = image
+        self.slide_info = slide_info
+
+    def run(self):
+        try:
+            start_time = time.perf_counter()
+            largest_frame_bytes = 0
+            for width in self.encoder.main.remote_server.get_stage_image_widths():
+                frame_bytes = self.encode_for_width(width)
+                if frame_bytes and frame_bytes > largest_frame_bytes:
+                    largest_frame_bytes = frame_bytes
+
+            if largest_frame_bytes > 0:
+                self.encoder.adapt_quality(time.perf_counter() - start_time, largest_frame_bytes)
+        except Exception:
+            self.encoder.main.error_log()
+        finally:
+            self.encoder.frame_finished()
+
+    def encode_for_width(self, width):
+        """
+        Method to scale, diff, encode, and send this frame for the stage clients subscribed at the given width
+        :param int width: The width the frame should be scaled down to
+        :return int: The number of bytes sent, or None if encoding failed
+        """
+        start_time = time.perf_counter()
+        image = self.image
+        if image.width() > width:
+            image = image.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+        image = image.convertToFormat(QImage.Format.Format_RGB32)
+
+        pointer = image.constBits()
+        pointer.setsize(image.bytesPerLine() * image.height())
+        frame = numpy.frombuffer(pointer, numpy.uint8).reshape(image.height(), image.bytesPerLine()).copy()
+
+        changed_tiles = self.get_changed_tiles(width, frame, image.width(), image.height())
+        if changed_tiles is None:
+            frame_bytes = self.send_keyframe(width, image)
+        elif len(changed_tiles) > 0 or self.slide_info != self.encoder.previous_slide_info.get(width):
+            frame_bytes = self.send_tiles(width, image, changed_tiles)
+        else:
+            # nothing changed, so there is nothing to send
+            frame_bytes = 0
+
+        if frame_bytes:
+            self.encoder.main.remote_server.metrics.record_encode(time.perf_counter() - start_time, frame_bytes)
+        if frame_bytes is not None:
+            self.encoder.previous_frames[width] = frame
+            self.encoder.previous_slide_info[width] = self.slide_info
+        return frame_bytes
+
+    def get_changed_tiles(self, width, frame, frame_width, frame_height):
+        """
+        Method to compare this frame against the previous one sent at this width, tile by tile
+        :param int width: The stage image width being encoded
+        :param numpy.ndarray frame: The RGB32 pixel rows of this frame
+        :param int frame_width: The frame's width
+        :param int frame_height: The frame's height
+        :return list of QRect: The tiles that changed, or None if a full frame should be sent instead
+        """
+        encoder = self.encoder
+        previous_frame = encoder.previous_frames.get(width)
+        if (previous_frame is None
+                or previous_frame.shape != frame.shape
+                or encoder.frames_since_keyframe.get(width, 0) >= encoder.keyframe_interval
+                or encoder.main.remote_server.stage_keyframe_needed(width)):
+            return None
+
+        changed_tiles = []
+        tile_count = 0
+        for y in range(0, frame_height, encoder.tile_size):
+            for x in range(0, frame_width, encoder.tile_size):
+                tile_count += 1
+                tile_width = min(encoder.tile_size, frame_width - x)
+                tile_height = min(encoder.tile_size, frame_height - y)
+                if not numpy.array_equal(
+                        frame[y:y + tile_height, x * 4:(x + tile_width) * 4],
+                        previous_frame[y:y + tile_height, x * 4:(x + tile_width) * 4]):
+                    changed_tiles.append(QRect(x, y, tile_width, tile_height))
+
+        if len(changed_tiles) > tile_count * encoder.max_changed_tile_ratio:
+            return None
+        return changed_tiles
+
+    def encode_jpeg(self, image):
+        """
+        Method to JPEG-encode an image at the encoder's current quality
+        :param QImage image: The image to encode
+        :return bytes: The JPEG data, or None if encoding failed
+        """
+        array = QByteArray()
+        buffer = QBuffer(array)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        success = image.save(buffer, 'JPEG', self.encoder.quality)
+        buffer.close()
+        if not success:
+            self.encoder.main.error_log('Failed to encode stage frame as JPEG')
+            return None
+        return bytes(array.data())
+
+    def send_keyframe(self, width, image):
+        """
+        Method to send the whole frame to the stage clients subscribed at this width
+        :param int width: The stage image width being encoded
+        :param QImage image: The frame
+        :return int: The number of bytes sent, or None if encoding failed
+        """
+        jpg_bytes = self.encode_jpeg(image)
+        if jpg_bytes is None:
+            return None
+        self.encoder.main.remote_server.update_stage_image(jpg_bytes, self.slide_info, width)
+        self.encoder.frames_since_keyframe[width] = 0
+        return len(jpg_bytes)
+
+    def send_tiles(self, width, image, changed_tiles):
+        """
+        Method to send only the changed tiles of the frame to the stage clients subscribed at this width
+        :param int width: The stage image width being encoded
+        :param QImage image: The frame
+        :param list of QRect changed_tiles: The tiles that changed since the last frame
+        :return int: The number of bytes sent, or None if encoding failed
+        """
+        tiles = []
+        frame_bytes = 0
+        for tile in changed_tiles:
+            jpg_bytes = self.encode_jpeg(image.copy(tile))
+            if jpg_bytes is None:
+                return None
+            tiles.append([tile.x(), tile.y(), jpg_bytes])
+            frame_bytes += len(jpg_bytes)
+        self.encoder.main.remote_server.update_stage_tiles(
+            tiles, self.slide_info, image.width(), image.height(), width)
+        self.encoder.frames_since_keyframe[width] = self.encoder.frames_since_keyframe.get(width, 0) + 1
+        return frame_bytes
+
+
+class SaveOutputFrame(QRunnable):
+    """
+    Saves a frame composed for an offscreen output to a file, replacing the file only once the frame is fully written
+    so that software reading it never sees a partial image
+    :param ProjectOn main: The current instance of ProjectOn
+    :param QImage frame: The frame
+    :param str file_name: The file to save the frame to
+    """
+    def __init__(self, main, frame, file_name):
+        """
+        :param ProjectOn main: The current instance of ProjectOn
+        :param QImage frame: The frame
+        :param str file_name: The file to save the frame to
+        """
+        super().__init__()
+        self.main = main
+        self.frame = frame
+        self.file_name = file_name
+
+    def run(self):
+        try:
+            temp_file_name = self.file_name + '.tmp'
+            if self.frame.save(temp_file_name, 'PNG'):
+                os.replace(temp_file_name, self.file_name)
+            else:
+                self.main.error_log(f'Unable to save output frame to {self.file_name}')
+        except Exception:
+            self.main.error_log()
+
+
+class ReadServiceFile(QRunnable):
+    """
+    Reads a service file, resolves each of its items against a snapshot of the media catalog, looks its scripture
+    passages up in the bible, and paginates its songs and passages, handing the items back to the ServiceLoader one at a
+    time so that they can be inserted into the order of service as they are resolved
+    :param ServiceLoader loader: The ServiceLoader loading the file
+    :param MediaCatalog library: A snapshot of the media library's catalog
+    :param PaginationLayout layout: The display's layout, before the service file's font settings are applied
+    :param PaginationCache pagination_cache: The cache to look songs' slides up in
+    :param GetScripture get_scripture: The default bible, or None if it isn't loaded
+    """
+    def __init__(self, loader, library, layout, pagination_cache, get_scripture):
+        """
+        :param ServiceLoader loader: The ServiceLoader loading the file
+        :param MediaCatalog library: A snapshot of the media library's catalog
+        :param PaginationLayout layout: The display's layout, before the service file's font settings are applied
+        :param PaginationCache pagination_cache: The cache to look songs' slides up in
+        :param GetScripture get_scripture: The default bible, or None if it isn't loaded
+        """
+        super().__init__()
+        self.loader = loader
+        self.library = library
+        self.layout = layout
+        self.pagination_cache = pagination_cache
+        self.get_scripture = get_scripture
+
+    def run(self):
+        try:
+            with open(self.loader.file_name, 'r') as file:
+                service_dict = json.load(file)
+        except Exception as ex:
+            self.loader.main.error_log(f'Unable to read service file {self.loader.file_name}: {ex}')
+            service_dict = None
+
+        self.loader.file_read_signal.emit(service_dict)
+        if not service_dict:
+            return
+
+        # songs are paginated with the font settings that the service file applies
+        for attribute in ('song_font_face', 'song_font_size', 'bible_font_face', 'bible_font_size'):
+            if attribute in service_dict:
+                setattr(self.layout, attribute, service_dict[attribute])
+
+        try:
+            for key in service_dict:
+                if self.loader.cancelled:
+                    break
+                if key.isnumeric():
+                    entry = service_dict[key]
+                    try:
+                        resolved = self.resolve(entry)
+                    except Exception as ex:
+                        self.loader.main.error_log(f'Unable to read item {key} of service file: {ex}')
+                        resolved = {'entry': entry, 'data': None, 'paginated': False}
+                    self.loader.item_resolved_signal.emit(resolved)
+        finally:
+            self.loader.resolve_finished_signal.emit()
+
+    def resolve(self, entry):
+        """
+        Method to find the data for a service file item: from the media library if it's still there, otherwise from the
+        data embedded in the service file, if any. Songs and scripture passages are also split into slides.
+        :param dict entry: The item's entry in the service file
+        :return dict: The entry, the item's data, which is None if it couldn't be found, and whether it was paginated
+        """
+        if entry['type'] in ('bible', 'custom_bible'):
+            item_data = self.resolve_scripture(entry)
+            return {'entry': entry, 'data': item_data, 'paginated': bool(item_data and 'parsed_text' in item_data)}
+
+        if entry['type'] in ('image', 'video'):
+            # images and videos are saved in the service file under their file names
+            library_data = self.library.get_by_file_name(entry['title'])
+            if library_data and library_data['type'] != entry['type']:
+                library_data = None
+        else:
+            library_data = self.library.get(entry['type'], entry['title'])
+
+        item_data = None
+        if library_data:
+            item_data = library_data.copy()
+        elif entry['type'] in ('song', 'custom') and 'data' in entry:
+            item_data = entry['data'].copy()
+
+        paginated = False
+        if entry['type'] == 'song' and item_data:
+            try:
+                item_data['parsed_text'] = paginate_song(item_data, self.layout, self.pagination_cache)
+                paginated = True
+            except Exception as ex:
+                self.loader.main.error_log(f'Unable to paginate song {entry["title"]}: {ex}')
+
+        return {'entry': entry, 'data': item_data, 'paginated': paginated}
+
+    def resolve_scripture(self, entry):
+        """
+        Method to look a scripture passage up in the bible, or read it from the service file if it was edited, and split
+        it into slides. Passages saved along with a pagination that is still valid for the display are left as they
+        are.
+        :param dict entry: The passage's entry in the service file
+        :return dict: The passage's text, its slides, and whether a verse was too long to fit on the display, or the
+            reason it couldn't be found, or None if it has to be resolved on the GUI thread
+        """
+        if ('data' in entry and entry['data'].get('parsed_text')
+                and entry.get('layout_fingerprint') == get_pagination_layout_fingerprint(self.layout, entry['type'])):
+            return None
+
+        if entry['type'] == 'bible':
+            if not self.get_scripture:
+                return None
+            passage = self.get_scripture.find_passage(entry['title'])
+            if passage[0] == -1:
+                return {'error': passage[1]}
+            text = passage[1]
+        elif 'text' in entry:
+            text = []
+            for item in entry['text']:
+                passage_split = item.split()
+                text.append([passage_split[0], ' '.join(passage_split[1:])])
+        else:
+            return None
+
+        parsed_text, parse_failed = paginate_scripture_by_verse(text, self.layout)
+        return {'text': text, 'parsed_text': parsed_text, 'parse_failed': parse_failed}
+
+
+class RepaginateItem(QRunnable):
+    """
+    Splits one order of service item into slides for a new layout, handing the result back to the Repaginator
+    :param Repaginator repaginator: The Repaginator running the job
+    :param int generation: The generation of the job this runnable belongs to
+    :param QListWidgetItem item: The order of service item, which is only handed back and never touched here
+    :param dict item_data: The item's data
+    :param PaginationLayout layout: The new layout
+    :param PaginationCache pagination_cache: The cache to look songs' slides up in
+    """
+    def __init__(self, repaginator, generation, item, item_data, layout, pagination_cache):
+        """
+        :param Repaginator repaginator: The Repaginator running the job
+        :param int generation: The generation of the job this runnable belongs to
+        :param QListWidgetItem item: The order of service item, which is only handed back and never touched here
+        :param dict item_data: The item's data
+        :param PaginationLayout layout: The new layout
+        :param PaginationCache pagination_cache: The cache to look songs' slides up in
+        """
+        super().__init__()
+        self.repaginator = repaginator
+        self.generation = generation
+        self.item = item
+        self.item_data = item_data
+        self.layout = layout
+        self.pagination_cache = pagination_cache
+
+    def run(self):
+        parsed_text = None
+        if self.repaginator.is_current(self.generation):
+            try:
+                if self.item_data['type'] == 'song':
+                    parsed_text = paginate_song(self.item_data, self.layout, self.pagination_cache)
+                else:
+                    parsed_text = paginate_scripture_by_verse(self.item_data['text'], self.layout)[0]
+            except Exception as ex:
+                self.repaginator.main.error_log(f'Unable to paginate {self.item_data["title"]}: {ex}')
+
+        self.repaginator.item_paginated_signal.emit(
+            self.generation, {'item': self.item, 'data': self.item_data, 'parsed_text': parsed_text})
+
+
+class WarmPaginationCache(QRunnable):
+    """
+    Paginates every song in the library for a new layout so that the songs' slides are already cached when they are
+    next added to the order of service
+    :param Repaginator repaginator: The Repaginator running the job
+    :param int generation: The generation of the job this runnable belongs to
+    :param list of dict songs: The library's songs
+    :param PaginationLayout layout: The new layout
+    :param PaginationCache pagination_cache: The cache to store the songs' slides in
+    """
+    def __init__(self, repaginator, generation, songs, layout, pagination_cache):
+        """
+        :param Repaginator repaginator: The Repaginator running the job
+        :param int generation: The generation of the job this runnable belongs to
+        :param list of dict songs: The library's songs
+        :param PaginationLayout layout: The new layout
+        :param PaginationCache pagination_cache: The cache to store the songs' slides in
+        """
+        super().__init__()
+        self.repaginator = repaginator
+        self.generation = generation
+        self.songs = songs
+        self.layout = layout
+        self.pagination_cache = pagination_cache
+
+    def run(self):
+        for song_data in self.songs:
+            if not self.repaginator.is_current(self.generation):
+                break
+            try:
+                paginate_song(song_data, self.layout, self.pagination_cache)
+            except Exception as ex:
+                self.repaginator.main.error_log(f'Unable to paginate song {song_data["title"]}: {ex}')
+
+
+class ParseSongs(QRunnable):
+    """
+    Reads a share of the sources of a song import into song data, handing each song back to the SongImporter
+    :param SongImporter importer: The SongImporter running the import
+    :param list of tuple sources: (index, source) for each source to read
+    :param function parse_function: The function that reads a source into song data
+    """
+    def __init__(self, importer, sources, parse_function):
+        """
+        :param SongImporter importer: The SongImporter running the import
+        :param list of tuple sources: (index, source) for each source to read
+        :param function parse_function: The function that reads a source into song data
+        """
+        super().__init__()
+        self.importer = importer
+        self.sources = sources
+        self.parse_function = parse_function
+
+    def run(self):
+        for index, source in self.sources:
+            if self.importer.cancelled:
+                break
+
+            name = self.get_source_name(source)
+            song_data = None
+            error = None
+            try:
+                song_data = self.parse_function(source)
+                if not song_data['title']:
+                    error = 'no title found'
+            except ValueError as ex:
+                error = str(ex)
+            except Exception as ex:
+                self.importer.main.error_log(f'Unable to import song from {name}: {ex}')
+                error = 'unable to read the song'
+
+            self.importer.song_parsed_signal.emit({'index': index, 'name': name, 'data': song_data, 'error': error})
+
+    def get_source_name(self, source):
+        """
+        Method to name a source in the import summary: a database record's title, or a file's name
+        :param source: The source
+        :return str: The name
+        """
+        if isinstance(source, dict):
+            return source['title']
+        return os.path.basename(str(source))
+
+
+class SaveSongs(QRunnable):
+    """
+    Writes the songs of an import to the database in a single transaction
+    :param SongImporter importer: The SongImporter running the import
+    :param list of dict songs: The songs' data
+    """
+    def __init__(self, importer, songs):
+        """
+        :param SongImporter importer: The SongImporter running the import
+        :param list of dict songs: The songs' data
+        """
+        super().__init__()
+        self.importer = importer
+        self.songs = songs
+
+    def run(self):
+        if self.importer.cancelled:
+            self.importer.songs_saved_signal.emit(0)
+            return
+
+        try:
+            saved = self.importer.main.save_songs(self.songs)
+        except Exception as ex:
+            self.importer.main.error_log(f'Unable to save {len(self.songs)} imported songs: {ex}')
+            saved = None
+        self.importer.songs_saved_signal.emit(saved)
+
+
 class SlideAutoPlay(QRunnable):
     def __init__(self, gui, text, interval):
         """
@@ -0,0 +1,216 @@
+import threading
+
+# the upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+def get_payload_size(data):
+    """
+    Method to estimate the number of bytes a Socket.IO payload will take on the wire
+    :param data: The payload
+    :return int: The size, in bytes
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    if isinstance(data, dict):
+        return sum(get_payload_size(key) + get_payload_size(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return sum(get_payload_size(item) for item in data)
+    return len(str(data))
+
+
+def format_labels(labels):
+    """
+    Method to format a label set for the Prometheus text format
+    :param tuple labels: (name, value) pairs
+    :return str: The labels, including their braces, or an empty string if there are none
+    """
+    if not labels:
+        return ''
+    pairs = []
+    for name, value in labels:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class Histogram:
+    """
+    Provides a cumulative histogram of durations using LATENCY_BUCKETS
+    """
+    __slots__ = ('bucket_counts', 'count', 'sum')
+
+    def __init__(self):
+        """
+        Provides a cumulative histogram of durations using LATENCY_BUCKETS
+        """
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """
+        Method to add a duration to the histogram
+        :param float value: The duration, in seconds
+        """
+        for i in range(len(LATENCY_BUCKETS)):
+            if value <= LATENCY_BUCKETS[i]:
+                self.bucket_counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def mean(self):
+        """
+        Method to get the mean of the observed durations
+        :return float: The mean, in seconds, or 0 if nothing has been observed
+        """
+        if self.count == 0:
+            return 0.0
+        return self.sum / self.count
+
+    def to_prometheus(self, name, labels=()):
+        """
+        Method to format this histogram in the Prometheus text format
+        :param str name: The metric name
+        :param tuple labels: (name, value) pairs identifying this histogram
+        :return list of str: The sample lines
+        """
+        lines = []
+        for i in range(len(LATENCY_BUCKETS)):
+            lines.append(
+                f'{name}_bucket{format_labels(labels + (("le", LATENCY_BUCKETS[i]),))} {self.bucket_counts[i]}')
+        lines.append(f'{name}_bucket{format_labels(labels + (("le", "+Inf"),))} {self.count}')
+        lines.append(f'{name}_sum{format_labels(labels)} {self.sum}')
+        lines.append(f'{name}_count{format_labels(labels)} {self.count}')
+        return lines
+
+
+class ServerMetrics:
+    """
+    Provides thread-safe counters and histograms describing the remote server's work: Socket.IO emits by event, stage
+    frame encoding, and the time taken to handle requests to the remote pages
+    """
+    def __init__(self):
+        """
+        Provides thread-safe counters and histograms describing the remote server's work
+        """
+        self.lock = threading.Lock()
+        # keyed by event name: [emit count, payload bytes, Histogram of emit durations]
+        self.emits = {}
+        self.encode_times = Histogram()
+        self.encoded_frames = 0
+        self.encoded_bytes = 0
+        # keyed by (route, method)
+        self.request_times = {}
+
+    def record_emit(self, event, data, duration):
+        """
+        Method to record a Socket.IO emit
+        :param str event: The event name
+        :param data: The event's payload
+        :param float duration: The time, in seconds, from the emit being requested until it was sent
+        """
+        payload_bytes = get_payload_size(data)
+        with self.lock:
+            if event not in self.emits:
+                self.emits[event] = [0, 0, Histogram()]
+            self.emits[event][0] += 1
+            self.emits[event][1] += payload_bytes
+            self.emits[event][2].observe(duration)
+
+    def record_encode(self, duration, frame_bytes):
+        """
+        Method to record the encoding of a stage frame
+        :param float duration: The time, in seconds, the frame took to scale and encode
+        :param int frame_bytes: The number of bytes the encoded frame took
+        """
+        with self.lock:
+            self.encode_times.observe(duration)
+            self.encoded_frames += 1
+            self.encoded_bytes += frame_bytes
+
+    def record_request(self, route, method, duration):
+        """
+        Method to record the handling of a request
+        :param str route: The route, such as '/remote'
+        :param str method: The HTTP method
+        :param float duration: The time, in seconds, the request took to handle
+        """
+        with self.lock:
+            key = (route, method)
+            if key not in self.request_times:
+                self.request_times[key] = Histogram()
+            self.request_times[key].observe(duration)
+
+    def get_summary(self):
+        """
+        Method to summarize the metrics for display
+        :return dict: 'emits' as {event: (count, bytes, mean seconds)}, 'encode' as (frames, bytes, mean seconds), and
+            'requests' as {(route, method): (count, mean seconds)}
+        """
+        with self.lock:
+            return {
+                'emits': {
+                    event: (values[0], values[1], values[2].mean()) for event, values in self.emits.items()
+                },
+                'encode': (self.encoded_frames, self.encoded_bytes, self.encode_times.mean()),
+                'requests': {
+                    key: (histogram.count, histogram.mean()) for key, histogram in self.request_times.items()
+                }
+            }
+
+    def to_prometheus(self, health, dropped_frames=0):
+        """
+        Method to format the metrics, along with the server's health, in the Prometheus text exposition format
+        :param dict health: The server's health, as returned by RemoteServer.get_health
+        :param int dropped_frames: The number of stage frames dropped because encoding couldn't keep up
+        :return str: The metrics
+        """
+        lines = [
+            '# HELP projecton_up Whether the remote server is running',
+            '# TYPE projecton_up gauge',
+            f'projecton_up {1 if health["running"] else 0}',
+            '# HELP projecton_uptime_seconds How long the remote server has been running',
+            '# TYPE projecton_uptime_seconds gauge',
+            f'projecton_uptime_seconds {health["uptime"]}',
+            '# HELP projecton_connected_clients Connected Socket.IO clients by page',
+            '# TYPE projecton_connected_clients gauge'
+        ]
+        for page, count in health['clients_by_page'].items():
+            lines.append(f'projecton_connected_clients{format_labels((("page", page),))} {count}')
+
+        with self.lock:
+            lines.append('# HELP projecton_emits_total Socket.IO events emitted, by event')
+            lines.append('# TYPE projecton_emits_total counter')
+            for event, values in self.emits.items():
+                lines.append(f'projecton_emits_total{format_labels((("event", event),))} {values[0]}')
+
+            lines.append('# HELP projecton_emit_payload_bytes_total Approximate payload bytes emitted, by event')
+            lines.append('# TYPE projecton_emit_payload_bytes_total counter')
+            for event, values in self.emits.items():
+                lines.append(f'projecton_emit_payload_bytes_total{format_labels((("event", event),))} {values[1]}')
+
+            lines.append('# HELP projecton_emit_duration_seconds Time from an emit being requested until it was sent')
+            lines.append('# TYPE projecton_emit_duration_seconds histogram')
+            for event, values in self.emits.items():
+                lines.extend(values[2].to_prometheus('projecton_emit_duration_seconds', (('event', event),)))
+
+            lines.append('# HELP projecton_stage_encode_seconds Time taken to scale and encode each stage frame')
+            lines.append('# TYPE projecton_stage_encode_seconds histogram')
+            lines.extend(self.encode_times.to_prometheus('projecton_stage_encode_seconds'))
+            lines.append('# HELP projecton_stage_encoded_bytes_total Bytes of encoded stage frames')
+            lines.append('# TYPE projecton_stage_encoded_bytes_total counter')
+            lines.append(f'projecton_stage_encoded_bytes_total {self.encoded_bytes}')
+            lines.append('# HELP projecton_stage_dropped_frames_total Stage frames dropped while another was encoding')
+            lines.append('# TYPE projecton_stage_dropped_frames_total counter')
+            lines.append(f'projecton_stage_dropped_frames_total {dropped_frames}')
+
+            lines.append('# HELP projecton_request_duration_seconds Time taken to handle requests to the remote pages')
+            lines.append('# TYPE projecton_request_duration_seconds histogram')
+            for (route, method), histogram in self.request_times.items():
+                lines.extend(histogram.to_prometheus(
+                    'projecton_request_duration_seconds', (('route', route), ('method', method))))
+
+        return '\n'.join(lines) + '\n'
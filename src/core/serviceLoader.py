@@ -0,0 +1,341 @@
+import os
+from collections import deque
+
+from PyQt5.QtCore import Qt, QObject, QTimer, QPoint, pyqtSignal
+from PyQt5.QtGui import QPixmap, QPainter, QBrush, QColor, QPen
+from PyQt5.QtWidgets import QListWidgetItem, QMessageBox
+
+from core.runnables import ReadServiceFile
+from dataHandling.getScripture import GetScripture
+from dataHandling.pagination import get_pagination_layout
+from dataHandling.parsers import show_scripture_parse_failed
+from dataHandling.serviceFormat import get_saved_pagination
+from gui.widgets.widgets import set_standard_item_data
+
+# the names used for each type of item when reporting items missing from a service file
+MISSING_ITEM_NAMES = {
+    'song': 'Song',
+    'custom': 'Custom slide',
+    'image': 'Image slide',
+    'video': 'Video',
+    'web': 'Web slide',
+    'bible': 'Scripture passage'
+}
+
+
+class ServiceLoader(QObject):
+    """
+    Loads a service file in two stages. A ReadServiceFile runnable reads the file, resolves each of its items against a
+    snapshot of the media library's catalog, looks its scripture passages up, and paginates its songs and passages.
+    Each resolved item is then inserted into the order of service on the GUI thread, one per pass of the event loop, so
+    that the window stays responsive and the order of service fills in as the file loads. Any items that couldn't be
+    found are reported together once loading has finished.
+    :param ProjectOn main: The current instance of ProjectOn
+    :param str file_name: The service file to load
+    """
+    file_read_signal = pyqtSignal(object)
+    item_resolved_signal = pyqtSignal(object)
+    resolve_finished_signal = pyqtSignal()
+    progress_signal = pyqtSignal(int, int)
+    finished_signal = pyqtSignal(bool)
+
+    def __init__(self, main, file_name):
+        """
+        Loads a service file in two stages, reading and resolving its items in a runnable and inserting them into the
+        order of service on the GUI thread.
+        :param ProjectOn main: The current instance of ProjectOn
+        :param str file_name: The service file to load
+        """
+        super().__init__()
+        self.main = main
+        self.gui = main.gui
+        self.file_name = file_name
+        self.cancelled = False
+        self.resolving = True
+        self.inserting = False
+        self.finished = False
+        self.total = 0
+        self.loaded = 0
+        self.pending = deque()
+        self.missing = []
+
+        self.insert_timer = QTimer()
+        self.insert_timer.setInterval(0)
+        self.insert_timer.timeout.connect(self.insert_next_item)
+
+        self.file_read_signal.connect(self.file_read)
+        self.item_resolved_signal.connect(self.item_resolved)
+        self.resolve_finished_signal.connect(self.resolve_finished)
+
+    def start(self):
+        """
+        Method to snapshot the media library's catalog and start reading the service file in the thread pool. The
+        default bible is loaded first, if it hasn't been, so that scripture passages can be looked up in the runnable.
+        """
+        settings = self.main.settings
+        if (not self.main.get_scripture and 'default_bible' in settings.keys()
+                and os.path.exists(settings['default_bible'])):
+            self.main.get_scripture = GetScripture(self.main)
+
+        self.main.thread_pool.start(ReadServiceFile(
+            self,
+            self.gui.media_widget.catalog.snapshot(),
+            get_pagination_layout(self.gui),
+            self.gui.pagination_cache,
+            self.main.get_scripture
+        ))
+
+    def cancel(self):
+        """
+        Method to stop loading the service file. The items that have already been inserted are left in the order of
+        service.
+        """
+        if self.finished:
+            return
+        self.cancelled = True
+        self.pending.clear()
+        self.finish()
+
+    def file_read(self, service_dict):
+        """
+        Method to apply the service file's settings and clear the order of service once the runnable has read the file
+        :param dict service_dict: The contents of the service file, or None if it couldn't be read
+        """
+        if self.cancelled:
+            return
+
+        if not service_dict:
+            QMessageBox.information(
+                self.gui.main_window,
+                'Error Loading Service',
+                'Unable to load service. Please check that the file has not moved.',
+                QMessageBox.StandardButton.Ok
+            )
+            self.cancelled = True
+            self.finish()
+            return
+
+        self.main.apply_service_settings(service_dict)
+        self.gui.apply_settings()
+
+        self.gui.oos_widget.oos_list_widget.clear()
+        self.total = len([key for key in service_dict if key.isnumeric()])
+        self.progress_signal.emit(0, self.total)
+
+    def item_resolved(self, resolved):
+        """
+        Method to queue a resolved item to be inserted into the order of service
+        :param dict resolved: The service file entry, along with the item's data if it could be found
+        """
+        if self.cancelled:
+            return
+        self.pending.append(resolved)
+        if not self.insert_timer.isActive():
+            self.insert_timer.start()
+
+    def resolve_finished(self):
+        """
+        Method to finish loading once the runnable has resolved every item and they have all been inserted
+        """
+        self.resolving = False
+        if not self.insert_timer.isActive() and not self.pending:
+            self.finish()
+
+    def insert_next_item(self):
+        """
+        Method to insert the next resolved item into the order of service
+        """
+        if self.inserting:
+            return
+
+        if not self.pending:
+            self.insert_timer.stop()
+            if not self.resolving:
+                self.finish()
+            return
+
+        self.inserting = True
+        resolved = self.pending.popleft()
+        try:
+            self.insert_item(resolved['entry'], resolved['data'], resolved['paginated'])
+        except Exception:
+            self.main.error_log()
+        self.loaded += 1
+        self.inserting = False
+        self.progress_signal.emit(self.loaded, self.total)
+
+    def insert_item(self, entry, item_data, paginated=False):
+        """
+        Method to add a service file item to the order of service, or a placeholder if it couldn't be found
+        :param dict entry: The item's entry in the service file
+        :param dict item_data: The item's data from the library or the service file, or None if it wasn't found
+        :param bool paginated: Whether the runnable has already split the item into slides
+        """
+        if not isinstance(entry, dict) or 'type' not in entry or 'title' not in entry:
+            self.missing.append('An item that couldn\'t be read')
+            return
+
+        item_type = entry['type']
+        oos_list_widget = self.gui.oos_widget.oos_list_widget
+
+        if item_type in ('song', 'custom', 'image', 'video', 'web') and not item_data:
+            self.missing.append(f'{MISSING_ITEM_NAMES[item_type]}: "{entry["title"]}"')
+            oos_list_widget.addItem(
+                QListWidgetItem(f'Missing {MISSING_ITEM_NAMES[item_type].lower()}: {entry["title"]}'))
+
+        elif item_type == 'song':
+            saved_pagination = get_saved_pagination(self.gui, entry, item_data)
+            if saved_pagination:
+                item_data['parsed_text'] = saved_pagination
+
+            song_item = QListWidgetItem()
+            song_item.setData(Qt.ItemDataRole.UserRole, item_data)
+            self.gui.media_widget.add_song_to_service(
+                song_item, from_load_service=True, keep_parsed_text=bool(saved_pagination) or paginated)
+
+        elif item_type in ('bible', 'custom_bible') and get_saved_pagination(self.gui, entry):
+            # the passage was saved along with its pagination for this display, so neither the bible nor the passage
+            # needs to be parsed again
+            data = entry['data']
+            self.gui.add_scripture_item(
+                data['title'],
+                data['text'],
+                data['author'],
+                scripture_edited=item_type == 'custom_bible',
+                parsed_text=data['parsed_text']
+            )
+
+        elif item_type == 'bible' and item_data and 'error' in item_data:
+            self.missing.append(f'{MISSING_ITEM_NAMES[item_type]}: "{entry["title"]}" ({item_data["error"]})')
+
+        elif item_type in ('bible', 'custom_bible') and item_data:
+            # the runnable has already looked the passage up and split it into slides
+            if item_data['parse_failed']:
+                show_scripture_parse_failed(self.gui)
+            version = self.gui.media_widget.bible_selector_combobox.currentText()
+            self.gui.add_scripture_item(
+                entry['title'],
+                item_data['text'],
+                version,
+                scripture_edited=item_type == 'custom_bible',
+                parsed_text=item_data['parsed_text']
+            )
+
+        elif item_type == 'bible':
+            # there was no default bible to look the passage up in when loading started
+            if not self.main.get_scripture:
+                self.main.get_scripture = GetScripture(self.main)
+            passages = self.main.get_scripture.get_passage(entry['title'])
+
+            if passages[0] == -1:
+                self.missing.append(f'{MISSING_ITEM_NAMES[item_type]}: "{entry["title"]}" ({passages[1]})')
+            else:
+                version = self.gui.media_widget.bible_selector_combobox.currentText()
+                self.gui.add_scripture_item(entry['title'], passages[1], version, scripture_edited=False)
+
+        elif item_type == 'custom_bible':
+            # the runnable couldn't split the passage into slides
+            if 'text' in entry:
+                passages = []
+                for item in entry['text']:
+                    passage_split = item.split()
+                    passages.append([passage_split[0], ' '.join(passage_split[1:])])
+                version = self.gui.media_widget.bible_selector_combobox.currentText()
+                self.gui.add_scripture_item(entry['title'], passages, version, scripture_edited=True)
+
+        elif item_type in ('custom', 'image', 'video', 'web'):
+            widget_item = QListWidgetItem()
+            widget_item.setData(Qt.ItemDataRole.UserRole, item_data)
+            set_standard_item_data(
+                widget_item, item_data['title'], item_type.capitalize(), self.get_thumbnail(item_type, item_data))
+            oos_list_widget.addItem(widget_item)
+
+    def get_thumbnail(self, item_type, item_data):
+        """
+        Method to create the order of service thumbnail for a custom, image, video, or web item
+        :param str item_type: The item's type
+        :param dict item_data: The item's data
+        :return QPixmap: The thumbnail
+        """
+        if item_type == 'custom':
+            if item_data['override_global'] == 'False' or not item_data['background']:
+                pixmap = self.gui.global_bible_background_pixmap
+            elif item_data['background'] == 'global_song':
+                pixmap = self.gui.global_song_background_pixmap
+            elif item_data['background'] == 'global_bible':
+                pixmap = self.gui.global_bible_background_pixmap
+            elif 'rgb(' in item_data['background']:
+                pixmap = QPixmap(50, 27)
+                painter = QPainter(pixmap)
+                brush = QBrush(QColor(item_data['background']))
+                painter.fillRect(pixmap.rect(), brush)
+                painter.end()
+                return pixmap
+            else:
+                pixmap = QPixmap(self.gui.main.background_dir + '/' + item_data['background'])
+
+        elif item_type == 'image':
+            pixmap = QPixmap(item_data['thumbnail'])
+
+        elif item_type == 'video':
+            pixmap = QPixmap(self.gui.main.video_dir + '/' + item_data['file_name'].split('.')[0] + '.jpg')
+
+        else:
+            pixmap = QPixmap(50, 27)
+            painter = QPainter(pixmap)
+            brush = QBrush(Qt.GlobalColor.black)
+            pen = QPen(Qt.GlobalColor.white)
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.fillRect(pixmap.rect(), brush)
+            painter.setFont(self.gui.bold_font)
+            painter.drawText(QPoint(2, 20), 'WWW')
+            painter.end()
+            return pixmap
+
+        return pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+    def finish(self):
+        """
+        Method to wrap up loading: record the file as the current one if it loaded completely, and report any items
+        that couldn't be found
+        """
+        if self.finished:
+            return
+        self.finished = True
+        self.insert_timer.stop()
+
+        if not self.cancelled:
+            self.gui.current_file = self.file_name
+
+            self.gui.preview_widget.slide_list.clear()
+            self.gui.live_widget.slide_list.clear()
+
+            # set the last used directory in settings
+            file_dir = os.path.dirname(self.file_name)
+            file_name = self.file_name.replace(file_dir, '').replace('/', '').replace('\\', '')
+            self.main.settings['last_save_dir'] = file_dir
+
+            # add this file to the recently used services menu
+            self.main.add_to_recently_used(file_dir, file_name)
+
+            # apply any settings changes
+            self.gui.apply_settings()
+
+            self.gui.changes = False
+            self.gui.main_window.setWindowTitle(f'ProjectOn - {file_name}')
+        elif self.loaded > 0:
+            # a partly loaded service shouldn't be saved over the file it came from
+            self.gui.current_file = None
+            self.gui.changes = True
+
+        if self.missing:
+            QMessageBox.information(
+                self.gui.main_window,
+                'Items Missing',
+                'The following items from this service could not be found in the current database. Placeholders '
+                'have been inserted for any missing songs and slides.\n\n' + '\n'.join(self.missing),
+                QMessageBox.StandardButton.Ok
+            )
+
+        self.finished_signal.emit(self.cancelled)
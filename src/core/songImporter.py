@@ -0,0 +1,242 @@
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QWidget, QHBoxLayout, QPushButton, QMessageBox
+
+from core.runnables import ParseSongs, SaveSongs
+
+# the most titles listed for each kind of problem in the summary shown after an import
+MAX_REPORTED_TITLES = 15
+
+
+class SongImporter(QObject):
+    """
+    Imports a batch of songs into the song library in three stages. ParseSongs runnables read the sources into song data
+    in parallel. Once every source has been read, the songs are checked against the titles already in the library, and
+    against each other, on the GUI thread, and a SaveSongs runnable inserts the rest into the database in a single
+    transaction. The song list is then refreshed once, and anything that couldn't be imported is reported together.
+    :param ProjectOn main: The current instance of ProjectOn
+    :param list sources: The sources to import, such as file names or database records
+    :param function parse_function: The function that reads a source into song data, raising an exception if it can't
+    """
+    song_parsed_signal = pyqtSignal(object)
+    songs_saved_signal = pyqtSignal(object)
+    progress_signal = pyqtSignal(int, int)
+    finished_signal = pyqtSignal(bool)
+
+    def __init__(self, main, sources, parse_function):
+        """
+        Imports a batch of songs into the song library, reading them in parallel and saving them in one transaction.
+        :param ProjectOn main: The current instance of ProjectOn
+        :param list sources: The sources to import, such as file names or database records
+        :param function parse_function: The function that reads a source into song data, raising an exception if it
+        can't
+        """
+        super().__init__()
+        self.main = main
+        self.gui = main.gui
+        self.sources = sources
+        self.parse_function = parse_function
+        self.cancelled = False
+        self.saving = False
+        self.finished = False
+        self.total = len(sources)
+        self.results = []
+        self.titles = set()
+        self.pending = []
+        self.duplicates = []
+        self.failures = []
+        self.saved = 0
+        self.save_failed = False
+
+        self.song_parsed_signal.connect(self.song_parsed)
+        self.songs_saved_signal.connect(self.songs_saved)
+
+    def start(self):
+        """
+        Method to read the library's titles once and start reading the sources in the thread pool, split evenly between
+        as many runnables as the pool has threads
+        """
+        if self.total == 0:
+            self.finish()
+            return
+
+        self.titles = set(self.main.get_song_titles())
+        self.progress_signal.emit(0, self.total)
+
+        indexed_sources = list(enumerate(self.sources))
+        runnable_count = max(1, min(self.main.thread_pool.maxThreadCount(), self.total))
+        for i in range(runnable_count):
+            self.main.thread_pool.start(ParseSongs(self, indexed_sources[i::runnable_count], self.parse_function))
+
+    def cancel(self):
+        """
+        Method to stop the import. Nothing is saved unless the songs are already being written to the database, in
+        which case the transaction is left to finish.
+        """
+        if self.finished:
+            return
+        self.cancelled = True
+        if not self.saving:
+            self.finish()
+
+    def song_parsed(self, result):
+        """
+        Method to collect a source that a runnable has read, and to check and save the songs once every source has been
+        read
+        :param dict result: The source's index and name, and its song data, or the reason it couldn't be read
+        """
+        if self.cancelled:
+            return
+
+        self.results.append(result)
+        self.progress_signal.emit(len(self.results), self.total)
+        if len(self.results) < self.total:
+            return
+
+        # check the songs in the order they were given so that the first of any songs sharing a title is the one kept
+        self.results.sort(key=lambda item: item['index'])
+        for result in self.results:
+            if result['error']:
+                self.failures.append(f'{result["name"]} ({result["error"]})')
+                continue
+
+            song_data = result['data']
+            if song_data['title'] in self.titles:
+                if self.total > 1:
+                    self.duplicates.append(song_data['title'])
+                    continue
+
+                new_title = self.ask_for_title(song_data['title'])
+                if not new_title:
+                    continue
+                song_data['title'] = new_title
+
+            self.titles.add(song_data['title'])
+            self.pending.append(song_data)
+        self.results = []
+
+        if len(self.pending) == 0:
+            self.finish()
+        else:
+            self.saving = True
+            self.main.thread_pool.start(SaveSongs(self, self.pending))
+
+    def ask_for_title(self, title):
+        """
+        Method to ask the user for a different title when a single song is imported with a title already in the library
+        :param str title: The song's title
+        :return str: The new title, or None if the user cancelled
+        """
+        while True:
+            suggestion_index = 1
+            while f'{title} ({suggestion_index})' in self.titles:
+                suggestion_index += 1
+
+            dialog = QDialog(self.gui.main_window)
+            dialog.setLayout(QVBoxLayout())
+            dialog.setWindowTitle('Song Title Exists')
+
+            label = QLabel('Unable to save song because this title already exists\n'
+                           'in the database. Please provide a different title:')
+            label.setFont(self.gui.standard_font)
+            dialog.layout().addWidget(label)
+
+            line_edit = QLineEdit(f'{title} ({suggestion_index})', dialog)
+            line_edit.setFont(self.gui.standard_font)
+            dialog.layout().addWidget(line_edit)
+
+            button_widget = QWidget()
+            button_widget.setLayout(QHBoxLayout())
+            dialog.layout().addWidget(button_widget)
+
+            ok_button = QPushButton('OK')
+            ok_button.setFont(self.gui.standard_font)
+            ok_button.clicked.connect(lambda: dialog.done(1))
+            button_widget.layout().addStretch()
+            button_widget.layout().addWidget(ok_button)
+            button_widget.layout().addStretch()
+
+            cancel_button = QPushButton('Cancel')
+            cancel_button.setFont(self.gui.standard_font)
+            cancel_button.clicked.connect(lambda: dialog.done(-1))
+            button_widget.layout().addWidget(cancel_button)
+            button_widget.layout().addStretch()
+
+            if dialog.exec() != 1:
+                return None
+
+            new_title = line_edit.text().strip()
+            if new_title and new_title not in self.titles:
+                return new_title
+            title = new_title or title
+
+    def songs_saved(self, saved):
+        """
+        Method to finish the import once the runnable has written the songs to the database
+        :param int saved: The number of songs saved, or None if saving failed
+        """
+        self.saving = False
+        if saved is None:
+            self.save_failed = True
+        else:
+            self.saved = saved
+        self.finish()
+
+    def finish(self):
+        """
+        Method to wrap up the import: refresh the song list once, select the last song imported, and report anything
+        that couldn't be imported
+        """
+        if self.finished:
+            return
+        self.finished = True
+
+        if self.saved > 0:
+            try:
+                self.gui.media_widget.populate_song_list()
+                song_list = self.gui.media_widget.song_list
+                items = song_list.findItems(self.pending[-1]['title'], Qt.MatchFlag.MatchExactly)
+                if len(items) > 0:
+                    song_list.setCurrentItem(items[0])
+            except Exception:
+                self.main.error_log()
+
+        self.finished_signal.emit(self.cancelled)
+
+        if self.total > 1 or self.duplicates or self.failures or self.save_failed:
+            self.report()
+
+    def report(self):
+        """
+        Method to show the user how many songs were imported, along with any that were skipped or couldn't be read
+        """
+        if self.save_failed:
+            message = 'Unable to save the songs to the database. No songs were imported.'
+        elif self.cancelled and self.saved == 0:
+            message = 'The import was cancelled. No songs were imported.'
+        else:
+            message = f'Imported {self.saved} of {self.total} songs.'
+
+        if self.duplicates:
+            message += ('\n\nSkipped because a song with the same title already exists:\n'
+                        + self.get_title_list(self.duplicates))
+        if self.failures:
+            message += '\n\nUnable to read:\n' + self.get_title_list(self.failures)
+
+        QMessageBox.information(
+            self.gui.main_window,
+            'Import Complete',
+            message,
+            QMessageBox.StandardButton.Ok
+        )
+
+    def get_title_list(self, titles):
+        """
+        Method to list titles in the import summary, shortening long lists
+        :param list of str titles: The titles
+        :return str: The titles, one per line
+        """
+        title_list = '\n'.join(f'    {title}' for title in titles[:MAX_REPORTED_TITLES])
+        if len(titles) > MAX_REPORTED_TITLES:
+            title_list += f'\n    ...and {len(titles) - MAX_REPORTED_TITLES} more'
+        return title_list
+
@@ -0,0 +1,206 @@
+// Shared script for web_remote.html and mobile_web_remote.html. The order of service and slides are rendered here from
+// the JSON state served by /api/state and the changes pushed over Socket.IO, rather than from server-rendered HTML.
+
+var h = document.getElementById('header').clientHeight;
+var bodyHeight = document.body.clientHeight;
+
+document.getElementById('main').style.paddingTop = h + 'px';
+document.getElementById('oos').style.height = (bodyHeight - h - 40) + 'px';
+document.getElementById('slides').style.height = (bodyHeight - h - 40) + 'px';
+
+const oosForm = document.getElementById('oos_form');
+const slideForm = document.getElementById('slide_form');
+
+const state = {
+	version: -1,
+	oos: [],
+	current_oos: -1,
+	slides: [],
+	current_slide: -1
+};
+
+// -- Rendering ----------------------------------------------------------------
+function makeButton(id, title, text, onClick) {
+	const button = document.createElement('button');
+	button.id = id;
+	button.type = 'button';
+
+	const titleSpan = document.createElement('span');
+	titleSpan.className = 'title';
+	titleSpan.textContent = title;
+	button.appendChild(titleSpan);
+
+	if (text !== null) {
+		button.appendChild(document.createElement('br'));
+		const textSpan = document.createElement('span');
+		textSpan.className = 'text';
+		textSpan.style.whiteSpace = 'pre-line';
+		textSpan.textContent = text;
+		button.appendChild(textSpan);
+	}
+
+	button.addEventListener('click', onClick);
+	return button;
+}
+
+function renderOos() {
+	const fragment = document.createDocumentFragment();
+	state.oos.forEach(function(item) {
+		fragment.appendChild(makeButton('oos' + item.index, item.title, null, function(evt) {
+			oosClick(evt, item.index);
+		}));
+		fragment.appendChild(document.createElement('br'));
+	});
+	oosForm.replaceChildren(fragment);
+	markCurrent(oosForm, 'oos', state.current_oos, 'center');
+}
+
+function renderSlides() {
+	const fragment = document.createDocumentFragment();
+	state.slides.forEach(function(slide) {
+		fragment.appendChild(makeButton('slide' + slide.index, slide.title, slide.text, function(evt) {
+			slideClick(evt, slide.index);
+		}));
+		fragment.appendChild(document.createElement('br'));
+	});
+	slideForm.replaceChildren(fragment);
+	markCurrent(slideForm, 'slide', state.current_slide, 'start');
+}
+
+function markCurrent(form, prefix, index, block) {
+	const previous = form.querySelector('.current');
+	if (previous) {
+		previous.classList.remove('current');
+	}
+	const current = document.getElementById(prefix + index);
+	if (current) {
+		current.classList.add('current');
+		current.scrollIntoView({ behavior: 'smooth', block: block });
+	}
+}
+
+// -- State updates ------------------------------------------------------------
+// every payload carries the state version it produced; anything older than what is already shown is ignored
+function isStale(data) {
+	return data.version <= state.version;
+}
+
+async function fetchState() {
+	const response = await fetch('/api/state');
+	if (!response.ok) {
+		return;
+	}
+	const data = await response.json();
+	if (isStale(data)) {
+		return;
+	}
+	Object.assign(state, data);
+	renderOos();
+	renderSlides();
+}
+
+var socket = io();
+socket.on('connect', function() {
+	// only the remote state is needed here, not the stage view's text and frames
+	socket.emit('subscribe', { channels: ['remote-state'] });
+	fetchState();
+});
+
+socket.on('update_oos', function(data) {
+	if (isStale(data)) {
+		return;
+	}
+	state.version = data.version;
+	state.oos = data.oos;
+	state.current_oos = data.current_oos;
+	renderOos();
+});
+
+socket.on('update_slides', function(data) {
+	if (isStale(data)) {
+		return;
+	}
+	state.version = data.version;
+	state.slides = data.slides;
+	state.current_slide = data.current_slide;
+	renderSlides();
+});
+
+socket.on('change_current_oos', function(data) {
+	if (isStale(data)) {
+		return;
+	}
+	state.version = data.version;
+	state.current_oos = data.current_oos;
+	markCurrent(oosForm, 'oos', data.current_oos, 'center');
+});
+
+socket.on('change_current_slide', function(data) {
+	if (isStale(data)) {
+		return;
+	}
+	state.version = data.version;
+	state.current_slide = data.current_slide;
+	markCurrent(slideForm, 'slide', data.current_slide, 'start');
+});
+
+// -- Commands -----------------------------------------------------------------
+// every command carries this page's id and its own sequence number, so that the server can tell when a click on a
+// particular item or slide arrives after a newer command and would send the display back to a stale position
+const clientId = Math.random().toString(36).slice(2) + Date.now().toString(36);
+let commandSeq = 0;
+
+function sendCommand(command, value) {
+	commandSeq++;
+	const body = new URLSearchParams({ command: command, client_id: clientId, seq: commandSeq });
+	if (value !== undefined) {
+		body.append('value', value);
+	}
+	if (socket.id) {
+		body.append('sid', socket.id);
+	}
+	fetch('/remote', { method: 'POST', body: body });
+}
+
+// once the server has carried out a command, make sure the state it produced is shown
+socket.on('command_ack', function(data) {
+	if (data.version > state.version) {
+		fetchState();
+	}
+});
+
+function blackScreen() {
+	sendCommand('black_screen');
+}
+
+function logoScreen() {
+	sendCommand('logo_screen');
+}
+
+function itemBack() {
+	sendCommand('item_back');
+}
+
+function slideBack() {
+	sendCommand('slide_back');
+}
+
+function slideForward() {
+	sendCommand('slide_forward');
+}
+
+function itemForward() {
+	sendCommand('item_forward');
+}
+
+function oosClick(evt, index) {
+	evt.preventDefault();
+	markCurrent(oosForm, 'oos', index, 'center');
+	sendCommand('oos_title', index);
+}
+
+function slideClick(evt, index) {
+	evt.preventDefault();
+	markCurrent(slideForm, 'slide', index, 'start');
+	sendCommand('slide_title', index);
+}
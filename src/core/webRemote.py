@@ -1,159 +1,367 @@
-import re
+import gzip
+import hashlib
+import importlib
+import json
+import mimetypes
 import os
+import queue
+import threading
+import time
+from types import MappingProxyType
 
 import logging
 import engineio.async_drivers.threading
 from http.server import BaseHTTPRequestHandler
 
 from PyQt5.QtCore import Qt
-from flask import Flask, render_template, request
-from flask_socketio import SocketIO
+from flask import Flask, render_template, request, Response, jsonify
+from flask_socketio import SocketIO, join_room, leave_room
+from werkzeug.serving import make_server
+
+from core.serverMetrics import ServerMetrics
+from dataHandling.lyricMarkup import get_plain_text, strip_paragraph_tags
+
+# distinguishes this run's state versions from a previous run's in ETags, as versions restart at 0
+SERVER_INSTANCE = str(int(time.time()))
+
+# event-loop server backends that can be chosen with the 'remote_server_backend' setting instead of 'threading'. They
+# aren't in requirements.txt, so the threading server is used if the chosen one can't be imported.
+ASYNC_BACKENDS = ('eventlet', 'gevent')
+
+# the longest, in seconds, emit_loop waits for a queued event at a time
+EMIT_WAIT_TIMEOUT = 1
+
+# the Socket.IO rooms clients can subscribe to. Stage clients that want the mirrored display join the 'stage-image-'
+# room for the smallest of STAGE_IMAGE_WIDTHS that covers their screen, so each frame is only encoded once per width.
+REMOTE_STATE_ROOM = 'remote-state'
+STAGE_TEXT_ROOM = 'stage-text'
+STAGE_IMAGE_ROOM = 'stage-image'
+STAGE_IMAGE_WIDTHS = (640, 960, 1280, 1920, 2560, 3840)
+
+
+class RemoteStateSnapshot:
+    """
+    Provides an immutable, versioned copy of the state shown by the web remotes. The GUI thread publishes a new
+    snapshot whenever that state changes, and the server threads only ever read the current snapshot, never the Qt
+    widgets. The JSON sent to clients is serialized once, when the snapshot is created.
+    """
+    __slots__ = ('version', 'oos', 'current_oos', 'slides', 'current_slide', 'json', 'etag')
+
+    def __init__(self, version=0, oos=(), current_oos=-1, slides=(), current_slide=-1):
+        """
+        :param int version: The state version
+        :param iterable of dict oos: {'index', 'title', 'type'} for each order of service item
+        :param int current_oos: The row of the live order of service item
+        :param iterable of dict slides: {'index', 'title', 'text'} for each live slide
+        :param int current_slide: The row of the live slide
+        """
+        setter = super().__setattr__
+        setter('version', version)
+        setter('oos', tuple(MappingProxyType(dict(item)) for item in oos))
+        setter('current_oos', current_oos)
+        setter('slides', tuple(MappingProxyType(dict(slide)) for slide in slides))
+        setter('current_slide', current_slide)
+        setter('json', json.dumps(self.to_dict()).encode('utf-8'))
+        setter('etag', f'{SERVER_INSTANCE}-{version}')
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RemoteStateSnapshot is immutable')
+
+    def replace(self, **changes):
+        """
+        Method to create the next version of this snapshot with the given parts of the state changed
+        :return RemoteStateSnapshot: The new snapshot
+        """
+        state = {
+            'oos': self.oos,
+            'current_oos': self.current_oos,
+            'slides': self.slides,
+            'current_slide': self.current_slide
+        }
+        state.update(changes)
+        return RemoteStateSnapshot(self.version + 1, **state)
+
+    def to_dict(self):
+        """
+        Method to convert this snapshot to plain, JSON-serializable data
+        :return dict: The state
+        """
+        return {
+            'version': self.version,
+            'oos': [dict(item) for item in self.oos],
+            'current_oos': self.current_oos,
+            'slides': [dict(slide) for slide in self.slides],
+            'current_slide': self.current_slide
+        }
+
+
+# the pages served by the remote server, rendered once when it starts as none of them depend on the current state
+PAGE_TEMPLATES = {
+    'index': 'index.html',
+    'remote': 'web_remote.html',
+    'mremote': 'mobile_web_remote.html',
+    'stage': 'stage_view.html'
+}
+
+# how long browsers may keep content-hashed assets without revalidating; the url changes whenever the content does
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+
+class StaticAsset:
+    """
+    Provides a file served by the remote server, held in memory along with its content hash and, where it makes the
+    file smaller, gzip and brotli compressed copies made once when the server starts
+    """
+    __slots__ = ('data', 'gzip', 'brotli', 'mimetype', 'content_hash')
+
+    def __init__(self, data, mimetype):
+        """
+        Provides a file served by the remote server, held in memory along with its content hash and compressed copies
+        :param bytes data: The file's content
+        :param str mimetype: The file's mimetype
+        """
+        self.data = data
+        self.mimetype = mimetype
+        self.content_hash = hashlib.sha256(data).hexdigest()[:16]
+
+        self.gzip = gzip.compress(data, 9)
+        if len(self.gzip) >= len(data):
+            self.gzip = None
+
+        self.brotli = None
+        if importlib.util.find_spec('brotli'):
+            import brotli
+            self.brotli = brotli.compress(data)
+            if len(self.brotli) >= len(data):
+                self.brotli = None
+
+    def make_response(self, cache_control):
+        """
+        Method to create a response for the current request, using the smallest encoding the client accepts and
+        answering with a 304 if the client's copy is current
+        :param str cache_control: The Cache-Control header to send
+        :return Response: The response
+        """
+        accept_encoding = request.headers.get('Accept-Encoding', '')
+        if self.brotli and 'br' in accept_encoding:
+            response = Response(self.brotli, mimetype=self.mimetype)
+            response.headers['Content-Encoding'] = 'br'
+            response.set_etag(self.content_hash + '-br')
+        elif self.gzip and 'gzip' in accept_encoding:
+            response = Response(self.gzip, mimetype=self.mimetype)
+            response.headers['Content-Encoding'] = 'gzip'
+            response.set_etag(self.content_hash + '-gz')
+        else:
+            response = Response(self.data, mimetype=self.mimetype)
+            response.set_etag(self.content_hash)
+
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = cache_control
+        return response.make_conditional(request)
+
+
+# the commands the web remotes can send. Navigation commands can be coalesced with each other; the rest can't.
+NAVIGATION_COMMANDS = ('oos_title', 'slide_title', 'item_back', 'item_forward', 'slide_back', 'slide_forward')
+SCREEN_COMMANDS = ('black_screen', 'logo_screen')
+
+
+class RemoteCommand:
+    """
+    Provides a single command received from a web remote
+    """
+    __slots__ = ('seq', 'name', 'value', 'client_id', 'client_seq', 'sid')
+
+    def __init__(self, seq, name, value=None, client_id=None, client_seq=None, sid=None):
+        """
+        Provides a single command received from a web remote
+        :param int seq: The order in which the server received the command
+        :param str name: One of NAVIGATION_COMMANDS or SCREEN_COMMANDS
+        :param int value: The row for 'oos_title' and 'slide_title' commands
+        :param str client_id: The id the sending remote page generated for itself
+        :param int client_seq: The sending remote page's own number for the command
+        :param str sid: The Socket.IO id of the sending remote page, to send the acknowledgement to
+        """
+        self.seq = seq
+        self.name = name
+        self.value = value
+        self.client_id = client_id
+        self.client_seq = client_seq
+        self.sid = sid
+
+
+class RemoteCommandQueue:
+    """
+    Provides a thread-safe queue of web remote commands between the server threads and the GUI thread. The GUI thread
+    takes every waiting command at once, so that a burst of commands received while it was busy rendering can be
+    carried out as one move.
+    """
+    def __init__(self):
+        """
+        Provides a thread-safe queue of web remote commands between the server threads and the GUI thread
+        """
+        self.lock = threading.Lock()
+        self.commands = []
+        self.next_seq = 1
+        # the newest client_seq received from each remote page, keyed by its client_id
+        self.client_seqs = {}
+
+    def submit(self, name, value=None, client_id=None, client_seq=None, sid=None):
+        """
+        Method to queue a command. Safe to call from any thread.
+        :return tuple: The queued RemoteCommand, or None if it arrived after a newer command from the same remote page
+            and would have moved to a stale position, and whether the queue was empty before this command
+        """
+        with self.lock:
+            command = RemoteCommand(self.next_seq, name, value, client_id, client_seq, sid)
+            self.next_seq += 1
+
+            if client_id is not None and client_seq is not None:
+                newest_seq = self.client_seqs.get(client_id, -1)
+                if client_seq < newest_seq and name in ('oos_title', 'slide_title'):
+                    # an absolute move overtaken by a newer command from the same page would undo that command
+                    return None, False
+                self.client_seqs[client_id] = max(newest_seq, client_seq)
+
+            was_empty = len(self.commands) == 0
+            self.commands.append(command)
+            return command, was_empty
+
+    def take_all(self):
+        """
+        Method to remove and return every waiting command, in the order they were received
+        :return list of RemoteCommand: The commands
+        """
+        with self.lock:
+            commands = self.commands
+            self.commands = []
+            return commands
 
 
 class RemoteServer:
     app = None
     socketio = None
+    backend = 'threading'
+    wsgi_server = None
+    max_clients = 50
 
     def __init__(self, gui):
         super().__init__()
         self.gui = gui
         self.html = None
+        self.running = False
+        self.start_time = None
+        # updated whenever the server answers an HTTP request, which ServerCheckTimer's probe makes regularly, to show
+        # that the serving thread/event loop is still responsive
+        self.last_heartbeat = None
+        # how long, in seconds, the most recent emit took from being requested until it was sent
+        self.last_broadcast_latency = None
+        # the page ('remote', 'mremote', 'stage', or 'other') of each connected Socket.IO client, keyed by its socket id
+        self.clients = {}
+        # emits made from outside the server's event loop when running an async backend, drained by emit_loop
+        self.emit_queue = queue.Queue()
+        # the latest state published by the GUI thread; replaced, never modified, so server threads can read it freely
+        self.state_snapshot = RemoteStateSnapshot()
+        # the rooms each connected Socket.IO client has subscribed to, keyed by its socket id
+        self.subscriptions = {}
+        # the stage image width each client subscribed to the mirrored display receives, keyed by its socket id
+        self.stage_widths = {}
+        # the stage image widths whose clients need a full frame before they can composite tile updates
+        self.stage_keyframe_widths = set()
+        # commands from the web remotes waiting to be carried out by the GUI thread
+        self.command_queue = RemoteCommandQueue()
+        # the files in core/static and the pre-rendered pages, keyed by file name and page name
+        self.assets = {}
+        self.pages = {}
+        # counts and timings of emits, stage frame encoding, and remote page requests, served at /metrics
+        self.metrics = ServerMetrics()
 
     def start_server(self):
+        settings = self.gui.main.settings
+        if 'remote_server_backend' in settings.keys() and settings['remote_server_backend'] in ASYNC_BACKENDS:
+            try:
+                importlib.import_module(settings['remote_server_backend'])
+                self.backend = settings['remote_server_backend']
+            except Exception as ex:
+                self.gui.main.error_log(
+                    f'Unable to use the {settings["remote_server_backend"]} server ({ex}); using the threading server '
+                    f'instead')
+        if 'remote_max_clients' in settings.keys():
+            self.max_clients = int(settings['remote_max_clients'])
+
         try:
             self.app = Flask(
                 __name__,
                 template_folder=os.path.abspath('.') + '/resources',
                 static_folder=os.path.abspath('.') + '/core/static'
             )
-            self.socketio = SocketIO(self.app, async_mode='threading')
+            self.socketio = SocketIO(self.app, async_mode=self.backend)
+            self.app.jinja_env.globals['asset_url'] = self.get_asset_url
+        except Exception:
+            self.gui.main.error_log()
+
+        # kept apart from setting up Flask so the server still starts, and serves what it can, if a file can't be read
+        try:
+            self.load_assets()
         except Exception:
             self.gui.main.error_log()
 
         @self.app.route('/', methods=['GET'])
         def root():
-            return render_template('index.html')
+            return self.get_page_response('index')
 
         @self.app.route('/remote', methods=['GET', 'POST'])
         def remote():
-            if self.gui.block_remote_input:
-                oos, slides = self.get_all_gui_data()
-                return render_template(
-                    'web_remote.html',
-                    oos=oos,
-                    slides=slides
-                )
-
-            oos = ''
-            slides = ''
-            if request.method == "POST":
-                if 'oos_title' in request.form:
-                    try:
-                        num = request.form.get('oos_title')
-                        if num.isnumeric():
-                            self.gui.live_from_remote_signal.emit(int(num))
-                            return '', 200
-                    except Exception:
-                        self.gui.main.error_log()
-
-                elif 'slide_title' in request.form:
-                    try:
-                        num = request.form.get("slide_title")
-                        if num.isnumeric():
-                            self.gui.live_slide_from_remote_signal.emit(int(num))
-                            return '', 200
-                    except Exception:
-                        self.gui.main.error_log()
-
-                elif b'black_screen' in request.data:
-                    self.gui.display_black_screen_signal.emit()
-                    return '', 200
-
-                elif b'logo_screen' in request.data:
-                    self.gui.display_logo_screen_signal.emit()
-
-                    
-                elif b'item_back' in request.data:
-                    self.slide_button('item_back')
-                
-                elif b'slide_back' in request.data:
-                    self.slide_button('slide_back')
-                
-                elif b'slide_forward' in request.data:
-                    self.slide_button('slide_forward')
-                
-                elif b'item_forward' in request.data:
-                    self.slide_button('item_forward')
-
-            if request.method == "GET":
-                oos, slides = self.get_all_gui_data()
-
-            return render_template(
-                'web_remote.html',
-                oos=oos,
-                slides=slides
-            )
+            start_time = time.perf_counter()
+            if request.method == 'POST':
+                response = self.handle_remote_post()
+            else:
+                response = self.get_page_response('remote')
+            self.metrics.record_request('/remote', request.method, time.perf_counter() - start_time)
+            return response
 
         @self.app.route('/mremote', methods=['GET', 'POST'])
         def mremote():
-            if self.gui.block_remote_input:
-                oos, slides = self.get_all_gui_data()
-                return render_template(
-                    'mobile_web_remote.html',
-                    oos=oos,
-                    slides=slides
-                )
-
-            oos = ''
-            slides = ''
-            if request.method == "POST":
-                if 'oos_title' in request.form:
-                    try:
-                        num = request.form.get("oos_title")
-                        self.gui.live_from_remote_signal.emit(int(num))
-                    except Exception as ex:
-                        self.gui.main.error_log()
-
-                elif 'slide_title' in request.form:
-                    try:
-                        num = request.form.get("slide_title")
-                        self.gui.live_slide_from_remote_signal.emit(int(num))
-                    except Exception:
-                        self.gui.main.error_log()
-
-                elif b'black_screen' in request.data:
-                    self.gui.display_black_screen_signal.emit()
-
-                elif b'logo_screen' in request.data:
-                    self.gui.display_logo_screen_signal.emit()
-
-                elif b'item_back' in request.data:
-                    self.slide_button('item_back')
-
-                elif b'slide_back' in request.data:
-                    self.slide_button('slide_back')
-
-                elif b'slide_forward' in request.data:
-                    self.slide_button('slide_forward')
-
-                elif b'item_forward' in request.data:
-                    self.slide_button('item_forward')
-
-            if request.method == "GET":
-                oos, slides = self.get_all_gui_data()
-
-            return render_template(
-                'mobile_web_remote.html',
-                oos=oos,
-                slides=slides
+            start_time = time.perf_counter()
+            if request.method == 'POST':
+                response = self.handle_remote_post()
+            else:
+                response = self.get_page_response('mremote')
+            self.metrics.record_request('/mremote', request.method, time.perf_counter() - start_time)
+            return response
+
+        @self.app.route('/assets/<content_hash>/<filename>', methods=['GET'])
+        def assets(content_hash, filename):
+            asset = self.assets.get(filename)
+            if not asset:
+                return '', 404
+            if content_hash != asset.content_hash:
+                # an old url from before the file changed; serve the current file, but don't let it be cached as such
+                return asset.make_response('no-cache')
+            return asset.make_response(f'public, max-age={ASSET_MAX_AGE}, immutable')
+
+        @self.app.route('/api/state', methods=['GET'])
+        def api_state():
+            snapshot = self.state_snapshot
+            response = Response(snapshot.json, mimetype='application/json')
+            response.set_etag(snapshot.etag)
+            # let clients cache the state, but make them revalidate it so unchanged state costs only a 304
+            response.headers['Cache-Control'] = 'no-cache'
+            return response.make_conditional(request)
+
+        @self.app.route('/health', methods=['GET'])
+        def health():
+            return jsonify(self.get_health())
+
+        @self.app.route('/metrics', methods=['GET'])
+        def metrics():
+            return Response(
+                self.metrics.to_prometheus(self.get_health(), self.gui.stage_frame_encoder.dropped_frames),
+                mimetype='text/plain; version=0.0.4'
             )
 
         @self.app.route('/stage', methods=['POST', 'GET'])
-        def stage(text=None):
-            return render_template(
-                'stage_view.html',
-                text=text
-            )
+        def stage():
+            return self.get_page_response('stage')
 
         @self.app.route('/shutdown', methods=['GET'])
         def shutdown():
@@ -162,83 +370,523 @@ class RemoteServer:
             self.gui.main.error_log('Shutting down the server via request is no '
                   'longer necessary as the server is running on a daemonized thread.')
 
+        @self.socketio.on('subscribe')
+        def subscribe(data):
+            try:
+                self.subscribe(request.sid, data['channels'], data.get('resolution'))
+            except (TypeError, ValueError, KeyError, AttributeError):
+                pass
+
+        @self.socketio.on('connect')
+        def connect(*args):
+            # refuse new clients once the limit is reached so existing ones stay responsive
+            if len(self.clients) >= self.max_clients:
+                return False
+            page = 'other'
+            if request.referrer:
+                page = request.referrer.split('?')[0].rstrip('/').split('/')[-1]
+                if page not in ('remote', 'mremote', 'stage'):
+                    page = 'other'
+            self.clients[request.sid] = page
+
+        @self.socketio.on('disconnect')
+        def disconnect(*args):
+            self.clients.pop(request.sid, None)
+            self.subscriptions.pop(request.sid, None)
+            self.stage_widths.pop(request.sid, None)
+
+        @self.app.before_request
+        def stamp_heartbeat():
+            self.last_heartbeat = time.monotonic()
+
+        self.running = True
+        self.start_time = time.monotonic()
+        # count the start as the first heartbeat so the server isn't reported stopped before its first request
+        self.last_heartbeat = self.start_time
         try:
-            self.socketio.run(
-                self.app,
-                host=self.gui.main.ip,
-                port=self.gui.main.port,
-                debug=False,
-                use_reloader=False,
-                allow_unsafe_werkzeug=True
-            )
+            if self.backend == 'threading':
+                # serve with Werkzeug's threaded server directly, rather than through socketio.run, so that it can be
+                # shut down cleanly from stop_server. It's the server that Flask-SocketIO's threading mode supports
+                # websockets with, through simple-websocket; the async backends are for larger numbers of clients.
+                self.wsgi_server = make_server(self.gui.main.ip, self.gui.main.port, self.app, threaded=True)
+                self.wsgi_server.serve_forever()
+            else:
+                self.socketio.start_background_task(self.emit_loop)
+                if self.backend == 'eventlet':
+                    self.socketio.run(
+                        self.app,
+                        host=self.gui.main.ip,
+                        port=self.gui.main.port,
+                        log_output=False,
+                        max_size=self.max_clients * 2
+                    )
+                else:
+                    from gevent.pool import Pool
+                    self.socketio.run(
+                        self.app,
+                        host=self.gui.main.ip,
+                        port=self.gui.main.port,
+                        log_output=False,
+                        spawn=Pool(self.max_clients * 2)
+                    )
         except Exception:
             self.gui.main.error_log()
+        self.running = False
+
+    def load_assets(self):
+        """
+        Method to read the files in core/static into memory, compressing them, and to render each page's template once
+        """
+        for filename in os.listdir(self.app.static_folder):
+            path = os.path.join(self.app.static_folder, filename)
+            if not os.path.isfile(path):
+                continue
+            with open(path, 'rb') as file:
+                data = file.read()
+            mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            self.assets[filename] = StaticAsset(data, mimetype)
+
+        with self.app.test_request_context():
+            for page, template in PAGE_TEMPLATES.items():
+                # a page that can't be rendered is left out, and served as unavailable, without losing the others
+                try:
+                    self.pages[page] = StaticAsset(render_template(template).encode('utf-8'), 'text/html')
+                except Exception:
+                    self.gui.main.error_log()
+
+    def get_page_response(self, page):
+        """
+        Method to serve a pre-rendered page
+        :param str page: The page's name, from PAGE_TEMPLATES
+        :return Response: The page, or a 503 response if it couldn't be rendered when the server started
+        """
+        if page not in self.pages:
+            return Response('This page is unavailable. Please check the ProjectOn log.', status=503,
+                            mimetype='text/plain')
+        return self.pages[page].make_response('no-cache')
+
+    def get_asset_url(self, filename):
+        """
+        Method to get the content-hashed url of a file in core/static, for use in templates
+        :param str filename: The name of the file
+        :return str: The url
+        """
+        asset = self.assets.get(filename)
+        if not asset:
+            return f'/static/{filename}'
+        return f'/assets/{asset.content_hash}/{filename}'
+
+    def subscribe(self, sid, channels, resolution=None):
+        """
+        Method to move a client into the rooms for the channels it wants updates from, leaving any it no longer wants.
+        Must be called from within a Socket.IO event handler for that client.
+        :param str sid: The client's socket id
+        :param list of str channels: Any of 'remote-state', 'stage-text', and 'stage-image'
+        :param list resolution: [width, height] of the client's screen, used to choose its stage image width
+        """
+        rooms = set()
+        for channel in channels:
+            if channel in (REMOTE_STATE_ROOM, STAGE_TEXT_ROOM):
+                rooms.add(channel)
+            elif channel == STAGE_IMAGE_ROOM:
+                width = self.get_stage_image_width(int(resolution[0]) if resolution else STAGE_IMAGE_WIDTHS[2])
+                rooms.add(f'{STAGE_IMAGE_ROOM}-{width}')
+
+        previous_rooms = self.subscriptions.get(sid, set())
+        for room in previous_rooms - rooms:
+            leave_room(room, sid=sid)
+        for room in rooms - previous_rooms:
+            join_room(room, sid=sid)
+        self.subscriptions[sid] = rooms
+
+        self.stage_widths.pop(sid, None)
+        for room in rooms:
+            if room.startswith(STAGE_IMAGE_ROOM + '-'):
+                width = int(room.split('-')[-1])
+                self.stage_widths[sid] = width
+                # a newly subscribed client has nothing to composite tiles onto
+                self.stage_keyframe_widths.add(width)
+
+    def get_stage_image_width(self, screen_width):
+        """
+        Method to choose the stage image width for a screen: the smallest width that covers it, or the largest width
+        :param int screen_width: The width, in device pixels, of the client's screen
+        :return int: The stage image width
+        """
+        for width in STAGE_IMAGE_WIDTHS:
+            if width >= screen_width:
+                return width
+        return STAGE_IMAGE_WIDTHS[-1]
+
+    def get_stage_image_widths(self):
+        """
+        Method to get the stage image widths that currently have subscribers. Safe to call from any thread.
+        :return set of int: The widths
+        """
+        return set(self.stage_widths.values())
+
+    def stage_keyframe_needed(self, width):
+        """
+        Method to check whether the stage clients at the given width need a full frame
+        :param int width: The stage image width
+        :return bool: Whether a full frame is needed
+        """
+        return width in self.stage_keyframe_widths
+
+    def emit(self, event, data, to=None):
+        """
+        Method to send a Socket.IO event to the clients from any thread. With an async backend, socketio may only be
+        used from within the server's event loop, so the event is queued for emit_loop instead.
+        :param str event: The event name
+        :param data: The event's payload
+        :param str to: The room to send the event to; all clients if not given
+        """
+        if not self.socketio or not self.running:
+            return
+        if self.backend == 'threading':
+            start_time = time.perf_counter()
+            with self.app.app_context():
+                self.socketio.emit(event, data, to=to)
+            self.last_broadcast_latency = time.perf_counter() - start_time
+            self.metrics.record_emit(event, data, self.last_broadcast_latency)
+        else:
+            self.emit_queue.put((event, data, to, time.perf_counter()))
+
+    def emit_loop(self):
+        """
+        Background task run inside an async backend's event loop that sends the events queued by emit, and shuts the
+        server down once stop_server has been called
+        """
+        while True:
+            try:
+                item = self.wait_for_emit()
+            except queue.Empty:
+                continue
+
+            if item is None:
+                self.socketio.emit('server_shutdown', {})
+                self.socketio.sleep(0.5)
+                self.socketio.stop()
+                return
+
+            try:
+                with self.app.app_context():
+                    self.socketio.emit(item[0], item[1], to=item[2])
+                self.last_broadcast_latency = time.perf_counter() - item[3]
+                self.metrics.record_emit(item[0], item[1], self.last_broadcast_latency)
+            except Exception:
+                self.gui.main.error_log()
+
+    def wait_for_emit(self):
+        """
+        Method to wait for the next event queued by emit. emit is called from other threads, so the queue is a thread
+        queue, and waiting on it directly would block the event loop. The wait is handed to the async backend's pool
+        of native threads instead, which lets the loop carry on and wakes emit_loop as soon as an event is queued.
+        :return tuple: The queued event, or None once stop_server has been called
+        :raises queue.Empty: If no event was queued within EMIT_WAIT_TIMEOUT
+        """
+        if self.backend == 'eventlet':
+            from eventlet import tpool
+            return tpool.execute(self.emit_queue.get, True, EMIT_WAIT_TIMEOUT)
+        else:
+            from gevent import get_hub
+            return get_hub().threadpool.apply(self.emit_queue.get, (True, EMIT_WAIT_TIMEOUT))
+
+    def get_health(self):
+        """
+        Method to report the health of the server without loading any pages. Safe to call from any thread.
+        :return dict: running, uptime, heartbeat_age, connected_clients, clients_by_page, and last_broadcast_latency
+        """
+        now = time.monotonic()
+        clients_by_page = {}
+        for page in list(self.clients.values()):
+            clients_by_page[page] = clients_by_page.get(page, 0) + 1
+
+        return {
+            'running': self.running,
+            'backend': self.backend,
+            'uptime': now - self.start_time if self.start_time else 0,
+            'heartbeat_age': now - self.last_heartbeat if self.last_heartbeat else None,
+            'connected_clients': sum(clients_by_page.values()),
+            'clients_by_page': clients_by_page,
+            'last_broadcast_latency': self.last_broadcast_latency
+        }
+
+    def is_healthy(self, max_heartbeat_age):
+        """
+        Method to check, without any network requests, that the server is running and has recently answered an HTTP
+        request
+        :param float max_heartbeat_age: The oldest, in seconds, the last heartbeat may be
+        :return bool: Whether the server is healthy
+        """
+        if not self.running or not self.last_heartbeat:
+            return False
+        return time.monotonic() - self.last_heartbeat <= max_heartbeat_age
+
+    def stop_server(self):
+        """
+        Method to gracefully shut the server down, letting connected clients know before closing their connections
+        """
+        if not self.running:
+            return
+        try:
+            if self.backend == 'threading':
+                with self.app.app_context():
+                    self.socketio.emit('server_shutdown', {})
+                self.wsgi_server.shutdown()
+            else:
+                # the emit loop sends the notice and stops the server from inside the event loop
+                self.emit_queue.put(None)
+        except Exception:
+            self.gui.main.error_log()
+        self.running = False
 
     def update_stage_text(self, stage_html, font_size, slide_info):
-        with self.app.app_context():
-            self.socketio.emit('update_stage', [stage_html, font_size, slide_info])
-
-    def update_stage_image(self, jpg_bytes, slide_info):
-        with self.app.app_context():
-            self.socketio.emit('update_display', [jpg_bytes, slide_info])
-
-    def get_all_gui_data(self):
-        class_tag = ''
-
-        remote_oos_buttons = ''
-        current_row = self.gui.oos_widget.oos_list_widget.currentRow()
+        # the stage clients' canvases will be out of date once they switch back to showing the display
+        self.stage_keyframe_widths.update(self.get_stage_image_widths())
+        self.emit('update_stage', [stage_html, font_size, slide_info], to=STAGE_TEXT_ROOM)
+
+    def get_stage_slide(self, index):
+        """
+        Method to build the stage view's text for a live slide from its already-parsed data. Must be called from the
+        GUI thread.
+        :param int index: The row of the slide in the live widget
+        :return dict: {'index', 'html', 'slide_info'} for the slide
+        """
+        slide_list = self.gui.live_widget.slide_list
+        slide_data = slide_list.item(index).data(Qt.ItemDataRole.UserRole)
+
+        lyrics_html = ''
+        if slide_data['type'] == 'song':
+            lyrics_html = slide_data['parsed_text']['text']
+        elif slide_data['type'] in ('bible', 'custom'):
+            lyrics_html = slide_data['parsed_text']
+
+        stage_html = strip_paragraph_tags(lyrics_html)
+        return {
+            'index': index,
+            'html': f'<p style="align-text: center;">{stage_html}</p>',
+            'slide_info': f'Slide {index + 1} of {slide_list.count()}'
+        }
+
+    def update_stage_lookahead(self):
+        """
+        Method to push the live slide, the slides following it, and the next order of service item to the stage
+        clients, so that they can switch slides as soon as the live slide changes and show musicians what's coming
+        next. Must be called from the GUI thread.
+        """
+        if not self.socketio or not self.running:
+            return
+
+        settings = self.gui.main.settings
+        lookahead = 2
+        if 'stage_lookahead_slides' in settings.keys():
+            lookahead = int(settings['stage_lookahead_slides'])
+
+        slide_list = self.gui.live_widget.slide_list
+        current_slide = slide_list.currentRow()
+        slides = []
+        if current_slide >= 0:
+            for i in range(current_slide, min(current_slide + lookahead + 1, slide_list.count())):
+                slides.append(self.get_stage_slide(i))
+
+        next_oos = None
+        oos_list = self.gui.oos_widget.oos_list_widget
+        for i in range(oos_list.currentRow() + 1, oos_list.count()):
+            item_data = oos_list.item(i).data(Qt.ItemDataRole.UserRole)
+            if item_data:
+                next_oos = {'index': i, 'title': item_data['title'], 'type': item_data['type']}
+                break
+
+        self.emit('update_stage_lookahead', {
+            'current_slide': current_slide,
+            'font_size': settings['stage_font_size'],
+            'slides': slides,
+            'next_oos': next_oos
+        }, to=STAGE_TEXT_ROOM)
+
+    def update_stage_image(self, jpg_bytes, slide_info, stage_width):
+        """
+        Method to send a full mirrored display frame to the stage clients subscribed at the given width
+        :param bytes jpg_bytes: The encoded frame
+        :param str slide_info: The slide info text
+        :param int stage_width: The stage image width the frame was encoded for
+        """
+        self.stage_keyframe_widths.discard(stage_width)
+        self.emit('update_display', [jpg_bytes, slide_info], to=f'{STAGE_IMAGE_ROOM}-{stage_width}')
+
+    def update_stage_tiles(self, tiles, slide_info, width, height, stage_width):
+        """
+        Method to send the changed tiles of a mirrored display frame to the stage clients subscribed at the given width
+        :param list tiles: [x, y, jpg_bytes] for each changed tile
+        :param str slide_info: The slide info text
+        :param int width: The width of the full frame
+        :param int height: The height of the full frame
+        :param int stage_width: The stage image width the frame was encoded for
+        """
+        self.emit('update_display_tiles', [tiles, slide_info, width, height], to=f'{STAGE_IMAGE_ROOM}-{stage_width}')
+
+    def handle_remote_post(self):
+        """
+        Method to queue a command POSTed by the web remote for the GUI thread. The remote pages send the form fields
+        'command', 'value', 'client_id', 'seq', and 'sid'; a bare command name as the body, or an 'oos_title' or
+        'slide_title' form field, is also accepted.
+        :return tuple: The response body and status code
+        """
+        if self.gui.block_remote_input:
+            return jsonify({'status': 'blocked'}), 200
+
+        name = None
+        value = None
+        if 'command' in request.form:
+            name = request.form.get('command')
+            value = request.form.get('value')
+        elif 'oos_title' in request.form:
+            name = 'oos_title'
+            value = request.form.get('oos_title')
+        elif 'slide_title' in request.form:
+            name = 'slide_title'
+            value = request.form.get('slide_title')
+        else:
+            for command_name in NAVIGATION_COMMANDS + SCREEN_COMMANDS:
+                if command_name.encode() in request.data:
+                    name = command_name
+                    break
+
+        if name not in NAVIGATION_COMMANDS + SCREEN_COMMANDS:
+            return jsonify({'status': 'unknown command'}), 400
+        if name in ('oos_title', 'slide_title'):
+            if not value or not value.isnumeric():
+                return jsonify({'status': 'invalid value'}), 400
+            value = int(value)
+
+        client_seq = request.form.get('seq')
+        client_seq = int(client_seq) if client_seq and client_seq.isnumeric() else None
+        command, was_empty = self.command_queue.submit(
+            name, value, request.form.get('client_id'), client_seq, request.form.get('sid'))
+        if not command:
+            return jsonify({'status': 'stale', 'version': self.state_snapshot.version}), 200
+
+        # one wakeup is enough for the GUI thread to take everything queued until it gets to it
+        if was_empty:
+            self.gui.live_widget.remote_command_signal.emit()
+        return jsonify({'status': 'queued', 'seq': command.seq}), 202
+
+    def acknowledge_commands(self, commands, coalesced_seqs=()):
+        """
+        Method to let each remote page know that its commands have been carried out, and the state version that
+        resulted. Must be called from the GUI thread after the commands have been carried out.
+        :param list of RemoteCommand commands: The commands that were carried out
+        :param iterable of int coalesced_seqs: The seqs of the commands that were merged into a later command
+        """
+        version = self.state_snapshot.version
+        for command in commands:
+            if not command.sid:
+                continue
+            self.emit('command_ack', {
+                'client_id': command.client_id,
+                'seq': command.client_seq,
+                'version': version,
+                'coalesced': command.seq in coalesced_seqs
+            }, to=command.sid)
+
+    def get_oos_state(self):
+        """
+        Method to read the titles of the items in the order of service. Must be called from the GUI thread.
+        :return list of dict: {'index', 'title', 'type'} for each item
+        """
+        oos = []
         for i in range(self.gui.oos_widget.oos_list_widget.count()):
-            title = self.gui.oos_widget.oos_list_widget.item(i).data(Qt.ItemDataRole.UserRole)['title']
-
-            if i == current_row:
-                class_tag = 'class="current" '
-            else:
-                class_tag = ''
-
-            remote_oos_buttons += f"""
-                <button id="oos{str(i)}" {class_tag}type="button" name="oos_button" value="{str(i)}" onclick="oosClick(event)">
-                    <span class="title">
-                        {title}
-                    </span>
-                </button>
-                <br />"""
-
-        slide_buttons = ''
-        current_row = self.gui.live_widget.slide_list.currentRow()
-
+            item_data = self.gui.oos_widget.oos_list_widget.item(i).data(Qt.ItemDataRole.UserRole)
+            if not item_data:  # a placeholder item in oos will not have any data
+                continue
+            oos.append({'index': i, 'title': item_data['title'], 'type': item_data['type']})
+        return oos
+
+    def get_slides_state(self):
+        """
+        Method to read the titles and plain text of the slides currently in the live widget. Must be called from the
+        GUI thread.
+        :return list of dict: {'index', 'title', 'text'} for each slide
+        """
+        slides = []
         for i in range(self.gui.live_widget.slide_list.count()):
             slide_data = self.gui.live_widget.slide_list.item(i).data(Qt.ItemDataRole.UserRole)
+            title = slide_data['title']
             if slide_data['type'] == 'video':
-                title = slide_data['title']
                 text = 'Video'
+            elif 'parsed_text' in slide_data.keys() and type(slide_data['parsed_text']) == dict:
+                title = slide_data['parsed_text']['title']
+                text = get_plain_text(slide_data['parsed_text']['text'])
+            elif 'parsed_text' in slide_data.keys():
+                text = get_plain_text(slide_data['parsed_text'])
+            elif 'text' in slide_data.keys():
+                text = get_plain_text(slide_data['text'])
             else:
-                title = slide_data['title']
-                if 'parsed_text' in slide_data.keys() and type(slide_data['parsed_text']) == dict:
-                    text = re.sub('<p.*?>', '', slide_data['parsed_text']['text'])
-                elif 'parsed_text' in slide_data.keys():
-                    text = re.sub('<p.*?>', '', slide_data['parsed_text'])
-                else:
-                    text = re.sub('<p.*?>', '', slide_data['text'])
-                text = text.replace('</p>', '')
-
-            if i == current_row:
-                class_tag = 'class="current" '
-            else:
-                class_tag = ''
-
-            slide_buttons += f"""
-                <button id="slide{str(i)}" {class_tag}type="button" name="slide_button" value="{str(i)}" onClick="slideClick(event)">
-                    <span class="title">{title}</span>
-                    <br>
-                    <span class="text">{text}</span>
-                </button>
-                <br>"""
-
-        return remote_oos_buttons, slide_buttons
-    
-    def slide_button(self, button):
-        self.gui.live_widget.web_button_signal.emit(button)
-        return '', 200
+                text = ''
+            slides.append({'index': i, 'title': title, 'text': text})
+        return slides
+
+    def get_remote_state(self):
+        """
+        Method to get the full state shown by the web remotes from the current snapshot. Safe to call from any thread.
+        :return dict: The state, including its version
+        """
+        return self.state_snapshot.to_dict()
+
+    def publish_state(self, event, **changes):
+        """
+        Method to publish a new state snapshot with the given changes and push the changed part to the web remotes.
+        Must be called from the GUI thread.
+        :param str event: The Socket.IO event name
+        :param changes: The parts of the state that changed
+        """
+        snapshot = self.state_snapshot.replace(**changes)
+        self.state_snapshot = snapshot
+
+        data = snapshot.to_dict()
+        payload = {'version': snapshot.version}
+        for key in changes:
+            payload[key] = data[key]
+        self.emit(event, payload, to=REMOTE_STATE_ROOM)
+
+    def update_remote_oos(self):
+        """
+        Method to publish the order of service to the web remotes
+        """
+        self.publish_state(
+            'update_oos',
+            oos=self.get_oos_state(),
+            current_oos=self.gui.oos_widget.oos_list_widget.currentRow()
+        )
+
+    def update_remote_slides(self):
+        """
+        Method to publish the live slides to the web remotes
+        """
+        self.publish_state(
+            'update_slides',
+            slides=self.get_slides_state(),
+            current_slide=self.gui.live_widget.slide_list.currentRow()
+        )
+        self.update_stage_lookahead()
+
+    def change_current_oos(self, index):
+        """
+        Method to publish which order of service item is live
+        :param int index: The row of the live item
+        """
+        self.publish_state('change_current_oos', current_oos=index)
+
+    def change_current_slide(self, index):
+        """
+        Method to publish which slide is live
+        :param int index: The row of the live slide
+        """
+        self.publish_state('change_current_slide', current_slide=index)
+        # stage clients switch to this slide from their lookahead right away, then get the slides following it
+        self.emit('stage_current_slide', {'current_slide': index}, to=STAGE_TEXT_ROOM)
+        self.update_stage_lookahead()
 
 
 class RemoteServerHandler(BaseHTTPRequestHandler):
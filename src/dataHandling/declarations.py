@@ -17,6 +17,7 @@ DEFAULT_SETTINGS = {
     "song_use_shadow": True,
     "song_shadow_color": 0,
     "song_shadow_offset": 3,
+    "song_shadow_blur": 0,
     "song_use_outline": True,
     "song_outline_color": 0,
     "song_outline_width": 2,
@@ -29,6 +30,7 @@ DEFAULT_SETTINGS = {
     "bible_use_shadow": True,
     "bible_shadow_color": 0,
     "bible_shadow_offset": 3,
+    "bible_shadow_blur": 0,
     "bible_use_outline": True,
     "bible_outline_color": 0,
     "bible_outline_width": 2,
@@ -56,7 +58,13 @@ DEFAULT_SETTINGS = {
     },
     "force_software_rendering": False,
     "mirror_stage_display": False,
-    "update_fps": 10
+    "update_fps": 10,
+    "remote_server_backend": "threading",
+    "remote_max_clients": 50,
+    "stage_lookahead_slides": 2,
+    "display_outputs": [],
+    "embed_service_data": True,
+    "warm_pagination_cache": False
 }
 
 DEVICE_SPECIFIC_SETTINGS = {
@@ -69,6 +77,9 @@ DEVICE_SPECIFIC_SETTINGS = {
     "force_software_rendering": False
 }
 
+# the database's user_version once every song's lyrics have been converted to the structured lyric format
+STRUCTURED_LYRICS_DB_VERSION = 1
+
 DB_STRUCTURE = {
     'audio': {
         'name': 'TEXT',
@@ -106,6 +117,11 @@ DB_STRUCTURE = {
         'fileName': 'TEXT',
         'image': 'BLOB'
     },
+    'paginationCache': {
+        'cacheKey': 'TEXT PRIMARY KEY',
+        'parsedText': 'TEXT',
+        'lastUsed': 'REAL'
+    },
     'songs': {
         'title': 'TEXT',
         'author': 'TEXT',
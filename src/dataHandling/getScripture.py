@@ -39,9 +39,25 @@ class GetScripture:
 
     def get_passage(self, reference):
         """
-        Method to parse the user's inputted reference and retrieve the passage from the user's xml bible.
+        Method to parse the user's inputted reference and retrieve the passage from the user's xml bible, showing why
+        in the bible widget's status label if it can't be found.
         :param str reference: The user-provided scripture reference
         """
+        passage = self.find_passage(reference)
+        if passage[0] == -1:
+            self.main.gui.media_widget.bible_search_status_label.setText(passage[1])
+        else:
+            self.main.gui.media_widget.bible_search_status_label.clear()
+        return passage
+
+    def find_passage(self, reference):
+        """
+        Method to parse a reference and retrieve the passage from the user's xml bible. Touches no widgets, so it can
+        be called from any thread.
+        :param str reference: The scripture reference
+        :return tuple: (standardized book name, list of [verse number, verse text]), or (-1, the reason the passage
+            couldn't be found)
+        """
         scripture_text = []
         standard_book = None
         if self.root:
@@ -50,7 +66,6 @@ class GetScripture:
             reference_ok = False
             # only attempt to retrieve a passage if something more than the book has been provided
             if not len(reference_split) > 1:
-                self.main.gui.media_widget.bible_search_status_label.setText('not enough info to find passage')
                 return (-1, 'not enough info to find passage')
 
             # use ParseScriptureReference to retrieve book, chapters, verses from the reference
@@ -58,7 +73,6 @@ class GetScripture:
             parsed_reference = psr.parse_reference(reference)
 
             if parsed_reference['verse_start'] == '':
-                self.main.gui.media_widget.bible_search_status_label.setText('no verses found')
                 return (-1, 'no verses found')
 
             # go on to get the passage from the xml bible if the parsing worked out
@@ -95,7 +109,6 @@ class GetScripture:
                                     chapter_element = child
 
                             if not chapter_element:
-                                self.main.gui.media_widget.bible_search_status_label.setText('unable to get chapter')
                                 return (-1, 'unable to get chapter')
 
                             for child in chapter_element:
@@ -125,23 +138,17 @@ class GetScripture:
                                             ]
                                         )
                                 except ValueError:
-                                    self.main.gui.media_widget.bible_search_status_label.setText('missing verse value')
                                     return (-1, 'missing verse value')
 
                         else:
-                            self.main.gui.media_widget.bible_search_status_label.setText('unable to find book element')
                             return (-1, 'unable to find book element')
                     else:
-                        self.main.gui.media_widget.bible_search_status_label.setText('unable to standardize book')
                         return (-1, 'unable to standardize book')
 
             else:
-                self.main.gui.media_widget.bible_search_status_label.setText('unable to parse reference')
                 return (-1, 'unable to parse reference')
 
         if len(scripture_text) > 0:
-            self.main.gui.media_widget.bible_search_status_label.clear()
             return (standard_book, scripture_text)
         else:
-            self.main.gui.media_widget.bible_search_status_label.setText('scripture text not found')
             return (-1, 'scripture text not found')
@@ -0,0 +1,513 @@
+import html
+import json
+import re
+
+# matches any html tag (capturing whether it is a closing tag and its name) or a bare newline
+TAG_PATTERN = re.compile(r'<\s*(/?)\s*([a-zA-Z0-9]+)[^>]*>|\n')
+
+# matches any html tag, capturing whether it is a closing tag, its name, and its attributes
+HTML_TAG_PATTERN = re.compile(r'<\s*(/?)\s*([a-zA-Z0-9!]+)([^>]*)>')
+
+# matches any tag, for stripping them all
+ANY_TAG_PATTERN = re.compile('<.*?>')
+
+# matches opening and closing paragraph tags
+PARAGRAPH_TAG_PATTERN = re.compile('<p.*?>|</p>')
+
+# matches a line break, in any of the forms it has been stored in
+BREAK_PATTERN = re.compile('<br.*?/>')
+
+# matches anything that isn't part of the simplified lyric markup: a newline, or a tag other than <b>, <i>, <u>, <br />
+# and their closing tags
+NON_SIMPLIFIED_PATTERN = re.compile(r'<(?!/?[biu]>|br />)|\n')
+
+# matches a song segment marker, i.e. [Verse 1]
+SEGMENT_MARKER_PATTERN = re.compile(r'\[.*?]')
+
+# matches a segment marker at the start of a line, along with any whitespace before it
+SEGMENT_MARKER_LINE_PATTERN = re.compile(r'\s*\[[^\[\]]*]')
+
+# matches a segment marker directly before a paragraph, as in the [v1]<p>...</p> form that songs imported from OpenLP
+# were stored in
+INLINE_SEGMENT_MARKER_PATTERN = re.compile(r'(\[[^\[\]<>]*])(?=\s*<p[\s>])')
+
+# matches two or more line breaks in a row, i.e. a blank line, which is where a custom slide is split into slides
+SLIDE_BREAK_PATTERN = re.compile('(?:<br />){2,}')
+
+BREAK_TAG = '<br />'
+
+BOLD_TAGS = ('b', 'strong')
+ITALIC_TAGS = ('i', 'em')
+UNDERLINE_TAGS = ('u',)
+
+# the simplified tag each styling tag is normalized to
+SIMPLIFIED_STYLE_TAGS = {'b': 'b', 'strong': 'b', 'i': 'i', 'em': 'i', 'u': 'u'}
+
+# the version of the structured form that song lyrics are stored in, which every structured record starts with
+LYRIC_FORMAT_VERSION = 1
+STRUCTURED_LYRICS_PREFIX = '{"lyric_format":'
+
+# the flags that store a styled run's styling, and the simplified tag for each
+BOLD_FLAG = 1
+ITALIC_FLAG = 2
+UNDERLINE_FLAG = 4
+STYLE_FLAG_TAGS = ((BOLD_FLAG, 'b'), (ITALIC_FLAG, 'i'), (UNDERLINE_FLAG, 'u'))
+
+# the user-friendly names of the segment types, keyed to the letter that they are abbreviated to in verse orders
+SEGMENT_NAMES = (
+    ('v', 'Verse'),
+    ('c', 'Chorus'),
+    ('p', 'Pre-Chorus'),
+    ('b', 'Bridge'),
+    ('t', 'Tag')
+)
+
+
+class StyledRun:
+    """
+    Provides a piece of text that shares the same bold, italic, and underline styling
+    """
+    __slots__ = ('text', 'bold', 'italic', 'underline')
+
+    def __init__(self, text, bold=False, italic=False, underline=False):
+        """
+        Provides a piece of text that shares the same bold, italic, and underline styling
+        :param str text: The text of this run
+        :param bool bold: Whether this run is bold
+        :param bool italic: Whether this run is italic
+        :param bool underline: Whether this run is underlined
+        """
+        self.text = text
+        self.bold = bold
+        self.italic = italic
+        self.underline = underline
+
+    def style(self):
+        """
+        Method to return the styling of this run as a hashable key
+        :return tuple: (bold, italic, underline)
+        """
+        return self.bold, self.italic, self.underline
+
+    def __repr__(self):
+        return f'StyledRun({self.text!r}, bold={self.bold}, italic={self.italic}, underline={self.underline})'
+
+
+def tokenize_styled_runs(text):
+    """
+    Method to parse the simplified <b>, <i>, and <u> lyric markup in a single pass, splitting it into lines (on <br />
+    or newlines) made up of styled runs. Any other tags, such as <p>, are dropped.
+    :param str text: The marked-up text
+    :return list of list of StyledRun: The runs of each line
+    """
+    lines = [[]]
+    bold = False
+    italic = False
+    underline = False
+    position = 0
+
+    for match in TAG_PATTERN.finditer(text):
+        if match.start() > position:
+            lines[-1].append(StyledRun(text[position:match.start()], bold, italic, underline))
+        position = match.end()
+
+        tag_name = match.group(2)
+        if not tag_name:
+            lines.append([])
+            continue
+
+        tag_name = tag_name.lower()
+        opening = not match.group(1)
+        if tag_name == 'br':
+            lines.append([])
+        elif tag_name in BOLD_TAGS:
+            bold = opening
+        elif tag_name in ITALIC_TAGS:
+            italic = opening
+        elif tag_name in UNDERLINE_TAGS:
+            underline = opening
+
+    if position < len(text):
+        lines[-1].append(StyledRun(text[position:], bold, italic, underline))
+
+    return lines
+
+
+def get_plain_text(text):
+    """
+    Method to strip all markup from lyric text, keeping its line breaks as newlines
+    :param str text: The marked-up text
+    :return str: The plain text
+    """
+    lines = tokenize_styled_runs(text)
+    return html.unescape('\n'.join(''.join(run.text for run in line) for line in lines)).strip()
+
+
+def get_span_tags(attributes):
+    """
+    Method to get the simplified tags that replace a Qt rich text span, according to the styling in its attributes
+    :param str attributes: The span's attributes
+    :return tuple: (str opening tags, str closing tags)
+    """
+    prefix = ''
+    suffix = ''
+    # the tags are closed in the reverse of the order they were opened in, so that they nest
+    if 'font-weight' in attributes:
+        prefix += '<b>'
+        suffix = '</b>' + suffix
+    if 'font-style' in attributes:
+        prefix += '<i>'
+        suffix = '</i>' + suffix
+    if 'text-decoration' in attributes:
+        prefix += '<u>'
+        suffix = '</u>' + suffix
+    return prefix, suffix
+
+
+def normalize_lyrics(lyrics):
+    """
+    Method to convert lyrics into the simplified lyric markup in a single pass, whether they are the Qt rich text html
+    of a QTextEdit, an older stored form, or plain text. In the simplified markup, lines are separated by <br />,
+    styling is done with <b>, <i>, and <u>, and there are no other tags. Entities are left as they are.
+    :param str lyrics: The lyrics
+    :return str: The lyrics in simplified markup
+    """
+    # lyrics that were stored in the simplified markup need no more work
+    if not NON_SIMPLIFIED_PATTERN.search(lyrics):
+        return lyrics
+
+    # only the paragraphs of a full html document's body are kept, each one a line
+    document = '<body' in lyrics
+    if document:
+        body_start = lyrics.index('<body')
+        lyrics = lyrics[lyrics.find('>', body_start) + 1:]
+
+    paragraphs = []
+    pieces = []
+    span_suffixes = []
+    in_paragraph = not document
+    position = 0
+
+    for match in HTML_TAG_PATTERN.finditer(lyrics):
+        if in_paragraph and match.start() > position:
+            pieces.append(lyrics[position:match.start()])
+        position = match.end()
+
+        closing = bool(match.group(1))
+        tag_name = match.group(2).lower()
+
+        if tag_name == 'p':
+            if document:
+                if in_paragraph:
+                    paragraphs.append(finish_paragraph(pieces))
+                    pieces = []
+                in_paragraph = not closing
+            continue
+
+        if not in_paragraph:
+            continue
+
+        if tag_name == 'br':
+            pieces.append(BREAK_TAG)
+        elif tag_name == 'span':
+            if closing:
+                if span_suffixes:
+                    pieces.append(span_suffixes.pop())
+            else:
+                prefix, suffix = get_span_tags(match.group(3))
+                pieces.append(prefix)
+                span_suffixes.append(suffix)
+        elif tag_name in SIMPLIFIED_STYLE_TAGS:
+            pieces.append(f'<{"/" if closing else ""}{SIMPLIFIED_STYLE_TAGS[tag_name]}>')
+
+    if in_paragraph and position < len(lyrics):
+        pieces.append(lyrics[position:])
+
+    if document:
+        if in_paragraph:
+            paragraphs.append(finish_paragraph(pieces))
+        return BREAK_TAG.join(paragraphs)
+    return ''.join(pieces).replace('\n', BREAK_TAG)
+
+
+def finish_paragraph(pieces):
+    """
+    Method to join the pieces of a paragraph into a line, treating a paragraph that holds only a line break as empty
+    :param list of str pieces: The paragraph's pieces
+    :return str: The line
+    """
+    line = ''.join(pieces).strip()
+    if line == BREAK_TAG:
+        return ''
+    return line
+
+
+def strip_tags(text):
+    """
+    Method to remove every tag from a piece of markup
+    :param str text: The markup
+    :return str: The text without its tags
+    """
+    return ANY_TAG_PATTERN.sub('', text)
+
+
+def strip_paragraph_tags(text):
+    """
+    Method to remove the paragraph tags from a piece of markup
+    :param str text: The markup
+    :return str: The markup without paragraph tags
+    """
+    return PARAGRAPH_TAG_PATTERN.sub('', text)
+
+
+def split_custom_slides(text):
+    """
+    Method to split the text of a custom slide into a slide for each of its blank-line separated parts
+    :param str text: The custom slide's text, in simplified markup
+    :return list of str: The slides' texts
+    """
+    return SLIDE_BREAK_PATTERN.split(text)
+
+
+def trim_breaks(text):
+    """
+    Method to remove any line breaks from the start and end of a piece of simplified markup
+    :param str text: The markup
+    :return str: The trimmed markup
+    """
+    while text.startswith(BREAK_TAG):
+        text = text[len(BREAK_TAG):]
+    while text.endswith(BREAK_TAG):
+        text = text[:-len(BREAK_TAG)]
+    return text
+
+
+def split_segments(lyrics):
+    """
+    Method to split lyrics into their segments according to their segment markers (i.e. [Verse 1]). Any text before
+    the first marker is dropped.
+    :param str lyrics: The lyrics
+    :return list of tuple: (str marker, str segment text) for each segment, in the order they appear
+    """
+    markers = SEGMENT_MARKER_PATTERN.findall(lyrics)
+    texts = SEGMENT_MARKER_PATTERN.split(lyrics)[1:]
+    return list(zip(markers, texts))
+
+
+def get_short_marker(marker):
+    """
+    Method to abbreviate a segment marker the way verse orders refer to it, i.e. [Verse 1] to [v1]
+    :param str marker: The marker
+    :return str: The abbreviated marker, or the marker as it was if it is already abbreviated
+    """
+    if ' ' not in marker:
+        return marker
+    marker_split = marker[1:-1].split(' ')
+    return '[' + marker_split[0][0].lower() + marker_split[1] + ']'
+
+
+def get_segment_title(short_marker):
+    """
+    Method to get the user-friendly title of a segment from its abbreviated marker, i.e. Verse 1 from [v1]
+    :param str short_marker: The abbreviated marker
+    :return str: The title
+    """
+    number = ''.join(character for character in short_marker if character.isdigit())
+    for letter, name in SEGMENT_NAMES:
+        if letter in short_marker:
+            return name + ' ' + number
+    return 'Ending ' + number
+
+
+def get_lyric_segments(lyrics):
+    """
+    Method to split a song's stored lyrics into their segments, keyed to their abbreviated markers (i.e. [v1]) and
+    ready to be shown. Lyrics without any markers are split into verses on blank lines.
+    :param str lyrics: The song's stored lyrics, in any of the forms they have been stored in
+    :return dict: {abbreviated marker: segment text in simplified markup}
+    """
+    lyrics = normalize_lyrics(lyrics)
+
+    segments = {}
+    marked_segments = split_segments(lyrics)
+    if marked_segments:
+        for marker, text in marked_segments:
+            segments[get_short_marker(marker)] = text.strip()
+    else:
+        for index, text in enumerate(lyrics.split(BREAK_TAG + BREAK_TAG)):
+            if len(text.strip()) > 0:
+                segments[f'[v{index + 1}]'] = text.strip()
+
+    for marker in segments:
+        segments[marker] = trim_breaks(segments[marker].replace('&quot;', '"'))
+    return segments
+
+
+def get_run_flags(run):
+    """
+    Method to pack a styled run's styling into the flags it is stored with
+    :param StyledRun run: The run
+    :return int: The flags
+    """
+    flags = 0
+    if run.bold:
+        flags |= BOLD_FLAG
+    if run.italic:
+        flags |= ITALIC_FLAG
+    if run.underline:
+        flags |= UNDERLINE_FLAG
+    return flags
+
+
+def encode_line(runs):
+    """
+    Method to convert a line's styled runs into the form they are stored in: the line's text if it has no styling,
+    otherwise a list of [text, flags] for each run
+    :param list of StyledRun runs: The line's runs
+    :return str | list: The stored line
+    """
+    stored_runs = []
+    for run in runs:
+        flags = get_run_flags(run)
+        if stored_runs and stored_runs[-1][1] == flags:
+            stored_runs[-1][0] += run.text
+        elif run.text:
+            stored_runs.append([run.text, flags])
+
+    if not stored_runs:
+        return ''
+    if len(stored_runs) == 1 and stored_runs[0][1] == 0:
+        return stored_runs[0][0]
+    return stored_runs
+
+
+def decode_line(line):
+    """
+    Method to convert a stored line back into simplified markup
+    :param str | list line: The stored line
+    :return str: The line in simplified markup
+    """
+    if type(line) is str:
+        return line
+
+    pieces = []
+    for text, flags in line:
+        for flag, tag in STYLE_FLAG_TAGS:
+            if flags & flag:
+                pieces.append(f'<{tag}>')
+        pieces.append(text)
+        for flag, tag in reversed(STYLE_FLAG_TAGS):
+            if flags & flag:
+                pieces.append(f'</{tag}>')
+    return ''.join(pieces)
+
+
+def get_plain_line(line):
+    """
+    Method to get the text of a stored line without its styling
+    :param str | list line: The stored line
+    :return str: The line's text
+    """
+    if type(line) is str:
+        return line
+    return ''.join(text for text, flags in line)
+
+
+def to_structured_lyrics(lyrics):
+    """
+    Method to convert lyrics into the structured form they are stored in: a list of segments, each with its tag (i.e.
+    Verse 1) and its lines, each line made up of styled runs. Lines before the first segment marker are kept in a
+    segment whose tag is None. Only an unstyled marker at the start of a line starts a segment, with any text after it
+    kept as the segment's first line, so that any other bracketed text, such as [x2], stays part of its line. A marker
+    directly before a paragraph, as in the [v1]<p>...</p> form that songs imported from OpenLP were stored in, is moved
+    onto its own line first.
+    :param str lyrics: The lyrics, in any of the forms they have been stored in
+    :return dict: The structured lyrics
+    """
+    lyrics = INLINE_SEGMENT_MARKER_PATTERN.sub(BREAK_TAG + r'\1' + BREAK_TAG, lyrics)
+
+    segments = [[None, []]]
+    for runs in tokenize_styled_runs(normalize_lyrics(lyrics)):
+        match = None
+        if runs and get_run_flags(runs[0]) == 0:
+            match = SEGMENT_MARKER_LINE_PATTERN.match(runs[0].text)
+
+        if not match:
+            segments[-1][1].append(encode_line(runs))
+            continue
+
+        segments.append([match.group().strip()[1:-1], []])
+        first_run = runs[0]
+        rest = [StyledRun(first_run.text[match.end():].lstrip())] + runs[1:]
+        if any(run.text.strip() for run in rest):
+            segments[-1][1].append(encode_line(rest))
+
+    # the breaks put around markers moved off a paragraph can leave empty lines before the first marker
+    if len(segments) > 1 and not any(segments[0][1]):
+        segments.pop(0)
+    return {'lyric_format': LYRIC_FORMAT_VERSION, 'segments': segments}
+
+
+def from_structured_lyrics(structure):
+    """
+    Method to convert structured lyrics back into simplified markup
+    :param dict structure: The structured lyrics
+    :return str: The lyrics in simplified markup
+    """
+    lines = []
+    for tag, segment_lines in structure['segments']:
+        if tag is not None:
+            lines.append('[' + tag + ']')
+        for line in segment_lines:
+            lines.append(decode_line(line))
+    return BREAK_TAG.join(lines)
+
+
+def is_structured_lyrics(stored_lyrics):
+    """
+    Method to check whether lyrics from the database are in the structured form
+    :param str stored_lyrics: The stored lyrics
+    :return bool: Whether they are structured
+    """
+    return stored_lyrics.startswith(STRUCTURED_LYRICS_PREFIX)
+
+
+def encode_lyrics(lyrics):
+    """
+    Method to convert lyrics into the compact json they are stored in the database as
+    :param str lyrics: The lyrics, in any of the forms they have been stored in
+    :return str: The json
+    """
+    if is_structured_lyrics(lyrics):
+        return lyrics
+    return json.dumps(to_structured_lyrics(lyrics), ensure_ascii=False, separators=(',', ':'))
+
+
+def get_structured_lyrics(stored_lyrics):
+    """
+    Method to read lyrics from the database as structured lyrics, whether they were stored in the structured form or,
+    by an older version of the program, as html or simplified markup
+    :param str stored_lyrics: The stored lyrics
+    :return dict: The structured lyrics
+    """
+    if is_structured_lyrics(stored_lyrics):
+        try:
+            return json.loads(stored_lyrics)
+        except json.JSONDecodeError:
+            pass
+    return to_structured_lyrics(stored_lyrics)
+
+
+def decode_lyrics(stored_lyrics):
+    """
+    Method to read lyrics from the database as simplified markup, whether they were stored in the structured form or,
+    by an older version of the program, as html or simplified markup
+    :param str stored_lyrics: The stored lyrics
+    :return str: The lyrics in simplified markup
+    """
+    if is_structured_lyrics(stored_lyrics):
+        try:
+            return from_structured_lyrics(json.loads(stored_lyrics))
+        except json.JSONDecodeError:
+            pass
+    return normalize_lyrics(stored_lyrics)
@@ -0,0 +1,124 @@
+import threading
+
+# the media library's item types
+CATALOG_TYPES = ('song', 'custom', 'image', 'video', 'web')
+
+
+class MediaCatalog:
+    """
+    Provides hash indexes over the items in the media library so that items can be found without scanning the library's
+    list widgets. Items are indexed by type and title, which is the key each song, custom slide, and web slide is stored
+    under in the database and so serves as the items' stable id, and images and videos are also indexed by their file
+    names. A type's index is rebuilt whenever its list is repopulated, and is kept up to date as single items are added,
+    edited, or removed.
+    """
+    def __init__(self):
+        """
+        Creates empty indexes for the media library's items.
+        """
+        self.lock = threading.Lock()
+        self.by_title = {}
+        self.by_file_name = {}
+
+    def set_items(self, item_type, items):
+        """
+        Method to replace the indexed items of a type
+        :param str item_type: The items' type
+        :param list of dict items: The items' data, in the order they are listed in the library
+        """
+        with self.lock:
+            for key in [key for key in self.by_title if key[0] == item_type]:
+                self.remove_item(*key)
+            for item_data in items:
+                # like a search of the library's lists, the first item with a given title is the one that is found
+                if (item_type, item_data['title']) not in self.by_title:
+                    self.add_item(item_data)
+
+    def add(self, item_data):
+        """
+        Method to index an item that has been added to the library, replacing any item of the same type and title
+        :param dict item_data: The item's data
+        """
+        with self.lock:
+            self.remove_item(item_data['type'], item_data['title'])
+            self.add_item(item_data)
+
+    def remove(self, item_type, title):
+        """
+        Method to stop indexing an item that has been removed from the library
+        :param str item_type: The item's type
+        :param str title: The item's title
+        """
+        with self.lock:
+            self.remove_item(item_type, title)
+
+    def rename(self, item_type, old_title, item_data):
+        """
+        Method to reindex an item that has been edited, whose title may have changed
+        :param str item_type: The item's type
+        :param str old_title: The item's title before it was edited, or None if it is new to the library
+        :param dict item_data: The item's data after it was edited
+        """
+        with self.lock:
+            if old_title:
+                self.remove_item(item_type, old_title)
+            self.remove_item(item_type, item_data['title'])
+            self.add_item(item_data)
+
+    def get(self, item_type, title):
+        """
+        Method to find an item by its type and title
+        :param str item_type: The item's type
+        :param str title: The item's title
+        :return dict: The item's data, or None if it isn't in the library
+        """
+        with self.lock:
+            return self.by_title.get((item_type, title))
+
+    def get_by_file_name(self, file_name):
+        """
+        Method to find an image or video by its file name
+        :param str file_name: The file name
+        :return dict: The item's data, or None if it isn't in the library
+        """
+        with self.lock:
+            return self.by_file_name.get(file_name)
+
+    def get_items(self, item_type):
+        """
+        Method to list the indexed items of a type
+        :param str item_type: The items' type
+        :return list of dict: The items' data
+        """
+        with self.lock:
+            return [item_data for key, item_data in self.by_title.items() if key[0] == item_type]
+
+    def snapshot(self):
+        """
+        Method to copy the indexes so that they can be used from another thread while the library changes
+        :return MediaCatalog: The copy
+        """
+        catalog = MediaCatalog()
+        with self.lock:
+            catalog.by_title = self.by_title.copy()
+            catalog.by_file_name = self.by_file_name.copy()
+        return catalog
+
+    def add_item(self, item_data):
+        """
+        Method to add an item to the indexes. The lock must be held.
+        :param dict item_data: The item's data
+        """
+        self.by_title[(item_data['type'], item_data['title'])] = item_data
+        if item_data.get('file_name'):
+            self.by_file_name[item_data['file_name']] = item_data
+
+    def remove_item(self, item_type, title):
+        """
+        Method to remove an item from the indexes, if it is there. The lock must be held.
+        :param str item_type: The item's type
+        :param str title: The item's title
+        """
+        item_data = self.by_title.pop((item_type, title), None)
+        if item_data and item_data.get('file_name') and self.by_file_name.get(item_data['file_name']) is item_data:
+            del self.by_file_name[item_data['file_name']]
@@ -0,0 +1,385 @@
+import math
+import re
+import threading
+
+from dataHandling.lyricMarkup import BREAK_PATTERN, get_lyric_segments, get_segment_title
+from dataHandling.paginationCache import get_song_pagination_key
+from dataHandling.textLayout import FontMetricsCache, wrap_text
+
+# the space, in px, kept around the text: between the lines and the sides of the display, around the text's shading
+# rectangle, and between the text and the footer
+TEXT_MARGIN = 40
+
+# matches a run of spaces in a verse order
+MULTIPLE_SPACE_PATTERN = re.compile(' +')
+
+# the placeholder footer measured for scripture, whose reference isn't known until the passage is shown
+SCRIPTURE_FOOTER_PLACEHOLDER = 'bogus reference'
+
+# each thread measures with its own fonts and metrics, since they can't be shared between threads
+thread_state = threading.local()
+
+
+def get_metrics_cache():
+    """
+    Method to get the current thread's FontMetricsCache, creating it if necessary
+    :return FontMetricsCache: The cache
+    """
+    cache = getattr(thread_state, 'metrics_cache', None)
+    if cache is None:
+        cache = FontMetricsCache()
+        thread_state.metrics_cache = cache
+    return cache
+
+
+class PaginationLayout:
+    """
+    Provides a snapshot of everything outside an item's own data that decides how its text is split into slides: the
+    display's size and the global font settings. It is taken on the GUI thread, after which pagination needs nothing
+    from the GUI and can be run on any thread.
+    """
+    __slots__ = ('display_width', 'display_height', 'footer_font_size', 'song_font_face', 'song_font_size',
+                 'bible_font_face', 'bible_font_size', 'ccli_num')
+
+    def __init__(self, display_width, display_height, footer_font_size, song_font_face, song_font_size,
+                 bible_font_face, bible_font_size, ccli_num):
+        """
+        Provides a snapshot of everything outside an item's own data that decides how its text is split into slides
+        :param int display_width: The display's width, in px
+        :param int display_height: The display's height, in px
+        :param int footer_font_size: The footer's font size
+        :param str song_font_face: The global song font family
+        :param int song_font_size: The global song font size
+        :param str bible_font_face: The global bible font family
+        :param int bible_font_size: The global bible font size
+        :param str ccli_num: The user's CCLI license number, shown in song footers
+        """
+        self.display_width = display_width
+        self.display_height = display_height
+        self.footer_font_size = footer_font_size
+        self.song_font_face = song_font_face
+        self.song_font_size = song_font_size
+        self.bible_font_face = bible_font_face
+        self.bible_font_size = bible_font_size
+        self.ccli_num = ccli_num
+
+
+def get_pagination_layout(gui):
+    """
+    Method to take a snapshot of the current display size and global font settings. Must be called on the GUI thread.
+    :param GUI gui: The current instance of GUI
+    :return PaginationLayout: The layout
+    """
+    settings = gui.main.settings
+    return PaginationLayout(
+        gui.display_widget.width(),
+        gui.display_widget.height(),
+        gui.global_footer_font_size,
+        settings['song_font_face'],
+        settings['song_font_size'],
+        settings['bible_font_face'],
+        settings['bible_font_size'],
+        settings['ccli_num']
+    )
+
+
+def get_text_height(text, font_face, font_size, layout):
+    """
+    Method to measure the height the text would take on the display, including its shading rectangle, the same way
+    LyricDisplayWidget.calculate_painted_text does
+    :param str text: The marked-up text
+    :param str font_face: The font family
+    :param int font_size: The font size
+    :param PaginationLayout layout: The display's layout
+    :return float: The height, in px
+    """
+    cache = get_metrics_cache()
+    line_height = cache.get_metrics(font_face, font_size).boundingRect('Way').height()
+    laid_out_lines = wrap_text(text, font_face, font_size, layout.display_width - TEXT_MARGIN, cache)
+    return line_height * len(laid_out_lines) + TEXT_MARGIN
+
+
+def get_footer_height(footer_text, font_face, layout):
+    """
+    Method to measure the height of a footer, wrapped to the display's width
+    :param str footer_text: The footer's plain text, with lines separated by newlines
+    :param str font_face: The footer's font family
+    :param PaginationLayout layout: The display's layout
+    :return int: The height, in px, or 0 if there is no footer
+    """
+    if len(footer_text.strip()) == 0:
+        return 0
+
+    cache = get_metrics_cache()
+    line_count = 0
+    for line in footer_text.split('\n'):
+        line_count += len(wrap_text(line, font_face, layout.footer_font_size, layout.display_width, cache))
+    return math.ceil(cache.get_metrics(font_face, layout.footer_font_size).lineSpacing() * line_count)
+
+
+def get_target_height(footer_height, layout):
+    """
+    Method to get the height that a slide's text must fit within
+    :param int footer_height: The height of the slide's footer
+    :param PaginationLayout layout: The display's layout
+    :return int: The height, in px
+    """
+    return layout.display_height - footer_height - TEXT_MARGIN
+
+
+def get_song_font(song_data, layout):
+    """
+    Method to get the font a song is shown in: its own if it overrides the global settings, otherwise the global song
+    font
+    :param dict song_data: The song's data
+    :param PaginationLayout layout: The display's layout
+    :return tuple: (font family, font size)
+    """
+    if song_data['override_global']:
+        return song_data['font_family'], int(song_data['font_size'])
+    return layout.song_font_face, layout.song_font_size
+
+
+def get_song_footer_text(song_data, ccli_num):
+    """
+    Method to create the footer text shown beneath a song's lyrics
+    :param dict song_data: The song's data
+    :param str ccli_num: The user's CCLI license number
+    :return str: The footer text, or an empty string if the song doesn't use a footer
+    """
+    footer_text = ''
+    if song_data['use_footer'] or song_data['use_footer'] == 'True':
+        if len(song_data['author']) > 0:
+            footer_text += song_data['author']
+        if len(song_data['copyright']) > 0:
+            footer_text += '\n\u00A9' + song_data['copyright'].replace('\n', ' ')
+        if len(song_data['ccli_song_number']) > 0:
+            footer_text += '\nCCLI Song #: ' + song_data['ccli_song_number']
+        if len(ccli_num) > 0:
+            footer_text += '\nCCLI License #: ' + ccli_num
+    return footer_text
+
+
+def get_song_cache_key(song_data, layout):
+    """
+    Method to get the key a song's pagination is cached under for the given layout
+    :param dict song_data: The song's data
+    :param PaginationLayout layout: The display's layout
+    :return str: The key
+    """
+    font_face, font_size = get_song_font(song_data, layout)
+    return get_song_pagination_key(
+        song_data['text'],
+        song_data['verse_order'],
+        font_face,
+        font_size,
+        get_song_footer_text(song_data, layout.ccli_num),
+        layout.footer_font_size,
+        (layout.display_width, layout.display_height)
+    )
+
+
+def paginate_song(song_data, layout, pagination_cache=None):
+    """
+    Method to take the stored lyrics of a song and split them into slides according to their segment markers (i.e.
+    [V1]), splitting any segment in half that is too tall for the display. Safe to call from any thread.
+    :param dict song_data: The song's data
+    :param PaginationLayout layout: The display's layout
+    :param PaginationCache pagination_cache: Optional, a cache to look the song's slides up in and store them to
+    :return list of dict: The slides, as {'title', 'text'}, or None if the song has no lyrics
+    """
+    if 'text' not in song_data.keys() or len(song_data['text'].strip()) == 0:
+        return
+
+    # the song's slides only need to be worked out again if its lyrics, font, footer, or the display have changed
+    # since they were last cached
+    cache_key = None
+    if pagination_cache:
+        cache_key = get_song_cache_key(song_data, layout)
+        segments = pagination_cache.get(cache_key)
+        if segments is not None:
+            return segments
+
+    # start by building a dictionary of segment text keyed to their corresponding tags
+    lyric_dictionary = get_lyric_segments(song_data['text'])
+
+    # then, build a list of song segments in their proper order with user-friendly tag names
+    segments = []
+    if len(song_data['verse_order']) > 0:
+        song_order = song_data['verse_order']
+        if ',' in song_order:
+            song_order = song_order.replace(', ', ' ')
+            song_order = song_order.replace(',', ' ')
+        song_order = MULTIPLE_SPACE_PATTERN.sub(' ', song_order)
+        iterable = song_order.split(' ')
+        for i in range(len(iterable)):
+            iterable[i] = '[' + iterable[i] + ']'
+    else:
+        iterable = lyric_dictionary
+
+    # the font and footer are the same for every segment
+    font_face, font_size = get_song_font(song_data, layout)
+    footer_height = get_footer_height(get_song_footer_text(song_data, layout.ccli_num), font_face, layout)
+    target_height = get_target_height(footer_height, layout)
+
+    for segment in iterable:
+        segment_title = get_segment_title(segment)
+        segment_text = lyric_dictionary.get(segment, '')
+        segment_text = '<p style="text-align: center; line-height: 120%;">' + segment_text + '</p>'
+
+        # check each segment against the display's height to see if that segment's text needs to be split in half
+        if get_text_height(segment_text, font_face, font_size, layout) > target_height:
+            segment_text_split = BREAK_PATTERN.split(segment_text)
+            half_lines = int(len(segment_text_split) / 2)
+
+            halves = [[], []]
+            for i in range(half_lines):
+                halves[0].append(segment_text_split[i])
+
+            for i in range(half_lines, len(segment_text_split)):
+                halves[1].append(segment_text_split[i])
+
+            half_num = 1
+            for half in halves:
+                text = '<br />'.join(half)
+
+                if text.startswith('<p'):
+                    text = text + '</p>'
+                else:
+                    text = '<p style="text-align: center; line-height: 120%;">' + text
+
+                # double-check for missing tags
+                if '</b>' in text and '<b>' not in text:
+                    text = '<b>' + text
+                if '</i>' in text and '<i>' not in text:
+                    text = '<i>' + text
+                if '</u>' in text and '<u>' not in text:
+                    text = '<u>' + text
+
+                if '<b>' in text and '</b>' not in text:
+                    text = text + '</b>'
+                if '<i>' in text and '</i>' not in text:
+                    text = text + '</i>'
+                if '<u>' in text and '</u>' not in text:
+                    text = text + '</u>'
+
+                segments.append({'title': segment_title + ' - ' + str(half_num), 'text': text})
+                half_num += 1
+        else:
+            segments.append({'title': segment_title, 'text': segment_text})
+
+    if cache_key:
+        pagination_cache.put(cache_key, segments)
+    return segments
+
+
+def split_custom_scripture(text):
+    """
+    Method to split an edited scripture passage, given as a single string, into its verses and their verse numbers
+    :param str text: The passage
+    :return list of list of str: [verse number, verse text] for each verse
+    """
+    verse_numbers = []
+    skip_next = False
+    for i in range(len(text)):
+        if text[i].isnumeric() and not skip_next:
+            verse_number = text[i]
+            if i < len(text) - 1 and text[i + 1].isnumeric():
+                verse_number += text[i + 1]
+                skip_next = True
+            verse_numbers.append(verse_number)
+        else:
+            skip_next = False
+
+    text_split = []
+    for i in range(len(verse_numbers)):
+        verse_index = text.index(verse_numbers[i])
+        number_length = len(verse_numbers[i])
+        if i < len(verse_numbers) - 1:
+            text_split.append(
+                [
+                    verse_numbers[i],
+                    text[verse_index + number_length:text.index(verse_numbers[i + 1])]
+                ]
+            )
+        else:
+            text_split.append([verse_numbers[i], text[verse_index + number_length:]])
+    return text_split
+
+
+def paginate_scripture_by_verse(text, layout):
+    """
+    Method to split a passage of scripture according to how many verses will fit on the display, given the global
+    bible font. Safe to call from any thread.
+    :param list of str text: The bible passage to be split, as [verse number, verse text] pairs, or a single string if
+        it was edited
+    :param PaginationLayout layout: The display's layout
+    :return tuple: (list of str slide texts, bool whether a verse was too long to fit on the display)
+    """
+    # In the event that a simple string is received instead of a list of stings, this is a custom scripture passage
+    # that needs to be parsed into verses and their corresponding verse numbers
+    if type(text) is str:
+        text = split_custom_scripture(text)
+
+    font_face = layout.bible_font_face
+    font_size = layout.bible_font_size
+    footer_height = get_footer_height(SCRIPTURE_FOOTER_PLACEHOLDER, font_face, layout)
+    target_height = get_target_height(footer_height, layout)
+
+    slide_texts = []
+    verse_index = 0
+    segment_indices = []
+    current_segment_index = 0
+    recursion_count = 0
+    parse_failed = False
+    while verse_index < len(text):
+        if recursion_count > len(text):
+            parse_failed = True
+            break
+        recursion_count += 1
+
+        # keep adding verses until the text overflows the display, remove the last verse, and add to the slide texts
+        segment_indices.append([])
+        count = 0
+        slide_text = ''
+        text_height = get_text_height(slide_text, font_face, font_size, layout)
+        while text_height < target_height:
+            if count > 0:
+                if verse_index < len(text):
+                    slide_text = slide_text + ' ' + text[verse_index][0] + ' ' + text[verse_index][1]
+                    text_height = get_text_height(slide_text, font_face, font_size, layout)
+                else:
+                    break
+            else:
+                slide_text = text[verse_index][0] + ' ' + text[verse_index][1]
+                text_height = get_text_height(slide_text, font_face, font_size, layout)
+
+            segment_indices[current_segment_index].append(verse_index)
+            count += 1
+            verse_index += 1
+
+        if len(segment_indices[current_segment_index]) > 1:
+            if not verse_index == len(text):
+                segment_indices[current_segment_index].pop(len(segment_indices[current_segment_index]) - 1)
+                verse_index -= 1
+            elif verse_index == len(text) and text_height > target_height:
+                segment_indices[current_segment_index].pop(len(segment_indices[current_segment_index]) - 1)
+                verse_index -= 1
+
+        elif not verse_index == len(text):
+            verse_index -= 1
+        current_segment_index += 1
+
+    if parse_failed:
+        for verse in text:
+            if len(verse[1].strip()) > 0:
+                slide_texts.append(verse[0] + ' ' + verse[1])
+    else:
+        for indices in segment_indices:
+            if len(indices) > 0:
+                current_segment = ''
+                for index in indices:
+                    current_segment += text[index][0] + ' ' + text[index][1] + ' '
+                slide_texts.append(current_segment.strip())
+
+    return slide_texts, parse_failed
@@ -0,0 +1,157 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from dataHandling.serviceFormat import get_fingerprint
+
+# increment whenever the way songs are split into slides changes, so that paginations cached before then are not used
+PAGINATION_VERSION = 3
+
+# the number of paginations kept in the database before the least recently used are evicted
+MAX_STORED_PAGINATIONS = 2000
+
+# the number of paginations also kept in memory so that repeat lookups don't need the database
+MAX_MEMORY_PAGINATIONS = 200
+
+
+def get_song_pagination_key(lyrics, verse_order, font_face, font_size, footer_text, footer_font_size, display_size):
+    """
+    Method to create the key a song's pagination is cached under: a hash of everything that decides how its lyrics
+    are split into slides
+    :param str lyrics: The song's stored lyrics
+    :param str verse_order: The song's verse order
+    :param str font_face: The font family the lyrics are shown in
+    :param int font_size: The font size the lyrics are shown at
+    :param str footer_text: The text of the song's footer, or an empty string if it has none
+    :param int footer_font_size: The footer's font size
+    :param tuple display_size: (width, height) of the display
+    :return str: The key
+    """
+    return get_fingerprint([
+        PAGINATION_VERSION,
+        lyrics,
+        verse_order,
+        font_face,
+        font_size,
+        footer_text,
+        footer_font_size,
+        list(display_size)
+    ])
+
+
+class PaginationCache:
+    """
+    Provides a persistent cache of song paginations, stored in the database's paginationCache table with a small
+    in-memory cache in front of it. The least recently used paginations are evicted once MAX_STORED_PAGINATIONS is
+    exceeded. Safe to use from more than one thread.
+    :param str database: The location of the database file
+    """
+    def __init__(self, database):
+        """
+        Provides a persistent cache of song paginations, stored in the database's paginationCache table with a small
+        in-memory cache in front of it.
+        :param str database: The location of the database file
+        """
+        self.database = database
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Method to get a cached pagination
+        :param str key: The pagination's key, from get_song_pagination_key
+        :return list of dict: The pagination, or None if it isn't cached
+        """
+        with self.lock:
+            parsed_text = self.memory.get(key)
+            if parsed_text is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return json.loads(parsed_text)
+
+        parsed_text = None
+        connection = None
+        try:
+            connection = sqlite3.connect(self.database)
+            cursor = connection.cursor()
+            result = cursor.execute(
+                'SELECT parsedText FROM paginationCache WHERE cacheKey = ?', (key,)).fetchone()
+            if result:
+                parsed_text = result[0]
+                cursor.execute('UPDATE paginationCache SET lastUsed = ? WHERE cacheKey = ?', (time.time(), key))
+                connection.commit()
+            connection.close()
+        except sqlite3.Error:
+            if connection:
+                connection.close()
+
+        with self.lock:
+            if parsed_text is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.remember(key, parsed_text)
+        return json.loads(parsed_text)
+
+    def put(self, key, parsed_text):
+        """
+        Method to cache a pagination, evicting the least recently used paginations if the cache is full
+        :param str key: The pagination's key, from get_song_pagination_key
+        :param list of dict parsed_text: The pagination
+        """
+        parsed_text = json.dumps(parsed_text)
+        with self.lock:
+            self.remember(key, parsed_text)
+
+        connection = None
+        try:
+            connection = sqlite3.connect(self.database)
+            cursor = connection.cursor()
+            cursor.execute(
+                'INSERT OR REPLACE INTO paginationCache (cacheKey, parsedText, lastUsed) VALUES (?, ?, ?)',
+                (key, parsed_text, time.time())
+            )
+            count = cursor.execute('SELECT COUNT(*) FROM paginationCache').fetchone()[0]
+            if count > MAX_STORED_PAGINATIONS:
+                cursor.execute(
+                    'DELETE FROM paginationCache WHERE cacheKey IN '
+                    '(SELECT cacheKey FROM paginationCache ORDER BY lastUsed ASC LIMIT ?)',
+                    (count - MAX_STORED_PAGINATIONS,)
+                )
+            connection.commit()
+            connection.close()
+        except sqlite3.Error:
+            if connection:
+                connection.close()
+
+    def remember(self, key, parsed_text):
+        """
+        Method to add a pagination to the in-memory cache. The lock must be held when calling this.
+        :param str key: The pagination's key
+        :param str parsed_text: The pagination, as JSON
+        """
+        self.memory[key] = parsed_text
+        self.memory.move_to_end(key)
+        while len(self.memory) > MAX_MEMORY_PAGINATIONS:
+            self.memory.popitem(last=False)
+
+    def clear(self):
+        """
+        Method to remove every cached pagination
+        """
+        with self.lock:
+            self.memory.clear()
+
+        connection = None
+        try:
+            connection = sqlite3.connect(self.database)
+            connection.execute('DELETE FROM paginationCache')
+            connection.commit()
+            connection.close()
+        except sqlite3.Error:
+            if connection:
+                connection.close()
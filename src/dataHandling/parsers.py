@@ -1,308 +1,16 @@
-import re
-
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QColor
 from PyQt5.QtWidgets import QMessageBox
 
+from dataHandling.pagination import get_pagination_layout, paginate_song, paginate_scripture_by_verse
+
 
 def parse_song_data(gui, song_data):
     """
     Method to take the stored lyrics of a song and parse them out according to their segment markers (i.e. [V1])
     :param GUI gui: The current instance of GUI
-    :param str lyrics: The raw lyrics data
-    """
-    if 'text' not in song_data.keys() or len(song_data['text'].strip()) == 0:
-        return
-    # start by building a dictionary of segment text keyed to their corresponding tags
-    lyric_dictionary = {}
-    lyrics = song_data['text']
-    if '<body' in lyrics:
-        lyrics_split = re.split('<body.*?>', lyrics)
-        lyrics = lyrics_split[1].split('</body>')[0].strip()
-        lyrics = re.sub('<p.*?>', '<p style="text-align: center;">', lyrics)
-
-    segment_markers = re.findall(r'\[.*?]', lyrics)
-    segment_split = re.split(r'\[.*?]', lyrics)
-
-    if len(segment_markers) > 0:
-        for i in range(len(segment_markers)):
-            try:
-                this_segment = segment_split[i + 1]
-                lyric_dictionary.update({segment_markers[i]: this_segment.strip()})
-            except IndexError:
-                lyric_dictionary.update({segment_markers[i]: segment_split[i + 1].strip()})
-    else:
-        lyrics_split = lyrics.split('<br /><br />')
-        for i in range(len(lyrics_split)):
-            if len(lyrics_split[i].strip()) > 0:
-                lyric_dictionary.update({f'[Verse {i + 1}]': lyrics_split[i].strip()})
-
-    new_dict = {}
-    for key in lyric_dictionary:
-        if ' ' in key:
-            key_text = key.replace('[', '').replace(']', '')
-            new_key = key_text.split(' ')[0][0].lower() + key_text.split(' ')[1]
-            new_dict['[' + new_key + ']'] = lyric_dictionary[key]
-        else:
-            new_dict[key] = lyric_dictionary[key]
-    lyric_dictionary = new_dict
-
-    # then, build a list of song segments in their proper order with user-friendly tag names
-    segments = []
-    if len(song_data['verse_order']) > 0:
-        song_order = song_data['verse_order']
-        if ',' in song_order:
-            song_order = song_order.replace(', ', ' ')
-            song_order = song_order.replace(',', ' ')
-        song_order = re.sub(' +', ' ', song_order)
-        iterable = song_order.split(' ')
-        for i in range(len(iterable)):
-            iterable[i] = '[' + iterable[i] + ']'
-    else:
-        iterable = lyric_dictionary
-
-    for segment in iterable:
-        item_num = [i for i in segment if i.isdigit()]
-
-        if 'v' in segment:
-            segment_title = 'Verse ' + ''.join(item_num)
-        elif 'c' in segment:
-            segment_title = 'Chorus ' + ''.join(item_num)
-        elif 'p' in segment:
-            segment_title = 'Pre-Chorus ' + ''.join(item_num)
-        elif 'b' in segment:
-            segment_title = 'Bridge ' + ''.join(item_num)
-        elif 't' in segment:
-            segment_title = 'Tag ' + ''.join(item_num)
-        else:
-            segment_title = 'Ending ' + ''.join(item_num)
-
-        try:
-            segment_text = lyric_dictionary[segment].strip()
-            segment_text = re.sub('<p.*?>', '', segment_text)
-            segment_text = segment_text.replace('</p>', '')
-            segment_text = segment_text.replace('\n', '<br />')
-            segment_text = segment_text.replace('&quot;', '"')
-        except Exception:
-            segment_text = ''
-            pass
-
-        while segment_text.startswith('<br />'):
-            segment_text = segment_text[6:]
-        while segment_text.endswith('<br />'):
-            segment_text = segment_text[:len(segment_text) - 6]
-
-        # replace html for bold, italic, and underline with simple tags to be formatted later
-        if 'span' in segment_text and 'italic' in segment_text:
-            italicized_text = re.findall('<span style=" font-style:italic;">.*?</span>', segment_text)
-            for text in italicized_text:
-                new_text = re.sub('<span.*?italic.*?>', '<i>', text)
-                new_text = re.sub('</span>', '</i>', new_text)
-                segment_text = segment_text.replace(text, new_text)
-
-        if 'span' in segment_text and 'font-weight' in segment_text:
-            bold_text = re.findall('<span style=" font-weight:700;">.*?</span>', segment_text)
-            for text in bold_text:
-                new_text = re.sub('<span.*?font-weight.*?>', '<b>', text)
-                new_text = re.sub('</span>', '</b>', new_text)
-                segment_text = segment_text.replace(text, new_text)
-
-        if 'span' in segment_text and 'text-decoration' in segment_text:
-            underline_text = re.findall('<span.*?text-decoration.*?5px;">.*?</span>', segment_text)
-            for text in underline_text:
-                new_text = re.sub('<span.*?text-decoration.*?>', '<u>', text)
-                new_text = re.sub('</span>', '</u>', new_text)
-                segment_text = segment_text.replace(text, new_text)
-
-        # set the font, using the song's font data if override_global is True
-        if song_data['override_global']:
-            font_face = song_data['font_family']
-            font_size = int(song_data['font_size'])
-            font_color = song_data['font_color']
-
-            if 'global' in str(song_data['use_shadow']):
-                use_shadow = gui.main.settings['song_use_global']
-            else:
-                use_shadow = song_data['use_shadow']
-
-            if 'global' in str(song_data['shadow_color']):
-                shadow_color = gui.main.settings['song_shadow_color']
-            else:
-                shadow_color = song_data['shadow_color']
-
-            if 'global' in str(song_data['shadow_offset']):
-                shadow_offset = gui.main.settings['song_shadow_offset']
-            else:
-                shadow_offset = song_data['shadow_offset']
-
-            if 'global' in str(song_data['use_outline']):
-                use_outline = gui.min.settings['song_use_outline']
-            else:
-                use_outline = song_data['use_outline']
-
-            if 'global' in str(song_data['outline_color']):
-                outline_color = gui.main.settings['song_outline_color']
-            else:
-                outline_color = song_data['outline_color']
-
-            if 'global' in str(song_data['outline_width']):
-                outline_width = gui.main.settings['song_outline_width']
-            else:
-                outline_width = song_data['outline_width']
-        else:
-            font_face = gui.main.settings['song_font_face']
-            font_size = gui.main.settings['song_font_size']
-            font_color = gui.main.settings['song_font_color']
-            use_shadow = gui.main.settings['song_use_shadow']
-            shadow_color = gui.main.settings['song_shadow_color']
-            shadow_offset = gui.main.settings['song_shadow_offset']
-            use_outline = gui.main.settings['song_use_outline']
-            outline_color = gui.main.settings['song_outline_color']
-            outline_width = gui.main.settings['song_outline_width']
-
-        lyric_widget = gui.sample_lyric_widget
-
-        lyric_widget.setFont(QFont(font_face, font_size, QFont.Weight.Bold))
-        lyric_widget.footer_label.setFont(QFont(font_face, gui.global_footer_font_size))
-        lyric_widget.use_shadow = use_shadow
-        lyric_widget.shadow_color = QColor(shadow_color, shadow_color, shadow_color)
-        lyric_widget.shadow_offset = shadow_offset
-        lyric_widget.use_outline = use_outline
-        lyric_widget.outline_color = QColor(outline_color, outline_color, outline_color)
-        lyric_widget.outline_width = outline_width
-
-        segment_text = '<p style="text-align: center; line-height: 120%;">' + segment_text + '</p>'
-
-        segment_text = re.sub('<span.*?>', '', segment_text)
-        segment_text = re.sub('</span>', '', segment_text)
-        gui.sample_lyric_widget.setText(segment_text)
-
-        segment_count = 1
-
-        footer_text = ''
-        footer_height = 0
-        if song_data['use_footer'] or song_data['use_footer'] == 'True':
-            if len(song_data['author']) > 0:
-                footer_text += song_data['author']
-            if len(song_data['copyright']) > 0:
-                footer_text += '\n\u00A9' + song_data['copyright'].replace('\n', ' ')
-            if len(song_data['ccli_song_number']) > 0:
-                footer_text += '\nCCLI Song #: ' + song_data['ccli_song_number']
-            if len(gui.main.settings['ccli_num']) > 0:
-                footer_text += '\nCCLI License #: ' + gui.main.settings['ccli_num']
-            gui.sample_lyric_widget.footer_label.setText(footer_text)
-            footer_height = gui.sample_lyric_widget.footer_label.height()
-
-        lyrics_rect, footer_height = gui.sample_lyric_widget.calculate_painted_text()
-        lyric_widget_height = lyrics_rect.height()
-        target_height = gui.display_widget.height() - footer_height - 40
-
-        # check each segment against the lyric widget's height to see if that segment's text needs to be split in half
-        if lyric_widget_height > target_height:
-            segment_text_split = re.split('<br.*?/>', segment_text)
-            half_lines = int(len(segment_text_split) / 2)
-
-            halves = [[], []]
-            for i in range(half_lines):
-                halves[0].append(segment_text_split[i])
-
-            for i in range(half_lines, len(segment_text_split)):
-                halves[1].append(segment_text_split[i])
-
-            half_num = 1
-            for half in halves:
-                text = '<br />'.join(half)
-
-                if text.startswith('<p'):
-                    text = text + '</p>'
-                else:
-                    text = '<p style="text-align: center; line-height: 120%;">' + text
-
-                segment_count += 1
-
-                # double-check for missing tags
-                if '</b>' in text and '<b>' not in text:
-                    text = '<b>' + text
-                if '</i>' in text and '<i>' not in text:
-                    text = '<i>' + text
-                if '</u>' in text and '<u>' not in text:
-                    text = '<u>' + text
-
-                if '<b>' in text and '</b>' not in text:
-                    text = text + '</b>'
-                if '<i>' in text and '</i>' not in text:
-                    text = text + '</i>'
-                if '<u>' in text and '</u>' not in text:
-                    text = text + '</u>'
-
-                segments.append({'title': segment_title + ' - ' + str(half_num), 'text': text})
-                half_num += 1
-        else:
-            segments.append({'title': segment_title, 'text': segment_text})
-
-    return segments
-
-def parse_scripture_item(gui, text):
-    """
-    Method to take a scripture passage and divide it up according to what will fit on the screen given the current
-    font and size.
-    :param GUI gui: The current instance of GUI
-    :param str text: The scripture text to be parsed
+    :param dict song_data: The song's data
     """
-    gui.sample_lyric_widget.lyric_label.setFont(
-        QFont(gui.global_font_face, gui.global_font_size, QFont.Weight.Bold))
-    gui.sample_lyric_widget.lyric_label.setText(
-        '<p style="text-align: center; line-height: 120%;">' + text + '<p>')
-    gui.sample_lyric_widget.footer_label.setText('bogus reference') # just a placeholder
-    gui.sample_lyric_widget.lyric_label.adjustSize()
-
-    slide_texts = []
-    if gui.sample_lyric_widget.lyric_label.sizeHint().height() > 920:
-        words = text.split(' ')
-
-        gui.sample_lyric_widget.lyric_label.setText('<p style="text-align: center; line-height: 120%;">')
-        gui.sample_lyric_widget.lyric_label.adjustSize()
-        count = 0
-        word_index = 0
-        segment_indices = []
-        current_segment_index = 0
-        while word_index < len(words) - 1:
-            segment_indices.append([])
-            while (gui.sample_lyric_widget.lyric_label.sizeHint().height() <= 920 and word_index < len(words) - 1):
-                if count > 0:
-                    gui.sample_lyric_widget.lyric_label.setText(
-                        gui.sample_lyric_widget.lyric_label.text().replace(
-                            '</p>', '') + ' ' + words[word_index].strip() + ' </p>')
-                else:
-                    gui.sample_lyric_widget.lyric_label.setText(
-                        '<p style="text-align: center; line-height: 120%;">' + words[
-                            word_index].strip() + ' </p>')
-                gui.sample_lyric_widget.lyric_label.adjustSize()
-                segment_indices[current_segment_index].append(word_index)
-                word_index += 1
-                count += 1
-
-            if len(segment_indices[current_segment_index]) > 1 and word_index < len(words) - 1:
-                segment_indices[current_segment_index].pop(len(segment_indices[current_segment_index]) - 1)
-                word_index -= 1
-                current_segment_index += 1
-            elif word_index == len(words) - 1:
-                segment_indices[current_segment_index].append(word_index)
-
-            gui.sample_lyric_widget.lyric_label.setText('<p style="text-align: center; line-height: 120%;">')
-            gui.sample_lyric_widget.lyric_label.adjustSize()
-            count = 0
+    return paginate_song(song_data, get_pagination_layout(gui), gui.pagination_cache)
 
-        for indices in segment_indices:
-            if len(indices) > 0:
-                current_segment = ''
-                for index in indices:
-                    current_segment += words[index] + ' '
-                slide_texts.append(current_segment)
-    else:
-        slide_texts.append(f'<p style="text-align: center; line-height: 120%;">{text}</p>')
-
-    return slide_texts
 
 def parse_scripture_by_verse(gui, text):
     """
@@ -311,111 +19,29 @@ def parse_scripture_by_verse(gui, text):
     :param GUI gui: The current instance of GUI
     :param list of str text: The bible passage to be split
     """
-    # configure the hidden sample widget according to the current font
-    gui.sample_lyric_widget.setFont(QFont(gui.main.settings['bible_font_face'], gui.main.settings['bible_font_size']))
-    gui.sample_lyric_widget.footer_label.setText('bogus reference') # just a placeholder
-
-    # get the size values for the lyric widget, footer label, and font metrics
-    slide_texts = []
-
-    # In the event that a simple string is received instead of a list of stings, this is a custom scripture passage
-    # that needs to be parsed into verses and their corresponding verse numbers
-    if type(text) is str:
-        verse_numbers = []
-        skip_next = False
-        for i in range(len(text)):
-            if text[i].isnumeric() and not skip_next:
-                verse_number = text[i]
-                if i < len(text) - 1 and text[i + 1].isnumeric():
-                    verse_number += text[i + 1]
-                    skip_next = True
-                verse_numbers.append(verse_number)
-            else:
-                skip_next = False
-
-        text_split = []
-        for i in range(len(verse_numbers)):
-            verse_index = text.index(verse_numbers[i])
-            number_length = len(verse_numbers[i])
-            if i < len(verse_numbers) - 1:
-                text_split.append(
-                    [
-                        verse_numbers[i],
-                        text[verse_index + number_length:text.index(verse_numbers[i + 1])]
-                    ]
-                )
-            else:
-                text_split.append([verse_numbers[i], text[verse_index + number_length:]])
-        text = text_split
-
-    verse_index = 0
-    segment_indices = []
-    current_segment_index = 0
-    recursion_count = 0
-    parse_failed = False
-    while verse_index < len(text):
-        if recursion_count > len(text):
-            parse_failed = True
-            break
-        recursion_count += 1
-
-        # keep adding verses until the text overflows its widget, remove the last verse, and add to the slide texts
-        segment_indices.append([])
-        count = 0
-        gui.sample_lyric_widget.setText('')
-        lyrics_rect, footer_height = gui.sample_lyric_widget.calculate_painted_text()
-        target_height = gui.display_widget.height() - footer_height - 40
-        while lyrics_rect.height() < target_height:
-            if count > 0:
-                if verse_index < len(text):
-                    gui.sample_lyric_widget.setText(
-                        gui.sample_lyric_widget.text + ' ' + text[verse_index][0] + ' ' + text[verse_index][1])
-                    lyrics_rect, footer_height = gui.sample_lyric_widget.calculate_painted_text()
-                else:
-                    break
-            else:
-                gui.sample_lyric_widget.setText(text[verse_index][0] + ' ' + text[verse_index][1])
-                lyrics_rect, footer_height = gui.sample_lyric_widget.calculate_painted_text()
-
-            segment_indices[current_segment_index].append(verse_index)
-            count += 1
-            verse_index += 1
-
-        if len(segment_indices[current_segment_index]) > 1:
-            if not verse_index == len(text):
-                segment_indices[current_segment_index].pop(len(segment_indices[current_segment_index]) - 1)
-                verse_index -= 1
-            elif verse_index == len(text) and lyrics_rect.height() > target_height:
-                segment_indices[current_segment_index].pop(len(segment_indices[current_segment_index]) - 1)
-                verse_index -= 1
-
-        elif not verse_index == len(text):
-            verse_index -= 1
-        current_segment_index += 1
+    slide_texts, parse_failed = paginate_scripture_by_verse(text, get_pagination_layout(gui))
 
     # show an error message should parsing fail
     if parse_failed:
-        QMessageBox.information(
-            gui.main_window,
-            'Scripture parsing failed',
-            'A verse in this passage is too long to fit on the display screen. Consider decreasing the font '
-            'size or use a higher resolution display.',
-            QMessageBox.StandardButton.Ok
-        )
-        for verse in text:
-            if len(verse[1].strip()) > 0:
-                slide_texts.append(verse[0] + ' ' + verse[1])
-    else:
-        for indices in segment_indices:
-            if len(indices) > 0:
-                current_segment = ''
-                for index in indices:
-                    current_segment += text[index][0] + ' ' + text[index][1] + ' '
-                slide_texts.append(current_segment.strip())
+        show_scripture_parse_failed(gui)
 
     return slide_texts
 
 
+def show_scripture_parse_failed(gui):
+    """
+    Method to tell the user that a verse of a scripture passage is too long to fit on the display
+    :param GUI gui: The current instance of GUI
+    """
+    QMessageBox.information(
+        gui.main_window,
+        'Scripture parsing failed',
+        'A verse in this passage is too long to fit on the display screen. Consider decreasing the font '
+        'size or use a higher resolution display.',
+        QMessageBox.StandardButton.Ok
+    )
+
+
 class ParseScriptureReference:
     """
     Class to take a human-readable scripture reference and split/standardize it according to book, chapter(s) and verses
@@ -0,0 +1,138 @@
+import hashlib
+import json
+
+# the version of the service file format written by save_service. Version 1 files only stored each item's title and
+# type; version 2 files can also embed each item's data and pagination along with the fingerprints below.
+SERVICE_FORMAT_VERSION = 2
+
+# the item types whose data is embedded in service files
+EMBEDDED_TYPES = ('song', 'bible', 'custom_bible', 'custom')
+
+# the item types whose parsed_text is paginated to fit the display, and so depends on the layout fingerprint
+PAGINATED_TYPES = ('song', 'bible', 'custom_bible')
+
+# the parts of an item's data that determine what its slides contain and how they are split
+CONTENT_KEYS = (
+    'type',
+    'title',
+    'author',
+    'copyright',
+    'ccli_song_number',
+    'text',
+    'verse_order',
+    'use_footer',
+    'override_global',
+    'font_family',
+    'font_size',
+    'use_outline',
+    'outline_width',
+    'use_shadow',
+    'shadow_offset'
+)
+
+
+def get_fingerprint(values):
+    """
+    Method to hash a list of JSON-serializable values into a short fingerprint
+    :param values: The values
+    :return str: The fingerprint
+    """
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+
+def get_content_hash(item_data):
+    """
+    Method to fingerprint the parts of an item's data that its slides are made from
+    :param dict item_data: The item's data
+    :return str: The content hash
+    """
+    return get_fingerprint({key: item_data.get(key) for key in CONTENT_KEYS})
+
+
+def get_layout_fingerprint(gui, item_type):
+    """
+    Method to fingerprint everything outside an item's own data that affects how its text is split into slides: the
+    display's size and the global font and footer settings for its type
+    :param GUI gui: The current instance of GUI
+    :param str item_type: The item's type
+    :return str: The layout fingerprint
+    """
+    # imported here since the pagination module imports this one, through the pagination cache
+    from dataHandling.pagination import get_pagination_layout
+    return get_pagination_layout_fingerprint(get_pagination_layout(gui), item_type)
+
+
+def get_pagination_layout_fingerprint(layout, item_type):
+    """
+    Method to fingerprint a snapshot of the display's layout for an item type. Safe to call from any thread.
+    :param PaginationLayout layout: The display's layout
+    :param str item_type: The item's type
+    :return str: The layout fingerprint
+    """
+    prefix = 'song' if item_type == 'song' else 'bible'
+    return get_fingerprint([
+        SERVICE_FORMAT_VERSION,
+        layout.display_width,
+        layout.display_height,
+        layout.footer_font_size,
+        getattr(layout, f'{prefix}_font_face'),
+        getattr(layout, f'{prefix}_font_size'),
+        layout.ccli_num
+    ])
+
+
+def get_embeddable_data(item_data):
+    """
+    Method to copy the parts of an item's data that can be stored as JSON
+    :param dict item_data: The item's data
+    :return dict: The JSON-serializable data
+    """
+    data = {}
+    for key, value in item_data.items():
+        try:
+            json.dumps(value)
+        except TypeError:
+            continue
+        data[key] = value
+    return data
+
+
+def serialize_item(gui, item_data, embed_data):
+    """
+    Method to create the service file entry for an order of service item
+    :param GUI gui: The current instance of GUI
+    :param dict item_data: The item's data
+    :param bool embed_data: Whether to embed the item's data and pagination
+    :return dict: The entry
+    """
+    entry = {
+        'title': item_data['title'],
+        'type': item_data['type']
+    }
+    if item_data['type'] in ('custom_bible', 'custom'):
+        entry['text'] = item_data['parsed_text']
+
+    if embed_data and item_data['type'] in EMBEDDED_TYPES:
+        entry['content_hash'] = get_content_hash(item_data)
+        if item_data['type'] in PAGINATED_TYPES:
+            entry['layout_fingerprint'] = get_layout_fingerprint(gui, item_data['type'])
+        entry['data'] = get_embeddable_data(item_data)
+    return entry
+
+
+def get_saved_pagination(gui, entry, current_data=None):
+    """
+    Method to get the pagination embedded in a service file entry, if it is still valid: the display and fonts match
+    those it was saved with, and, if the item is still in the database, its content hasn't changed since
+    :param GUI gui: The current instance of GUI
+    :param dict entry: The service file entry
+    :param dict current_data: The item's data from the database, if it is there
+    :return: The saved parsed_text, or None if it has to be parsed again
+    """
+    if 'data' not in entry or not entry['data'].get('parsed_text'):
+        return None
+    if entry.get('layout_fingerprint') != get_layout_fingerprint(gui, entry['type']):
+        return None
+    if current_data is not None and entry.get('content_hash') != get_content_hash(current_data):
+        return None
+    return entry['data']['parsed_text']
@@ -0,0 +1,168 @@
+from PyQt5.QtCore import QPointF
+from PyQt5.QtGui import QFont, QFontMetricsF, QPainterPath
+
+from dataHandling.lyricMarkup import tokenize_styled_runs
+
+# the maximum number of cached advances before the cache is cleared
+MAX_CACHED_ADVANCES = 50000
+
+
+class FontMetricsCache:
+    """
+    Provides cached QFonts, QFontMetricsF, and text advances keyed by font family, size, and style so that measuring
+    the same word in the same font only has to be done once
+    """
+    def __init__(self):
+        """
+        Provides cached QFonts, QFontMetricsF, and text advances keyed by font family, size, and style so that
+        measuring the same word in the same font only has to be done once
+        """
+        self.fonts = {}
+        self.metrics = {}
+        self.advances = {}
+
+    def get_font(self, family, size, style=(False, False, False)):
+        """
+        Method to return the QFont for the given family, size, and style, creating it if necessary
+        :param str family: The font family
+        :param int size: The font's point size
+        :param tuple style: (bold, italic, underline)
+        :return QFont: The font
+        """
+        key = (family, size, style)
+        font = self.fonts.get(key)
+        if font is None:
+            font = QFont(family, size)
+            if style[0]:
+                font.setWeight(QFont.Weight.Bold)
+            font.setItalic(style[1])
+            font.setUnderline(style[2])
+            self.fonts[key] = font
+        return font
+
+    def get_metrics(self, family, size, style=(False, False, False)):
+        """
+        Method to return the QFontMetricsF for the given family, size, and style, creating it if necessary
+        :param str family: The font family
+        :param int size: The font's point size
+        :param tuple style: (bold, italic, underline)
+        :return QFontMetricsF: The font metrics
+        """
+        key = (family, size, style)
+        metrics = self.metrics.get(key)
+        if metrics is None:
+            metrics = QFontMetricsF(self.get_font(family, size, style))
+            self.metrics[key] = metrics
+        return metrics
+
+    def advance(self, family, size, style, text):
+        """
+        Method to return the horizontal advance of a piece of text, measuring it only if it hasn't been measured before
+        :param str family: The font family
+        :param int size: The font's point size
+        :param tuple style: (bold, italic, underline)
+        :param str text: The text to measure
+        :return float: The advance, in px
+        """
+        key = (family, size, style, text)
+        advance = self.advances.get(key)
+        if advance is None:
+            if len(self.advances) > MAX_CACHED_ADVANCES:
+                self.advances.clear()
+            advance = self.get_metrics(family, size, style).horizontalAdvance(text)
+            self.advances[key] = advance
+        return advance
+
+
+metrics_cache = FontMetricsCache()
+
+
+class LaidOutLine:
+    """
+    Provides a single wrapped line of text made up of (x, text, style) fragments
+    """
+    __slots__ = ('fragments', 'width')
+
+    def __init__(self):
+        """
+        Provides a single wrapped line of text made up of (x, text, style) fragments
+        """
+        self.fragments = []
+        self.width = 0.0
+
+
+def split_words(runs):
+    """
+    Method to split a line's styled runs into words, where each word is a list of (text, style) pieces. A word can
+    contain more than one piece if its styling changes partway through.
+    :param list of StyledRun runs: The runs of a single line
+    :return list of list of tuple: The words of the line
+    """
+    words = [[]]
+    for run in runs:
+        style = run.style()
+        pieces = run.text.split(' ')
+        for i in range(len(pieces)):
+            if i > 0:
+                words.append([])
+            if pieces[i]:
+                words[-1].append((pieces[i], style))
+    return words
+
+
+def wrap_text(text, family, size, max_width, cache=None):
+    """
+    Method to tokenize marked-up text and wrap it to the given width in a single pass over its words, using cached
+    advances for measurement
+    :param str text: The text, using <br /> or newlines for line breaks and <b>, <i>, <u> for styling
+    :param str family: The font family
+    :param int size: The font's point size
+    :param float max_width: The width, in px, that lines must fit within
+    :param FontMetricsCache cache: The cache to measure with; the module's shared cache if not given
+    :return list of LaidOutLine: The wrapped lines
+    """
+    if cache is None:
+        cache = metrics_cache
+    plain_style = (False, False, False)
+    space_width = cache.advance(family, size, plain_style, ' ')
+
+    laid_out_lines = []
+    for runs in tokenize_styled_runs(text):
+        line = LaidOutLine()
+        laid_out_lines.append(line)
+        x = 0.0
+        for word in split_words(runs):
+            word_width = 0.0
+            for piece_text, style in word:
+                word_width += cache.advance(family, size, style, piece_text)
+
+            # start a new line if this word would overflow the current one, unless it's the first word on the line
+            if line.fragments and x + word_width > max_width:
+                line = LaidOutLine()
+                laid_out_lines.append(line)
+                x = 0.0
+
+            for piece_text, style in word:
+                line.fragments.append((x, piece_text, style))
+                x += cache.advance(family, size, style, piece_text)
+            line.width = x
+            x += space_width
+
+    return laid_out_lines
+
+
+def build_line_path(line, family, size, cache=None):
+    """
+    Method to create a QPainterPath for a laid out line, with its baseline at y = 0
+    :param LaidOutLine line: The line to create a path for
+    :param str family: The font family
+    :param int size: The font's point size
+    :param FontMetricsCache cache: The cache to get fonts from; the module's shared cache if not given
+    :return QPainterPath: The line's path
+    """
+    if cache is None:
+        cache = metrics_cache
+    path = QPainterPath()
+    for x, piece_text, style in line.fragments:
+        path.addText(QPointF(x, 0), cache.get_font(family, size, style), piece_text)
+    return path
@@ -1,7 +1,6 @@
 import base64
 import json
 import os
-import re
 import shutil
 import sys
 import tempfile
@@ -23,17 +22,22 @@ from numpy.f2py.auxfuncs import throw_error
 from dataHandling import parsers, declarations
 from dataHandling.declarations import DEFAULT_SETTINGS
 from dataHandling.getGithubEvents import get_release_notes, show_notes
+from dataHandling.lyricMarkup import split_custom_slides, strip_paragraph_tags, strip_tags
+from dataHandling.pagination import get_pagination_layout
+from dataHandling.paginationCache import PaginationCache
 from dataHandling.parsers import parse_scripture_by_verse
 from gui.widgets.help import Help
 from importExport.importers import Importers
 from gui.widgets.liveWidget import LiveWidget
 from gui.widgets.mediaWidget import MediaWidget
 from gui.widgets.oosWidget import OOSWidget
+from gui.widgets.outputs import OutputRouter
 from importExport.openlyricsExport import OpenlyricsExport
 from gui.widgets.previewWidget import PreviewWidget
-from core.runnables import TimedPreviewUpdate, SlideAutoPlay, CountdownTimer
+from core.repaginator import Repaginator
+from core.runnables import TimedPreviewUpdate, SlideAutoPlay, CountdownTimer, StageFrameEncoder
 from gui.widgets.widgets import Toolbar, IndexedSettingsWidget, CustomMainWindow, DisplayWidget, \
-    LyricDisplayWidget, StandardItemWidget, CountdownWidget
+    LyricDisplayWidget, CountdownWidget, set_standard_item_data, SUBTITLE_ROLE
 from importExport.songselectImport import SongselectImport
 
 
@@ -52,6 +56,10 @@ class GUI(QObject):
     tool_bar = None
     current_file = None
     default_bible = None
+    pagination_cache = None
+    repaginator = None
+    repagination_timer = None
+    pagination_layout_key = None
 
     current_background = None
     global_song_background_pixmap = None
@@ -126,6 +134,8 @@ class GUI(QObject):
         self.grab_display_signal.connect(self.grab_display)
         self.server_alert_signal.connect(self.show_server_alert)
         self.change_current_live_item_signal.connect(self.change_current_live_item)
+        self.stage_frame_encoder = StageFrameEncoder(self.main)
+        self.output_router = OutputRouter(self)
         self.shadow_color = 0
         self.shadow_offset = 6
         self.widget_item_background_color = 'white'
@@ -141,6 +151,14 @@ class GUI(QObject):
         self.main.update_status_signal.emit('Checking Database Integrity', 'status')
         self.main.app.processEvents()
         self.main.check_db(self.main.database)
+        self.main.migrate_song_lyrics()
+        self.pagination_cache = PaginationCache(self.main.database)
+
+        # wait for a burst of font or display changes to settle before re-paginating the order of service
+        self.repagination_timer = QTimer()
+        self.repagination_timer.setSingleShot(True)
+        self.repagination_timer.setInterval(250)
+        self.repagination_timer.timeout.connect(self.check_pagination_layout)
 
         self.main.get_song_titles()
 
@@ -189,6 +207,7 @@ class GUI(QObject):
         self.make_special_display_widgets()
 
         self.position_screens(self.primary_screen, self.secondary_screen)
+        self.output_router.load_outputs()
         self.sample_widget.show()
         self.sample_widget.hide()
 
@@ -563,6 +582,9 @@ class GUI(QObject):
         view_web_messages_action = tool_menu.addAction('View Web Page Messages')
         view_web_messages_action.triggered.connect(self.view_web_messages)
 
+        server_diagnostics_action = tool_menu.addAction('Remote Server Diagnostics')
+        server_diagnostics_action.triggered.connect(self.view_server_diagnostics)
+
         tool_menu.addSeparator()
 
         settings_action = tool_menu.addAction('Settings')
@@ -765,11 +787,10 @@ class GUI(QObject):
         document_html = '<table>'
         for i in range(self.oos_widget.oos_list_widget.count()):
             item = self.oos_widget.oos_list_widget.item(i)
-            widget = self.oos_widget.oos_list_widget.itemWidget(item)
-            if widget:
-                pixmap = widget.icon.pixmap()
-                type = widget.subtitle.text()
-                title = widget.title.text()
+            pixmap = item.data(Qt.ItemDataRole.DecorationRole)
+            if pixmap:
+                type = item.data(SUBTITLE_ROLE)
+                title = item.data(Qt.ItemDataRole.DisplayRole)
 
                 byte_array = QByteArray()
                 buffer = QBuffer(byte_array)
@@ -975,6 +996,81 @@ class GUI(QObject):
 
         dialog.exec()
 
+    def view_server_diagnostics(self):
+        """
+        Provides a dialog showing the remote server's health and metrics, refreshed every second while it is open
+        """
+        dialog = QDialog(self.main_window)
+        layout = QVBoxLayout(dialog)
+
+        dialog.setWindowTitle('Remote Server Diagnostics')
+        dialog.setWindowIcon(QIcon('resources/branding/logo.svg'))
+        dialog.setMinimumWidth(800)
+        dialog.setMinimumHeight(600)
+
+        text_edit = QTextEdit()
+        text_edit.setFont(self.standard_font)
+        text_edit.setReadOnly(True)
+        layout.addWidget(text_edit)
+
+        def refresh():
+            remote_server = self.main.remote_server
+            health = remote_server.get_health()
+            summary = remote_server.metrics.get_summary()
+
+            heartbeat_age = 'none' if health['heartbeat_age'] is None else f'{health["heartbeat_age"]:.1f} s'
+            html = (
+                f'<h3>Server</h3>'
+                f'<p>Running: {health["running"]} ({health["backend"]})<br />'
+                f'Uptime: {health["uptime"]:.0f} s<br />'
+                f'Heartbeat age: {heartbeat_age}<br />'
+                f'Connected clients: {health["connected_clients"]} '
+                f'({", ".join(f"{page}: {count}" for page, count in health["clients_by_page"].items())})</p>'
+            )
+
+            html += '<h3>Emits</h3><table cellpadding="4"><tr><th>Event</th><th>Count</th><th>Bytes</th>' \
+                    '<th>Mean Latency</th></tr>'
+            for event, (count, payload_bytes, mean) in sorted(summary['emits'].items()):
+                html += f'<tr><td>{event}</td><td>{count}</td><td>{payload_bytes}</td>' \
+                        f'<td>{mean * 1000:.1f} ms</td></tr>'
+            html += '</table>'
+
+            frames, frame_bytes, mean = summary['encode']
+            html += (
+                f'<h3>Stage Frames</h3>'
+                f'<p>Encoded: {frames} ({frame_bytes} bytes)<br />'
+                f'Mean encode time: {mean * 1000:.1f} ms<br />'
+                f'Dropped: {self.stage_frame_encoder.dropped_frames}<br />'
+                f'JPEG quality: {self.stage_frame_encoder.quality}</p>'
+            )
+
+            html += '<h3>Requests</h3><table cellpadding="4"><tr><th>Route</th><th>Method</th><th>Count</th>' \
+                    '<th>Mean Time</th></tr>'
+            for (route, method), (count, mean) in sorted(summary['requests'].items()):
+                html += f'<tr><td>{route}</td><td>{method}</td><td>{count}</td><td>{mean * 1000:.1f} ms</td></tr>'
+            html += '</table>'
+
+            text_edit.setHtml(html)
+
+        refresh_timer = QTimer(dialog)
+        refresh_timer.timeout.connect(refresh)
+        refresh_timer.start(1000)
+        refresh()
+
+        button_widget = QWidget()
+        layout.addWidget(button_widget)
+        button_layout = QHBoxLayout(button_widget)
+
+        ok_button = QPushButton('OK')
+        ok_button.setFont(self.standard_font)
+        ok_button.pressed.connect(lambda: dialog.done(0))
+        button_layout.addStretch()
+        button_layout.addWidget(ok_button)
+        button_layout.addStretch()
+
+        dialog.exec()
+        refresh_timer.stop()
+
     def grab_display(self):
         """
         Provides a method to grab the display widget and scale it down as a preview.
@@ -985,19 +1081,7 @@ class GUI(QObject):
 
         try:
             if pixmap:
-                if 'mirror_stage_display' in self.main.settings.keys() and self.main.settings['mirror_stage_display']:
-                    buffer = QBuffer()
-                    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-
-                    success = pixmap.save(buffer, 'JPEG', 70)
-
-                    if success:
-                        jpg_bytes = buffer.data().data()
-                        self.main.remote_server.socketio.emit('update_display', [jpg_bytes, ''])
-                    else:
-                        print("Failed to save pixmap as JPEG!")
-
-                    buffer.close()
+                self.output_router.route(pixmap, use_text_layers=False)
                 pixmap = pixmap.scaled(
                     int(self.display_widget.width() / 5), int(self.display_widget.height() / 5),
                     Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
@@ -1195,6 +1279,36 @@ class GUI(QObject):
         except Exception:
             self.main.error_log()
 
+        self.schedule_repagination()
+
+    def schedule_repagination(self):
+        """
+        Method to check, once any further font or display changes have been made, whether the order of service's items
+        need to be split into slides again
+        """
+        if self.repagination_timer:
+            self.repagination_timer.start()
+
+    def check_pagination_layout(self):
+        """
+        Method to re-paginate the order of service's songs and scripture passages if the display's size or the global
+        fonts have changed since they were last paginated
+        """
+        # a service that is still loading is paginated with the settings it applies, so check again once it has loaded
+        if self.main.service_loader and not self.main.service_loader.finished:
+            self.repagination_timer.start()
+            return
+
+        layout = get_pagination_layout(self)
+        layout_key = tuple(getattr(layout, attribute) for attribute in layout.__slots__)
+        if layout_key == self.pagination_layout_key:
+            return
+        self.pagination_layout_key = layout_key
+
+        if not self.repaginator:
+            self.repaginator = Repaginator(self.main)
+        self.repaginator.start(layout)
+
     def new_service(self):
         """
         Provides a function for clearing the order of service, preview, and live list widgets.py when
@@ -1297,6 +1411,8 @@ class GUI(QObject):
             self.tool_bar.hide_display_button.setChecked(False)
             self.show_hide_display_screen()
 
+        self.schedule_repagination()
+
     def show_server_alert(self):
         """
         Provides a message box if the server check has failed.
@@ -1366,49 +1482,31 @@ class GUI(QObject):
     def send_to_preview(self, item):
         """
         Provides a method for sending an item, selected in the order of service list widget, to the preview list widget.
+        The item's slides are handed to the preview's model all at once, rather than building a widget for each slide.
         :param QListWidgetItem item: The item selected
         """
         if not item or not item.data(Qt.ItemDataRole.UserRole): # don't continue if there is no item or data dictionary
             return
         slide_data = item.data(Qt.ItemDataRole.UserRole).copy()
-        self.preview_widget.slide_list.clear()
+        slides = []
 
         if slide_data['type'] == 'song':
-            if len(slide_data['parsed_text']) > 0:
-                for segment in slide_data['parsed_text']:
-                    # reduce parsed text for this item to only this item's title and text
-                    slide_data['parsed_text'] = {
-                        'title': segment['title'],
-                        'text': segment['text']
-                    }
-                    list_item = QListWidgetItem()
-                    list_item.setData(Qt.ItemDataRole.UserRole, slide_data)
-
-                    lyric_widget = StandardItemWidget(
-                        self, slide_data['parsed_text']['title'], slide_data['parsed_text']['text'])
-                    list_item.setSizeHint(lyric_widget.sizeHint())
-                    self.preview_widget.slide_list.addItem(list_item)
-                    self.preview_widget.slide_list.setItemWidget(list_item, lyric_widget)
+            # reduce parsed text for each slide to only that slide's title and text
+            for segment in slide_data['parsed_text']:
+                slides.append(dict(slide_data, parsed_text={'title': segment['title'], 'text': segment['text']}))
 
         elif slide_data['type'] == 'custom':
             # parse the text if we're splitting it into individual slides
             slide_text = slide_data['text']
             if slide_data['split_slides']:
-                slide_text = re.sub(r'(<br />)\1+', '<split>', slide_text)
-                slide_data['parsed_text'] = re.split('<split>', slide_text)
+                slide_data['parsed_text'] = split_custom_slides(slide_text)
             else:
                 slide_data['parsed_text'] = [slide_text]
             item.setData(Qt.ItemDataRole.UserRole, slide_data)
 
             for text in slide_data['parsed_text']:
                 if len(text.strip()) > 0:
-                    lyric_widget = StandardItemWidget(self, slide_data['title'], text, wrap_subtitle=True)
-                    list_item = QListWidgetItem()
-                    slide_data['parsed_text'] = text
-                    list_item.setData(Qt.ItemDataRole.UserRole, slide_data)
-                    list_item.setSizeHint(lyric_widget.sizeHint())
-                    self.preview_widget.slide_list.addItem(list_item)
-                    self.preview_widget.slide_list.setItemWidget(list_item, lyric_widget)
+                    slides.append(dict(slide_data, parsed_text=text))
 
         elif slide_data['type'] == 'bible' or slide_data['type'] == 'custom_bible':
             title = slide_data['title']
@@ -1425,13 +1523,11 @@ class GUI(QObject):
             # find the verse range for each segment of scripture
             slide_texts = slide_data['parsed_text']
             for i in range(len(slide_texts)):
-                list_item = QListWidgetItem()
                 first_num_found = False
                 first_num = ''
                 last_num = ''
 
-                scripture_text = re.sub(
-                    '<.*?>', '', slide_texts[i])
+                scripture_text = strip_tags(slide_texts[i])
                 next_chapter = False
                 index = 0
                 while index < len(scripture_text): # iterate through the characters in this text to find all the numbers
@@ -1469,137 +1565,39 @@ class GUI(QObject):
                     else:
                         new_title = f'{book} {first_num}-{last_num}'
 
-                slide_data['type'] = 'bible'
-                slide_data['title'] = new_title
-                slide_data['parsed_text'] = slide_texts[i]
-                slide_data['author'] = slide_data['author']
-                list_item.setData(Qt.ItemDataRole.UserRole, slide_data)
-
-                lyric_widget = StandardItemWidget(self, new_title, slide_texts[i], None, True)
-                list_item.setSizeHint(lyric_widget.sizeHint())
-                self.preview_widget.slide_list.addItem(list_item)
-                self.preview_widget.slide_list.setItemWidget(list_item, lyric_widget)
-
-        elif slide_data['type'] == 'image':
-            lyric_widget = StandardItemWidget(self, slide_data['file_name'])
-            list_item = QListWidgetItem()
-            list_item.setData(Qt.ItemDataRole.UserRole, slide_data)
-            list_item.setSizeHint(lyric_widget.sizeHint())
-            self.preview_widget.slide_list.addItem(list_item)
-            self.preview_widget.slide_list.setItemWidget(list_item, lyric_widget)
-
-        elif slide_data['type'] == 'video':
-            self.preview_widget.slide_list.clear()
-
-            pixmap = QPixmap(
-                self.main.video_dir + '/' + slide_data['file_name'].split('.')[0] + '.jpg')
-            pixmap = pixmap.scaled(
-                96, 54, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-
-            widget = StandardItemWidget(
-                self, slide_data['file_name'].split('.')[0], '', pixmap)
-
-            list_item = QListWidgetItem()
-            list_item.setData(Qt.ItemDataRole.UserRole, slide_data)
-            list_item.setSizeHint(widget.sizeHint())
+                slides.append(dict(slide_data, type='bible', title=new_title, parsed_text=slide_texts[i]))
 
-            self.preview_widget.slide_list.addItem(list_item)
-            self.preview_widget.slide_list.setItemWidget(list_item, widget)
-
-        elif slide_data['type'] == 'web':
-            lyric_widget = StandardItemWidget(self, slide_data['title'], slide_data['url'])
-            list_item = QListWidgetItem()
-            list_item.setData(Qt.ItemDataRole.UserRole, slide_data)
-            list_item.setSizeHint(lyric_widget.sizeHint())
-            self.preview_widget.slide_list.addItem(list_item)
-            self.preview_widget.slide_list.setItemWidget(list_item, lyric_widget)
+        elif slide_data['type'] in ('image', 'video', 'web'):
+            slides.append(slide_data)
 
+        self.preview_widget.slide_list.set_slides(slides)
         self.preview_widget.slide_list.setFocus()
         self.preview_widget.slide_list.setCurrentRow(0)
 
     def send_to_live(self):
         """
         Method to send the current order of service item to live, using the current index of the preview widget,
-        if available.
+        if available. The live widget's model is given the preview's slides rather than copies of its widgets.
         """
         try:
             self.oos_widget.oos_list_widget.blockSignals(True)
             self.live_widget.blockSignals(True)
-            self.live_widget.slide_list.clear()
 
             item_index = self.preview_widget.slide_list.currentRow()
+            slides = list(self.preview_widget.slide_list.slides())
             item_data = declarations.SLIDE_DATA_DEFAULTS.copy()
-            for i in range(self.preview_widget.slide_list.count()):
-                original_item = self.preview_widget.slide_list.item(i)
-                item_data = original_item.data(Qt.ItemDataRole.UserRole).copy()
-                item = QListWidgetItem()
-                item.setData(Qt.ItemDataRole.UserRole, item_data)
-
-                if item_data['type'] == 'song':
-                    lyric_widget = StandardItemWidget(
-                        self,
-                        item_data['parsed_text']['title'],
-                        item_data['parsed_text']['text'],
-                        wrap_subtitle=True
-                    )
-                elif item_data['type'] == 'bible':
-                    lyric_widget = StandardItemWidget(
-                        self,
-                        item_data['title'],
-                        item_data['parsed_text'],
-                        wrap_subtitle=True
-                    )
-                elif item_data['type'] == 'custom':
-                    lyric_widget = StandardItemWidget(
-                        self,
-                        item_data['title'],
-                        item_data['parsed_text'],
-                        wrap_subtitle=True
-                    )
-                elif item_data['type'] == 'image':
-                    lyric_widget = StandardItemWidget(
-                        self, item_data['file_name'], '')
-                elif item_data['type'] == 'video':
-                    lyric_widget = StandardItemWidget(self, item_data['file_name'], '')
-                else:
-                    lyric_widget = StandardItemWidget(self, item_data['title'], item_data['url'], wrap_subtitle=True)
-
-                item.setSizeHint(lyric_widget.sizeHint())
-                self.live_widget.slide_list.addItem(item)
-                self.live_widget.slide_list.setItemWidget(item, lyric_widget)
+            if slides:
+                item_data = slides[-1]
+            self.live_widget.slide_list.set_slides(slides)
 
             if item_index:
                 self.live_widget.slide_list.setCurrentRow(item_index)
             else:
                 self.live_widget.slide_list.setCurrentRow(0)
 
-            # create the slide buttons to be sent to the remote web page
-            slide_buttons = ''
-            for i in range(self.live_widget.slide_list.count()):
-                slide_data = self.live_widget.slide_list.item(i).data(Qt.ItemDataRole.UserRole)
-                if isinstance(slide_data['parsed_text'], dict):
-                    title = slide_data['parsed_text']['title']
-                    text = slide_data['parsed_text']['text']
-                else:
-                    title = slide_data['title']
-                    text = slide_data['parsed_text']
-                text = text.replace('text-align: center', 'text-align: left')
-
-                if i == 0:
-                    class_tag = 'class="current"'
-                else:
-                    class_tag = ''
-
-                slide_buttons += f"""
-                    <button id="slide{str(i)}" {class_tag} type="submit" name="slide_button" value="{str(i)}">
-                        <span class="title">{title}</span>
-                        <br>
-                        <div class="text">{text}</div>
-                    </button>
-                    <br>"""
-            self.main.remote_server.socketio.emit('update_slides', slide_buttons)
-            self.main.remote_server.socketio.emit(
-                'change_current_oos', str(self.oos_widget.oos_list_widget.currentRow()))
+            # sync the web remotes with the new live item
+            self.main.remote_server.update_remote_slides()
+            self.main.remote_server.change_current_oos(self.oos_widget.oos_list_widget.currentRow())
 
             # send the next item in the order of service to the preview so the user can see what's next
             if self.oos_widget.oos_list_widget.currentRow() < self.oos_widget.oos_list_widget.count() - 1:
@@ -1786,6 +1784,10 @@ class GUI(QObject):
                 lyric_widget.shadow_color = QColor(
                     item_data['shadow_color'], item_data['shadow_color'], item_data['shadow_color'])
                 lyric_widget.shadow_offset = item_data['shadow_offset']
+                if item_data['type'] == 'song':
+                    lyric_widget.shadow_blur = self.main.settings['song_shadow_blur']
+                else:
+                    lyric_widget.shadow_blur = self.main.settings['bible_shadow_blur']
                 lyric_widget.use_outline = item_data['use_outline']
                 lyric_widget.outline_color = QColor(
                     item_data['outline_color'], item_data['outline_color'], item_data['outline_color'])
@@ -1809,6 +1811,7 @@ class GUI(QObject):
                     self.main.settings[f'{slide_type}_shadow_color']
                 )
                 lyric_widget.shadow_offset = self.main.settings[f'{slide_type}_shadow_offset']
+                lyric_widget.shadow_blur = self.main.settings[f'{slide_type}_shadow_blur']
                 lyric_widget.use_outline = self.main.settings[f'{slide_type}_use_outline']
                 lyric_widget.outline_color = QColor(
                     self.main.settings[f'{slide_type}_outline_color'],
@@ -1957,76 +1960,38 @@ class GUI(QObject):
 
             # change the preview image
             if widget == 'live':
-                full_size_pixmap = display_widget.grab(display_widget.rect())
-                pixmap = full_size_pixmap.scaled(
-                    int(display_widget.width() / 5),
-                    int(display_widget.height() / 5),
-                    Qt.AspectRatioMode.IgnoreAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                stage_html = re.sub('<p.*?>', '', lyrics_html)
-                stage_html = stage_html.replace('</p>', '')
+                stage_html = strip_paragraph_tags(lyrics_html)
                 stage_html = f'<p style="align-text: center;">{stage_html}</p>'
 
                 slide_number = self.live_widget.slide_list.currentRow() + 1
                 num_slides = self.live_widget.slide_list.count()
                 slide_info = f'Slide {slide_number} of {num_slides}'
 
-                if not item_data['type'] == 'web' and not item_data['type'] == 'video' and not auto_play_text:
-                    self.live_widget.preview_label.setPixmap(pixmap)
-
-                    if 'mirror_stage_display' in self.main.settings.keys() and self.main.settings['mirror_stage_display']:
-                        buffer = QBuffer()
-                        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-
-                        success = full_size_pixmap.save(buffer, 'JPEG', 70)
-
-                        if success:
-                            jpg_bytes = buffer.data().data()
-                            self.main.remote_server.socketio.emit('update_display', [jpg_bytes, slide_info])
-                        else:
-                            print("Failed to save pixmap as JPEG!")
-
-                        buffer.close()
-                    else:
-                        self.main.remote_server.update_stage_text(
-                            stage_html, self.main.settings['stage_font_size'], slide_info)
-                elif auto_play_text:
-                    self.live_widget.preview_label.setPixmap(pixmap)
-                    if 'mirror_stage_display' in self.main.settings.keys() and self.main.settings['mirror_stage_display']:
-                        buffer = QBuffer()
-                        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-
-                        success = full_size_pixmap.save(buffer, 'JPEG', 70)
-
-                        if success:
-                            jpg_bytes = buffer.data().data()
-                            self.main.remote_server.socketio.emit('update_display', [jpg_bytes, slide_info])
-                        else:
-                            print("Failed to save pixmap as JPEG!")
-
-                        buffer.close()
-                    else:
-                        self.main.remote_server.update_stage_text(
-                            stage_html, self.main.settings['stage_font_size'], slide_info)
-                else:
-                    if 'mirror_stage_display' in self.main.settings.keys() and self.main.settings[
-                            'mirror_stage_display']:
-                        buffer = QBuffer()
-                        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-
-                        success = full_size_pixmap.save(buffer, 'JPEG', 70)
-
-                        if success:
-                            jpg_bytes = buffer.data().data()
-                            self.main.remote_server.socketio.emit('update_display', [jpg_bytes, ''])
-                        else:
-                            print("Failed to save pixmap as JPEG!")
-
-                        buffer.close()
-                    else:
-                        self.main.remote_server.update_stage_text(
-                            stage_html, self.main.settings['stage_font_size'], '')
+                show_preview = not ((item_data['type'] == 'web' or item_data['type'] == 'video') and not auto_play_text)
+                if not show_preview:
+                    slide_info = ''
+
+                # the preview needs a grab of the display regardless; otherwise, only grab it if an output will use it
+                if show_preview or self.output_router.has_active_outputs():
+                    full_size_pixmap = display_widget.grab(display_widget.rect())
+                    if show_preview:
+                        pixmap = full_size_pixmap.scaled(
+                            int(display_widget.width() / 5),
+                            int(display_widget.height() / 5),
+                            Qt.AspectRatioMode.IgnoreAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation
+                        )
+                        self.live_widget.preview_label.setPixmap(pixmap)
+
+                    # one render of the slide feeds every output, including the stage view when it mirrors the
+                    # display; the lyric widget's text layers are left over from an earlier slide when it is hidden,
+                    # as for images
+                    self.output_router.route(
+                        full_size_pixmap, slide_info, use_text_layers=not self.lyric_widget.isHidden())
+                if not ('mirror_stage_display' in self.main.settings.keys()
+                        and self.main.settings['mirror_stage_display']):
+                    self.main.remote_server.update_stage_text(
+                        stage_html, self.main.settings['stage_font_size'], slide_info)
 
             elif widget == 'sample':
                 pixmap = display_widget.grab(display_widget.rect())
@@ -2080,7 +2045,7 @@ class GUI(QObject):
         return font_color
 
     def update_stage_image(self, jpg_bytes):
-        self.main.remote_server.socketio.emit('update_display', jpg_bytes)
+        self.main.remote_server.emit('update_display', jpg_bytes)
 
     def test_url(self, url):
         response = None
@@ -2329,13 +2294,14 @@ class GUI(QObject):
 
         self.live_widget.slide_list.setFocus()
 
-    def add_scripture_item(self, reference, text, version, scripture_edited):
+    def add_scripture_item(self, reference, text, version, scripture_edited, parsed_text=None):
         """
         Method to take a block of scripture and add it as a QListWidgetItem to the order of service widget.
         :param str reference: The scripture passage's reference from the bible
         :param list[str] text: The text of the scripture passage
         :param str version: The version of the bible this passage is from
         :param bool scripture_edited: Whether this text was edited
+        :param list[str] parsed_text: Optional, the passage already split into slides for the current display
         :return:
         """
 
@@ -2347,7 +2313,10 @@ class GUI(QObject):
             slide_data['type'] = 'bible'
         slide_data['title'] = reference
         slide_data['text'] = text
-        slide_data['parsed_text'] = parsers.parse_scripture_by_verse(self, text)
+        if parsed_text:
+            slide_data['parsed_text'] = parsed_text
+        else:
+            slide_data['parsed_text'] = parsers.parse_scripture_by_verse(self, text)
         slide_data['author'] = version
         item.setData(Qt.ItemDataRole.UserRole, slide_data)
 
@@ -2363,12 +2332,10 @@ class GUI(QObject):
         label_pixmap = self.global_bible_background_pixmap.scaled(
             50, 27, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
         if scripture_edited:
-            widget = StandardItemWidget(self, reference, 'Scripture (edited)', label_pixmap)
+            set_standard_item_data(item, reference, 'Scripture (edited)', label_pixmap)
         else:
-            widget = StandardItemWidget(self, reference, 'Scripture', label_pixmap)
-        item.setSizeHint(widget.sizeHint())
+            set_standard_item_data(item, reference, 'Scripture', label_pixmap)
         self.oos_widget.oos_list_widget.addItem(item)
-        self.oos_widget.oos_list_widget.setItemWidget(item, widget)
 
 
 class CustomWebEnginePage(QWebEnginePage):
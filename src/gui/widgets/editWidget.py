@@ -12,8 +12,9 @@ from PyQt5.QtWidgets import QDialog, QGridLayout, QLabel, QWidget, QHBoxLayout,
     QMenu, QAction
 
 from dataHandling import parsers
+from dataHandling.lyricMarkup import BREAK_PATTERN, normalize_lyrics, split_segments, strip_tags
 from gui.widgets.formattableTextEdit import FormattableTextEdit
-from gui.widgets.widgets import StandardItemWidget, PrintDialog, SimpleSplash, NewFontWidget
+from gui.widgets.widgets import PrintDialog, SimpleSplash, NewFontWidget
 
 
 class EditWidget(QDialog):
@@ -853,7 +854,7 @@ class EditWidget(QDialog):
 
         # check each segment against the lyric widget's height to see if that segment's text needs to be split in half
         if lyrics_height > target_height:
-            segment_text_split = re.split('<br.*?/>', lyrics_html)
+            segment_text_split = BREAK_PATTERN.split(lyrics_html)
             half_lines = int(len(segment_text_split) / 2)
             if half_lines > 1:
                 first_lyrics = ''
@@ -1003,9 +1004,9 @@ class EditWidget(QDialog):
         self.ccli_num_line_edit.setText(self.data['ccli_song_number'])
 
         lyrics = self.get_simplified_text(self.data['text'])
-        tag_list = re.findall(r'\[.*?]', lyrics, flags=re.S)
-        lyrics_split = re.split(r'\[.*?]', lyrics, flags=re.S)
-        lyrics_split.pop(0)
+        segments = split_segments(lyrics)
+        tag_list = [marker for marker, text in segments]
+        lyrics_split = [text for marker, text in segments]
 
         # Tags from some previous versions don't have the space character required in order to properly parse them.
         # Convert them to the new format.
@@ -1049,7 +1050,7 @@ class EditWidget(QDialog):
 
             plain_tag = tag_list[i].replace('[', '').replace(']', '').strip()
             plain_lyrics = lyrics_split[i].replace('<br />', '\n').strip()
-            plain_lyrics = re.sub('<.*?>', '', plain_lyrics).strip()
+            plain_lyrics = strip_tags(plain_lyrics).strip()
 
             all_lyrics += f'<span style="color: darkGreen;">{tag_list[i]}</span><br />'
             all_lyrics += f'{lyrics_split[i]}<br />'
@@ -1653,13 +1654,9 @@ class EditWidget(QDialog):
             tag = self.song_order_list_widget.item(i).text()
             song_order.append(tag)
 
-        lyric_tags = re.findall(r'\[.*?]', lyrics)
-        song_segments = re.split(r'\[.*?]', lyrics)
-        song_segments.pop(0)
-
         song_dict = {}
-        for i in range(len(lyric_tags)):
-            song_dict[lyric_tags[i].replace('[', '').replace(']', '')] = song_segments[i]
+        for marker, text in split_segments(lyrics):
+            song_dict[marker.replace('[', '').replace(']', '')] = text
 
         document = QTextDocument()
         document_html = (f'<span style="font-family: \'Arial\'; font-size: 16pt; font-weight: bold;">'
@@ -1865,14 +1862,13 @@ class EditWidget(QDialog):
         save_widget = SimpleSplash(self.gui, 'Saving...', parent=self)
 
         self.gui.main.save_song(self.data, self.old_title)
-        self.gui.media_widget.populate_song_list()
+        self.gui.media_widget.update_song(self.old_title, self.data['title'])
 
         if self.from_oos:
             for i in range(self.gui.oos_widget.oos_list_widget.count()):
                 oos_title = self.gui.oos_widget.oos_list_widget.item(i).data(Qt.ItemDataRole.UserRole)['title']
                 if oos_title == self.data['title']:
-                    item = self.gui.media_widget.song_list.findItems(self.data['title'], Qt.MatchFlag.MatchExactly)[0]
-                    item_data = item.data(Qt.ItemDataRole.UserRole).copy()
+                    item_data = self.gui.media_widget.catalog.get('song', self.data['title']).copy()
                     item_data['parsed_text'] = parsers.parse_song_data(self.gui, item_data)
                     self.gui.oos_widget.oos_list_widget.item(i).setData(Qt.ItemDataRole.UserRole, item_data)
                     self.gui.oos_widget.oos_list_widget.setCurrentRow(i)
@@ -1934,14 +1930,13 @@ class EditWidget(QDialog):
 
         self.update_custom_data()
         self.gui.main.save_custom(self.data, self.old_title)
-        self.gui.media_widget.populate_custom_list()
+        self.gui.media_widget.update_custom(self.old_title, self.data['title'])
 
         if self.from_oos:
             for i in range(self.gui.oos_widget.oos_list_widget.count()):
                 if self.gui.oos_widget.oos_list_widget.item(i).data(
                         Qt.ItemDataRole.UserRole)['title'] == self.data['title']:
-                    item = self.gui.media_widget.custom_list.findItems(self.data['title'], Qt.MatchFlag.MatchExactly)[0]
-                    item_data = item.data(Qt.ItemDataRole.UserRole).copy()
+                    item_data = self.gui.media_widget.catalog.get('custom', self.data['title']).copy()
                     self.gui.oos_widget.oos_list_widget.item(i).setData(Qt.ItemDataRole.UserRole, item_data)
                     self.gui.oos_widget.oos_list_widget.setCurrentRow(i)
                     self.gui.send_to_preview(self.gui.oos_widget.oos_list_widget.item(i))
@@ -1954,56 +1949,16 @@ class EditWidget(QDialog):
         self.save_widget.widget.deleteLater()
 
     def get_simplified_text(self, lyrics):
-        break_tag = '<br />'
-
-        # 'flatten' the html if this is directly from the QTextEdit's toHtml function
-        if lyrics.startswith('<!'):
-            lyrics.replace('\n', '')
-            lyrics_split = re.split('<body.*?>', lyrics)
-            lyrics = lyrics_split[1].replace('</body></html>', '').strip()
-
-            # convert paragraphs to lines followed by break
-            paragraphs = re.findall('<p.*?>.*?</p>', lyrics)
-            lyrics = ''
-            for i in range(len(paragraphs)):
-                line = re.sub('<p.*?>', '', paragraphs[i])
-                line = line.replace('</p>', '').strip()
-                if i < len(paragraphs) - 1:
-                    if line != '<br />':
-                        lyrics += line + break_tag
-                    else:
-                        lyrics += line
-                elif line != '<br />':
-                    lyrics += line
-
-        # make paragraph tags if none exist
-        else:
-            lyrics = re.sub('\n', break_tag, lyrics)
-        lyrics = re.sub('<br.*?/>', break_tag, lyrics) # format old br tags
-
-        # simplify the formatting tags for bold, italic, and underline
-        style_substrings = re.findall('<span.*?</span>', lyrics)
-        for substring in style_substrings:
-            prefix = ''
-            suffix = ''
-            if 'font-weight' in substring:
-                prefix += '<b>'
-                suffix += '</b>'
-            if 'font-style' in substring:
-                prefix += '<i>'
-                suffix += '</i>'
-            if 'text-decoration' in substring:
-                prefix += '<u>'
-                suffix += '</u>'
-
-            new_substring = prefix + re.sub('<.*?>', '', substring) + suffix
-            lyrics = lyrics.replace(substring, new_substring)
-
-        return lyrics
+        """
+        Method to convert the editor's html, or lyrics as they were stored, into the simplified lyric markup
+        :param str lyrics: The lyrics
+        :return str: The lyrics in simplified markup
+        """
+        return normalize_lyrics(lyrics)
 
     def change_thumbnail(self, item):
         """
-        Change the thumbnail image of this song/custom slide's QListWidget ItemWidget to what has just been saved.
+        Change the thumbnail image of this song/custom slide's order of service item to what has just been saved.
         :param QListWidgetItem item: The edited song/custom slide's QListWidgetItem
         :return:
         """
@@ -2031,9 +1986,8 @@ class EditWidget(QDialog):
             pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio,
                                    Qt.TransformationMode.SmoothTransformation)
 
-        item_widget = StandardItemWidget(self.gui, item.data(Qt.ItemDataRole.UserRole)['title'], '', pixmap)
-        item.setSizeHint(item_widget.sizeHint())
-        self.gui.oos_widget.oos_list_widget.setItemWidget(item, item_widget)
+        item.setData(Qt.ItemDataRole.DisplayRole, item.data(Qt.ItemDataRole.UserRole)['title'])
+        item.setData(Qt.ItemDataRole.DecorationRole, pixmap)
 
 
 class LyricsTextEdit(QTextEdit):
@@ -2189,7 +2143,7 @@ class LyricListWidget(QListView):
 
             plain_tag = data[0].replace('[', '').replace(']', '').strip()
             plain_lyrics = data[1].replace('<br />', '\n').strip()
-            plain_lyrics = re.sub('<.*?>', '', plain_lyrics).strip()
+            plain_lyrics = strip_tags(plain_lyrics).strip()
 
             item = QStandardItem(f'{plain_tag}\n\n{plain_lyrics}')
             item.setData(data, Qt.ItemDataRole.UserRole)
@@ -2273,7 +2227,7 @@ class LyricDelegate(QStyledItemDelegate):
         if lyrics.endswith('<br />'):
             lyrics = lyrics[:-6]
         lyrics = lyrics.replace('<br />', '\n')
-        lyrics = re.sub('<.*?>', '', lyrics)
+        lyrics = strip_tags(lyrics)
 
         model.setData(
             index,
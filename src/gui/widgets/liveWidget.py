@@ -1,14 +1,16 @@
 from PyQt5.QtCore import Qt, QSize, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtMultimedia import QMediaPlayer
-from PyQt5.QtWidgets import QWidget, QLabel, QListWidget, QHBoxLayout, QPushButton, QGridLayout, QAbstractItemView
+from PyQt5.QtWidgets import QWidget, QLabel, QHBoxLayout, QPushButton, QGridLayout, QAbstractItemView
+
+from gui.widgets.slideList import SlideListView
 
 
 class LiveWidget(QWidget):
     """
     Provides the 'Live' widget that contains the parts of the current item being shown live.
     """
-    web_button_signal = pyqtSignal(str)
+    remote_command_signal = pyqtSignal()
 
     def __init__(self, gui):
         """
@@ -17,7 +19,7 @@ class LiveWidget(QWidget):
         """
         super().__init__()
         self.gui = gui
-        self.web_button_signal.connect(self.web_buttons)
+        self.remote_command_signal.connect(self.process_remote_commands)
         self.init_components()
 
     def init_components(self):
@@ -172,30 +174,118 @@ class LiveWidget(QWidget):
                 self.gui.send_to_live()
 
 
-class CustomListWidget(QListWidget):
+    def process_remote_commands(self):
+        """
+        Method to carry out every command waiting in the web remote's command queue. Consecutive navigation commands
+        are coalesced so that a burst of presses moves straight to the final item and slide, rendering only once. A
+        burst of slide presses stops at the edge of the live item unless it started there.
+        """
+        remote_server = self.gui.main.remote_server
+        commands = remote_server.command_queue.take_all()
+        if len(commands) == 0:
+            return
+
+        coalesced_seqs = set()
+        navigation = []
+        for command in commands:
+            if command.name in ('black_screen', 'logo_screen'):
+                # screen changes can't be merged with navigation, so finish any navigation received before them
+                coalesced_seqs.update(self.apply_navigation(navigation))
+                navigation = []
+                if command.name == 'black_screen':
+                    self.gui.display_black_screen()
+                else:
+                    self.gui.display_logo_screen()
+            else:
+                navigation.append(command)
+        coalesced_seqs.update(self.apply_navigation(navigation))
+
+        remote_server.acknowledge_commands(commands, coalesced_seqs)
+
+    def apply_navigation(self, commands):
+        """
+        Method to reduce a run of navigation commands to a final order of service row and slide row, and move there
+        :param list of RemoteCommand commands: The commands, in the order they were received
+        :return list of int: The seqs of the commands that were merged into a later command
+        """
+        if len(commands) == 0:
+            return []
+
+        oos_list = self.gui.oos_widget.oos_list_widget
+        item_target = None
+        item_offset = 0
+        slide_target = None
+        slide_offset = 0
+        for command in commands:
+            if command.name == 'oos_title':
+                item_target = command.value
+                item_offset = 0
+                slide_target = None
+                slide_offset = 0
+            elif command.name in ('item_forward', 'item_back'):
+                item_offset += 1 if command.name == 'item_forward' else -1
+                slide_target = None
+                slide_offset = 0
+            elif command.name == 'slide_title':
+                slide_target = command.value
+                slide_offset = 0
+            else:
+                slide_offset += 1 if command.name == 'slide_forward' else -1
+
+        if item_target is not None or item_offset != 0:
+            current_oos_row = oos_list.currentRow()
+            base_row = current_oos_row if item_target is None else item_target
+            target_row = max(0, min(oos_list.count() - 1, base_row + item_offset))
+            if target_row != current_oos_row:
+                oos_list.setCurrentRow(target_row)
+                self.gui.preview_widget.slide_list.setCurrentRow(0)
+                self.gui.send_to_live()
+
+        if slide_target is not None or slide_offset != 0:
+            current_row = self.slide_list.currentRow()
+            base_row = current_row if slide_target is None else slide_target
+            target_row = base_row + slide_offset
+            if 0 <= target_row < self.slide_list.count():
+                if target_row != current_row:
+                    self.slide_list.setCurrentRow(target_row)
+            elif target_row < 0:
+                if current_row == 0 and slide_target is None:
+                    self.web_buttons('slide_back')
+                else:
+                    self.slide_list.setCurrentRow(0)
+            else:
+                if current_row == self.slide_list.count() - 1 and slide_target is None:
+                    self.web_buttons('slide_forward')
+                else:
+                    self.slide_list.setCurrentRow(self.slide_list.count() - 1)
+
+        return [command.seq for command in commands[:-1]]
+
+
+class CustomListWidget(SlideListView):
     """
-    Provides a customized QListWidget that will call changes to the display when items are changed and perform certain
+    Provides a customized SlideListView that will call changes to the display when items are changed and perform certain
     tasks based on key presses.
     """
     def __init__(self, gui):
         """
-        Provides a customized QListWidget that will call changes to the display when items are changed and perform certain
-        tasks based on key presses.
+        Provides a customized SlideListView that will call changes to the display when items are changed and perform
+        certain tasks based on key presses.
         :param gui.GUI gui: The current instance of GUI
         """
-        super().__init__()
-        self.gui = gui
+        super().__init__(gui)
         self.setObjectName('CustomListWidget')
-        self.currentItemChanged.connect(self.change_display)
+        self.slide_changed_signal.connect(self.change_display)
 
     def change_display(self):
         """
         Call GUI's change_display function and sync the web remote with the user's input.
         """
-        self.gui.change_display('live')
-
+        # sync the remotes first so that stage clients can switch from their lookahead while the display renders
         if self.currentItem():
-            self.gui.main.remote_server.socketio.emit('change_current_slide', str(self.currentRow()))
+            self.gui.main.remote_server.change_current_slide(self.currentRow())
+
+        self.gui.change_display('live')
 
     def keyPressEvent(self, evt):
         """
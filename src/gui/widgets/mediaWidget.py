@@ -1,3 +1,4 @@
+import bisect
 import os
 import shutil
 import sqlite3
@@ -12,9 +13,11 @@ from PyQt5.QtWidgets import QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabe
 
 from dataHandling import parsers, declarations
 from dataHandling.declarations import SLIDE_DATA_DEFAULTS
+from dataHandling.lyricMarkup import get_plain_text
+from dataHandling.mediaCatalog import MediaCatalog
 from gui.widgets.editWidget import EditWidget
 from dataHandling.getScripture import GetScripture
-from gui.widgets.widgets import AutoSelectLineEdit, StandardItemWidget, SimpleSplash
+from gui.widgets.widgets import AutoSelectLineEdit, SimpleSplash, StandardItemDelegate, set_standard_item_data
 
 
 class MediaWidget(QTabWidget):
@@ -35,6 +38,8 @@ class MediaWidget(QTabWidget):
         self.setObjectName('media_widget')
         self.setTabShape(QTabWidget.TabShape.Rounded)
         self.song_list_items = []
+        self.song_search_texts = []
+        self.catalog = MediaCatalog()
 
         self.formatted_reference = None
         self.scripture_text_edited = False
@@ -334,6 +339,8 @@ class MediaWidget(QTabWidget):
         button_widget.layout().addWidget(send_to_live_button)
 
         self.image_list = CustomListWidget(self.gui, 'image')
+        self.image_list.setItemDelegate(StandardItemDelegate(self.gui, self.image_list))
+        self.image_list.setUniformItemSizes(True)
         self.image_list.setFont(self.gui.standard_font)
         self.image_list.setDragEnabled(True)
         self.image_list.doubleClicked.connect(self.add_image_to_service)
@@ -386,6 +393,8 @@ class MediaWidget(QTabWidget):
         button_widget.layout().addWidget(send_to_live_button)
 
         self.video_list = CustomListWidget(self.gui, 'video')
+        self.video_list.setItemDelegate(StandardItemDelegate(self.gui, self.video_list))
+        self.video_list.setUniformItemSizes(True)
         self.video_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.video_list.setDragEnabled(True)
         self.video_list.setFont(self.gui.standard_font)
@@ -437,6 +446,8 @@ class MediaWidget(QTabWidget):
         button_widget.layout().addWidget(send_to_live_button)
 
         self.web_list = CustomListWidget(self.gui, 'web')
+        self.web_list.setItemDelegate(StandardItemDelegate(self.gui, self.web_list))
+        self.web_list.setUniformItemSizes(True)
         self.web_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.web_list.setDragEnabled(True)
         self.web_list.setFont(self.gui.standard_font)
@@ -465,7 +476,7 @@ class MediaWidget(QTabWidget):
                 show_list_indices.append(i)
 
         for i in range(len(self.song_list_items)):
-            if search_string in self.song_list_items[i].data(Qt.ItemDataRole.UserRole)['text'].strip().lower() and i not in show_list_indices:
+            if search_string in self.song_search_texts[i] and i not in show_list_indices:
                 show_list_items.append(self.song_list_items[i].clone())
                 show_list_indices.append(i)
 
@@ -479,19 +490,21 @@ class MediaWidget(QTabWidget):
         """
         self.song_list.clear()
         self.song_list_items = []
+        self.song_search_texts = []
         all_songs = self.gui.main.get_all_songs()
         if len(all_songs) > 0:
             for song_data in all_songs:
                 if self.gui.main.initial_startup:
                     self.gui.main.update_status_signal.emit(f'Loading Songs - {song_data['title']}', 'info')
 
-                list_item = QListWidgetItem(song_data['title'])
-                list_item.setData(Qt.ItemDataRole.UserRole, song_data)
-                list_item.setSizeHint(QSize(0, 28))
-
+                list_item = self.get_song_list_item(song_data)
                 self.song_list_items.append(list_item)
                 self.song_list.addItem(list_item.clone())
 
+                # search the lyrics' text, not their markup
+                self.song_search_texts.append(get_plain_text(song_data['text']).lower())
+        self.catalog.set_items('song', all_songs)
+
     def populate_custom_list(self):
         """
         Method that uses the data contained in the custom slide table of the database to create QListWidgetItems in the
@@ -501,13 +514,8 @@ class MediaWidget(QTabWidget):
         slides = self.gui.main.get_all_custom_slides()
         if len(slides) > 0:
             for data in slides:
-                data['use_footer'] = False
-
-                list_item = QListWidgetItem(data['title'])
-                list_item.setData(Qt.ItemDataRole.UserRole, data)
-                list_item.setSizeHint(QSize(200, 28))
-
-                self.custom_list.addItem(list_item)
+                self.insert_custom_item(data)
+        self.catalog.set_items('custom', slides)
 
     def populate_image_list(self):
         """
@@ -521,25 +529,10 @@ class MediaWidget(QTabWidget):
             cursor = connection.cursor()
             thumbnails = cursor.execute('SELECT * FROM imageThumbnails ORDER BY fileName COLLATE NOCASE ASC').fetchall()
 
+            catalog_items = []
             for record in thumbnails:
-                file_name = record[0]
-                thumbnail_data = record[1]
-                pixmap = QPixmap()
-                pixmap.loadFromData(thumbnail_data)
-
-                widget = StandardItemWidget(self.gui, file_name, '', pixmap)
-                slide_data = declarations.SLIDE_DATA_DEFAULTS.copy()
-                slide_data['type'] = 'image'
-                slide_data['title'] = file_name
-                slide_data['file_name'] = file_name
-                slide_data['thumbnail'] = pixmap
-                slide_data['use_footer'] = False
-
-                item = QListWidgetItem()
-                item.setData(Qt.ItemDataRole.UserRole, slide_data)
-                item.setSizeHint(widget.sizeHint())
-                self.image_list.addItem(item)
-                self.image_list.setItemWidget(item, widget)
+                catalog_items.append(self.insert_image_item(record[0], record[1]))
+            self.catalog.set_items('image', catalog_items)
         except Exception:
             self.gui.main.error_log()
             if connection:
@@ -553,6 +546,7 @@ class MediaWidget(QTabWidget):
         try:
             self.video_list.clear()
             files = os.listdir(self.gui.main.video_dir)
+            catalog_items = []
             for file in files:
                 video_file = None
                 if file.endswith('.jpg'):
@@ -562,22 +556,8 @@ class MediaWidget(QTabWidget):
                             video_file = other_file
 
                     if video_file:
-                        pixmap = QPixmap(self.gui.main.video_dir + '/' + file)
-                        pixmap = pixmap.scaled(96, 54, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-
-                        widget = StandardItemWidget(self.gui, video_file.split('.')[0], '', pixmap)
-                        slide_data = declarations.SLIDE_DATA_DEFAULTS.copy()
-                        slide_data['type'] = 'video'
-                        slide_data['title'] = video_file
-                        slide_data['file_name'] = video_file
-                        slide_data['use_footer'] = False
-
-                        item = QListWidgetItem()
-                        item.setData(Qt.ItemDataRole.UserRole, slide_data)
-                        item.setSizeHint(widget.sizeHint())
-
-                        self.video_list.addItem(item)
-                        self.video_list.setItemWidget(item, widget)
+                        catalog_items.append(self.insert_video_item(video_file, file))
+            self.catalog.set_items('video', catalog_items)
         except Exception:
             self.gui.main.error_log()
 
@@ -593,29 +573,196 @@ class MediaWidget(QTabWidget):
             cursor = connection.cursor()
             results = cursor.execute('SELECT * FROM web').fetchall()
             connection.close()
+            catalog_items = []
 
             if len(results) > 0:
                 for record in results:
-                    title = record[0]
-                    url = record[1]
-                    item = QListWidgetItem()
-                    slide_data = declarations.SLIDE_DATA_DEFAULTS.copy()
-                    slide_data['type'] = 'web'
-                    slide_data['title'] = title
-                    slide_data['url'] = url
-                    slide_data['use_footer'] = False
-                    item.setData(Qt.ItemDataRole.UserRole, slide_data)
-
-                    widget = StandardItemWidget(self.gui, title, url)
-
-                    self.web_list.addItem(item)
-                    item.setSizeHint(widget.sizeHint())
-                    self.web_list.setItemWidget(item, widget)
+                    catalog_items.append(self.insert_web_item(record[0], record[1]))
+            self.catalog.set_items('web', catalog_items)
         except Exception:
             self.gui.main.error_log()
             if connection:
                 connection.close()
 
+    def get_song_list_item(self, song_data):
+        """
+        Method to create the QListWidgetItem that lists a song in the song widget
+        :param dict song_data: The song's data
+        :return QListWidgetItem: The item
+        """
+        list_item = QListWidgetItem(song_data['title'])
+        list_item.setData(Qt.ItemDataRole.UserRole, song_data)
+        list_item.setSizeHint(QSize(0, 28))
+        return list_item
+
+    def insert_custom_item(self, data, row=None):
+        """
+        Method to list a custom slide in the custom slide widget's QListWidget
+        :param dict data: The custom slide's data
+        :param int row: Optional: the row to insert the custom slide at, instead of the end of the list
+        :return dict: The custom slide's data
+        """
+        data['use_footer'] = False
+
+        list_item = QListWidgetItem(data['title'])
+        list_item.setData(Qt.ItemDataRole.UserRole, data)
+        list_item.setSizeHint(QSize(200, 28))
+        self.custom_list.insertItem(self.custom_list.count() if row is None else row, list_item)
+        return data
+
+    def insert_image_item(self, file_name, thumbnail_data, row=None):
+        """
+        Method to list an image in the image widget's QListWidget
+        :param str file_name: The image's file name
+        :param bytes thumbnail_data: The image's thumbnail, as stored in the database
+        :param int row: Optional: the row to insert the image at, instead of the end of the list
+        :return dict: The image's slide data
+        """
+        pixmap = QPixmap()
+        pixmap.loadFromData(thumbnail_data)
+
+        slide_data = declarations.SLIDE_DATA_DEFAULTS.copy()
+        slide_data['type'] = 'image'
+        slide_data['title'] = file_name
+        slide_data['file_name'] = file_name
+        slide_data['thumbnail'] = pixmap
+        slide_data['use_footer'] = False
+
+        item = QListWidgetItem()
+        item.setData(Qt.ItemDataRole.UserRole, slide_data)
+        set_standard_item_data(item, file_name, icon=pixmap)
+        self.image_list.insertItem(self.image_list.count() if row is None else row, item)
+        return slide_data
+
+    def insert_video_item(self, video_file, thumbnail_file):
+        """
+        Method to list a video at the end of the video widget's QListWidget
+        :param str video_file: The video's file name
+        :param str thumbnail_file: The file name of the video's thumbnail image
+        :return dict: The video's slide data
+        """
+        pixmap = QPixmap(self.gui.main.video_dir + '/' + thumbnail_file)
+        pixmap = pixmap.scaled(96, 54, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+        slide_data = declarations.SLIDE_DATA_DEFAULTS.copy()
+        slide_data['type'] = 'video'
+        slide_data['title'] = video_file
+        slide_data['file_name'] = video_file
+        slide_data['use_footer'] = False
+
+        item = QListWidgetItem()
+        item.setData(Qt.ItemDataRole.UserRole, slide_data)
+        set_standard_item_data(item, video_file.split('.')[0], icon=pixmap)
+        self.video_list.addItem(item)
+        return slide_data
+
+    def insert_web_item(self, title, url, row=None):
+        """
+        Method to list a web slide in the web widget's QListWidget
+        :param str title: The web slide's title
+        :param str url: The url the web slide is to fetch
+        :param int row: Optional: the row to insert the web slide at, instead of the end of the list
+        :return dict: The web slide's slide data
+        """
+        slide_data = declarations.SLIDE_DATA_DEFAULTS.copy()
+        slide_data['type'] = 'web'
+        slide_data['title'] = title
+        slide_data['url'] = url
+        slide_data['use_footer'] = False
+
+        item = QListWidgetItem()
+        item.setData(Qt.ItemDataRole.UserRole, slide_data)
+        set_standard_item_data(item, title, url)
+        self.web_list.insertItem(self.web_list.count() if row is None else row, item)
+        return slide_data
+
+    def get_song_index(self, title):
+        """
+        Method to find a song in the song widget's list of items. The songs are listed in the database's title order,
+        which is Python's string order, so they can be searched by bisection.
+        :param str title: The song's title
+        :return int: The song's index in song_list_items, or None if it isn't listed
+        """
+        index = bisect.bisect_left(self.song_list_items, title, key=QListWidgetItem.text)
+        if index < len(self.song_list_items) and self.song_list_items[index].text() == title:
+            return index
+        return None
+
+    def get_custom_row(self, title):
+        """
+        Method to find a custom slide in the custom slide widget's QListWidget, which is listed in the database's title
+        order
+        :param str title: The custom slide's title
+        :return int: The custom slide's row, or None if it isn't listed
+        """
+        row = bisect.bisect_left(range(self.custom_list.count()), title, key=lambda i: self.custom_list.item(i).text())
+        if row < self.custom_list.count() and self.custom_list.item(row).text() == title:
+            return row
+        return None
+
+    def update_song(self, old_title, title):
+        """
+        Method to bring a saved song into the song widget's QListWidget and the catalog, reading just that song back
+        from the database instead of reloading the whole library
+        :param str old_title: The song's title before it was edited, or None if it is new to the library
+        :param str title: The song's title as it was saved
+        """
+        songs = self.gui.main.get_all_songs(title)
+        if songs == -1 or len(songs) == 0:
+            self.populate_song_list()
+            return
+        song_data = songs[0]
+
+        for listed_title in (old_title, title):
+            index = self.get_song_index(listed_title) if listed_title else None
+            if index is not None:
+                del self.song_list_items[index]
+                del self.song_search_texts[index]
+
+        index = bisect.bisect_left(self.song_list_items, title, key=QListWidgetItem.text)
+        self.song_list_items.insert(index, self.get_song_list_item(song_data))
+        self.song_search_texts.insert(index, get_plain_text(song_data['text']).lower())
+        self.catalog.rename('song', old_title, song_data)
+
+        # relist the songs that match the current search
+        self.song_search()
+
+    def update_custom(self, old_title, title):
+        """
+        Method to bring a saved custom slide into the custom slide widget's QListWidget and the catalog, reading just
+        that custom slide back from the database instead of reloading them all
+        :param str old_title: The custom slide's title before it was edited, or None if it is new to the library
+        :param str title: The custom slide's title as it was saved
+        """
+        slides = self.gui.main.get_all_custom_slides(title)
+        if slides == -1 or len(slides) == 0:
+            self.populate_custom_list()
+            return
+
+        for listed_title in (old_title, title):
+            row = self.get_custom_row(listed_title) if listed_title else None
+            if row is not None:
+                self.custom_list.takeItem(row)
+
+        row = bisect.bisect_left(range(self.custom_list.count()), title, key=lambda i: self.custom_list.item(i).text())
+        self.catalog.rename('custom', old_title, self.insert_custom_item(slides[0], row))
+
+    def remove_library_item(self, list_widget, item):
+        """
+        Method to take an item that has been deleted from the library out of its QListWidget and the catalog, instead
+        of reloading the list
+        :param QListWidget list_widget: The QListWidget the item is listed in
+        :param QListWidgetItem item: The item
+        """
+        item_data = item.data(Qt.ItemDataRole.UserRole)
+        list_widget.takeItem(list_widget.row(item))
+        if item_data['type'] == 'song':
+            index = self.get_song_index(item_data['title'])
+            if index is not None:
+                del self.song_list_items[index]
+                del self.song_search_texts[index]
+        self.catalog.remove(item_data['type'], item_data['title'])
+
     def get_bibles(self):
         """
         Method that polls the files contained in the bibles subdirectory of the data directory and returns file names
@@ -747,7 +894,7 @@ class MediaWidget(QTabWidget):
     def add_image(self):
         """
         Method that creates a QFileDialog for the user to add an image to the program's database. Copies that
-        image file to the data directory, reindexes the images in the database, and reloads the image widget's
+        image file to the data directory, indexes the image in the database, and lists it in the image widget's
         QListWidget.
         """
         result = QFileDialog.getOpenFileName(
@@ -764,9 +911,19 @@ class MediaWidget(QTabWidget):
 
                 from core.runnables import IndexImages
                 ii = IndexImages(self.gui.main, 'images')
-                ii.add_image_index(self.gui.main.image_dir + '/' + file_name, 'image')
+                thumbnail_data = ii.add_image_index(self.gui.main.image_dir + '/' + file_name, 'image')
                 self.image_list.blockSignals(True)
-                self.populate_image_list()
+                if self.catalog.get_by_file_name(file_name):
+                    # the file replaced an image that was already in the library
+                    self.populate_image_list()
+                else:
+                    # images are listed in file name order, ignoring case
+                    row = bisect.bisect_left(
+                        range(self.image_list.count()),
+                        file_name.lower(),
+                        key=lambda i: self.image_list.item(i).text().lower()
+                    )
+                    self.catalog.add(self.insert_image_item(file_name, thumbnail_data, row))
                 self.image_list.update()
                 self.image_list.blockSignals(False)
             except Exception:
@@ -777,7 +934,8 @@ class MediaWidget(QTabWidget):
         Method to remove an image from the program's database and data directory. Creates a QMessageBox to
         ask for confirmation, then deletes the file from the data directory and reindexes the images in the database.
         """
-        file_name = self.image_list.currentItem().data(Qt.ItemDataRole.UserRole)['file_name']
+        item = self.image_list.currentItem()
+        file_name = item.data(Qt.ItemDataRole.UserRole)['file_name']
         response = QMessageBox.question(
             self.gui.main_window,
             'Really Delete',
@@ -796,7 +954,7 @@ class MediaWidget(QTabWidget):
             ii = IndexImages(self.gui.main, 'images')
             self.gui.main.thread_pool.start(ii)
             self.gui.main.thread_pool.waitForDone()
-            self.populate_image_list()
+            self.remove_library_item(self.image_list, item)
             self.image_list.update()
 
     def add_web(self):
@@ -853,19 +1011,26 @@ class MediaWidget(QTabWidget):
 
         result = web_dialog.exec()
         if result == 0:
-            item = QListWidgetItem()
-            item.setData(20, title_line_edit.text())
-            item.setData(21, url_line_edit.text())
-            item.setData(40, 'web')
-
-            widget = StandardItemWidget(self.gui, title_line_edit.text(), url_line_edit.text())
+            self.save_web_item(title_line_edit.text(), url_line_edit.text())
 
-            self.web_list.addItem(item)
-            item.setSizeHint(widget.sizeHint())
-            self.web_list.setItemWidget(item, widget)
+    def save_web_item(self, title, url, item=None):
+        """
+        Method to save a web slide to the database and list it in the web widget's QListWidget and the catalog
+        :param str title: The web slide's title
+        :param str url: The url the web slide is to fetch
+        :param QListWidgetItem item: Optional: the listed web slide that was edited
+        """
+        self.gui.main.save_web_item(title, url)
 
-            self.gui.main.save_web_item(title_line_edit.text(), url_line_edit.text())
+        if item and item.data(Qt.ItemDataRole.UserRole)['title'] == title:
+            row = self.web_list.row(item)
+            self.web_list.takeItem(row)
+            self.catalog.add(self.insert_web_item(title, url, row))
+        elif self.catalog.get('web', title):
+            # the database updated the url of another web slide with this title
             self.populate_web_list()
+        else:
+            self.catalog.add(self.insert_web_item(title, url))
 
     def add_video(self):
         """
@@ -914,6 +1079,7 @@ class MediaWidget(QTabWidget):
 
                 thumbnail_list = QListWidget()
                 thumbnail_list.setObjectName('thumbnail_list')
+                thumbnail_list.setItemDelegate(StandardItemDelegate(self.gui, thumbnail_list))
                 thumbnail_list.currentItem()
                 thumbnail_list.itemClicked.connect(
                     lambda: self.copy_video(
@@ -934,14 +1100,11 @@ class MediaWidget(QTabWidget):
                             Qt.TransformationMode.SmoothTransformation
                         )
 
-                        widget = StandardItemWidget(
-                            self.gui, 'Frame ' + file.split('.')[0].replace('thumbnail', ''), '', pixmap)
-
                         item = QListWidgetItem()
                         item.setData(20, file)
-                        item.setSizeHint(widget.sizeHint())
+                        set_standard_item_data(
+                            item, 'Frame ' + file.split('.')[0].replace('thumbnail', ''), icon=pixmap)
                         thumbnail_list.addItem(item)
-                        thumbnail_list.setItemWidget(item, widget)
 
                 wait_widget.widget.deleteLater()
                 thumbnail_widget.exec()
@@ -956,7 +1119,7 @@ class MediaWidget(QTabWidget):
     def copy_video(self, video_file, image_file, dialog):
         """
         Method to copy the user's video file and its thumbnail image file to the video subdirectory of the data
-        directory, then repopulate the video widget's QListWidget. Provides a QMessageBox to confirm that the
+        directory, then list the video in the video widget's QListWidget. Provides a QMessageBox to confirm that the
         import has completed successfully.
         :param str video_file: The path to the video file
         :param image_file: The path to the thumbnail image file
@@ -981,14 +1144,20 @@ class MediaWidget(QTabWidget):
         )
         dialog.done(0)
 
-        self.populate_video_list()
+        if self.catalog.get_by_file_name(video_file):
+            # the file replaced a video that was already in the library
+            self.populate_video_list()
+        else:
+            self.catalog.add(self.insert_video_item(video_file, new_image_file_name))
 
-    def add_song_to_service(self, item=None, row=None, from_load_service=False):
+    def add_song_to_service(self, item=None, row=None, from_load_service=False, keep_parsed_text=False):
         """
         Method to add a song QListWidgetItem to the order of service's QListWidget
         :param QListWidgetItem item: Optional: a specific song item
         :param int row: Optional: a specific row of the song widget's QListWidget
         :param bool from_load_service: Whether this call is occurring while loading a service file
+        :param bool keep_parsed_text: Whether the item's parsed_text is already valid for the current display, i.e.
+            when it was loaded from a service file, so that the song doesn't need to be parsed again
         """
         if not item and self.song_list.currentItem():
             item = QListWidgetItem()
@@ -1022,21 +1191,19 @@ class MediaWidget(QTabWidget):
                 pixmap = QPixmap(self.gui.main.background_dir + '/' + item_data['background'])
                 pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
 
-            widget = StandardItemWidget(self.gui, item_data['title'], 'Song', pixmap)
-
-            item.setSizeHint(widget.sizeHint())
+            set_standard_item_data(item, item_data['title'], 'Song', pixmap)
             if not row:
                 self.gui.oos_widget.oos_list_widget.addItem(item)
             else:
                 self.gui.oos_widget.oos_list_widget.insertItem(row, item)
-            self.gui.oos_widget.oos_list_widget.setItemWidget(item, widget)
             self.gui.changes = True
 
         if item and from_load_service:
             # handle this differently if it's being created while loading a service file
             widget_item = QListWidgetItem()
             slide_data = item.data(Qt.ItemDataRole.UserRole).copy()
-            slide_data['parsed_text'] = (parsers.parse_song_data(self.gui, slide_data))
+            if not keep_parsed_text or not slide_data.get('parsed_text'):
+                slide_data['parsed_text'] = (parsers.parse_song_data(self.gui, slide_data))
             widget_item.setData(Qt.ItemDataRole.UserRole, slide_data)
 
             if (slide_data['override_global'] == 'False'
@@ -1062,11 +1229,8 @@ class MediaWidget(QTabWidget):
                 pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio,
                                        Qt.TransformationMode.SmoothTransformation)
 
-            widget = StandardItemWidget(self.gui, slide_data['title'], 'Song', pixmap)
-
-            widget_item.setSizeHint(widget.sizeHint())
+            set_standard_item_data(widget_item, slide_data['title'], 'Song', pixmap)
             self.gui.oos_widget.oos_list_widget.addItem(widget_item)
-            self.gui.oos_widget.oos_list_widget.setItemWidget(widget_item, widget)
 
     def add_scripture_to_service(self):
         """
@@ -1131,14 +1295,11 @@ class MediaWidget(QTabWidget):
             pixmap = QPixmap(self.gui.main.background_dir + '/' + item_data['background'])
             pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
 
-        widget = StandardItemWidget(self.gui, item_data['title'], 'Custom Slide', pixmap)
-        item.setText(None)
-        item.setSizeHint(widget.sizeHint())
+        set_standard_item_data(item, item_data['title'], 'Custom Slide', pixmap)
         if not row:
             self.gui.oos_widget.oos_list_widget.addItem(item)
         else:
             self.gui.oos_widget.oos_list_widget.insertItem(row, item)
-        self.gui.oos_widget.oos_list_widget.setItemWidget(item, widget)
         self.gui.changes = True
 
     def add_image_to_service(self, item=None, row=None):
@@ -1159,14 +1320,11 @@ class MediaWidget(QTabWidget):
             pixmap = slide_data['thumbnail']
             pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio,
                                    Qt.TransformationMode.SmoothTransformation)
-            widget = StandardItemWidget(self.gui, slide_data['title'], 'Image', pixmap)
-
-            item.setSizeHint(widget.sizeHint())
+            set_standard_item_data(item, slide_data['title'], 'Image', pixmap)
             if add_item:
                 self.gui.oos_widget.oos_list_widget.addItem(item)
             else:
                 self.gui.oos_widget.oos_list_widget.insertItem(row, item)
-            self.gui.oos_widget.oos_list_widget.setItemWidget(item, widget)
             self.gui.changes = True
 
     def add_web_to_service(self, item=None, row=None):
@@ -1193,16 +1351,12 @@ class MediaWidget(QTabWidget):
             painter.drawText(QPoint(2, 20), 'WWW')
             painter.end()
 
-            widget = StandardItemWidget(
-                self.gui, item.data(
-                    Qt.ItemDataRole.UserRole)['title'], item.data(Qt.ItemDataRole.UserRole)['url'], pixmap)
-
-            item.setSizeHint(widget.sizeHint())
+            set_standard_item_data(
+                item, item.data(Qt.ItemDataRole.UserRole)['title'], item.data(Qt.ItemDataRole.UserRole)['url'], pixmap)
             if add_item:
                 self.gui.oos_widget.oos_list_widget.addItem(item)
             else:
                 self.gui.oos_widget.oos_list_widget.insertItem(row, item)
-            self.gui.oos_widget.oos_list_widget.setItemWidget(item, widget)
             self.gui.changes = True
 
     def add_video_to_service(self, item=None, row=None):
@@ -1224,15 +1378,11 @@ class MediaWidget(QTabWidget):
             pixmap = pixmap.scaled(50, 27, Qt.AspectRatioMode.IgnoreAspectRatio,
                                    Qt.TransformationMode.SmoothTransformation)
 
-            widget = StandardItemWidget(
-                self.gui, slide_data['title'].split('.')[0], 'Video', pixmap)
-
-            item.setSizeHint(widget.sizeHint())
+            set_standard_item_data(item, slide_data['title'].split('.')[0], 'Video', pixmap)
             if add_item:
                 self.gui.oos_widget.oos_list_widget.addItem(item)
             else:
                 self.gui.oos_widget.oos_list_widget.insertItem(row, item)
-            self.gui.oos_widget.oos_list_widget.setItemWidget(item, widget)
             self.gui.changes = True
 
 
@@ -1442,8 +1592,8 @@ class CustomListWidget(QListWidget):
 
             result = dialog.exec()
             if result == 1:
-                self.gui.main.save_web_item(title_line_edit.text(), url_line_edit.text())
-                self.gui.media_widget.populate_web_list()
+                self.gui.media_widget.save_web_item(
+                    title_line_edit.text(), url_line_edit.text(), self.itemAt(self.item_pos))
 
     def delete_item(self):
         """
@@ -1462,26 +1612,22 @@ class CustomListWidget(QListWidget):
         )
 
         if response == QMessageBox.StandardButton.Yes:
-            thread = threading.Thread(target=self.gui.main.delete_item, args=(self.currentItem(),))
+            item = self.currentItem()
+            results = []
+            thread = threading.Thread(target=lambda: results.append(self.gui.main.delete_item(item)))
             thread.start()
             thread.join()
 
             QMessageBox.information(
                 self.gui.main_window,
                 'Removed',
-                self.currentItem().data(Qt.ItemDataRole.UserRole)['title'] + ' has been removed.',
+                item.data(Qt.ItemDataRole.UserRole)['title'] + ' has been removed.',
                 QMessageBox.StandardButton.Ok
             )
 
-            if self.currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'song':
-                self.gui.media_widget.populate_song_list()
-            elif self.currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'custom':
-                self.gui.media_widget.populate_custom_list()
-            elif self.currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'image':
+            if item.data(Qt.ItemDataRole.UserRole)['type'] == 'image':
                 self.gui.media_widget.populate_image_list()
-            elif self.currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'video':
-                self.gui.media_widget.populate_video_list()
-            elif self.currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'web':
-                self.gui.media_widget.populate_web_list()
+            elif results[0] != -1:
+                self.gui.media_widget.remove_library_item(self, item)
 
             self.gui.preview_widget.slide_list.clear()
\ No newline at end of file
@@ -1,9 +1,11 @@
-from PyQt5.QtCore import Qt, QSize, QPoint
+from PyQt5.QtCore import Qt, QSize, QPoint, QTimer
 from PyQt5.QtGui import QCursor, QIcon, QDropEvent
 from PyQt5.QtWidgets import QWidget, QListWidget, QVBoxLayout, QLabel, QMenu, QGridLayout, \
     QPushButton, QSizePolicy, QMessageBox, QAction, QAbstractItemView
 
+from dataHandling import parsers
 from gui.widgets.editWidget import EditWidget
+from gui.widgets.widgets import StandardItemDelegate
 
 
 class OOSWidget(QWidget):
@@ -41,19 +43,32 @@ class OOSWidget(QWidget):
         container_layout.setRowStretch(1, 20)
         container_layout.setRowStretch(2, 20)
 
-        title_label = QLabel('Order of Service')
-        title_label.setObjectName('title_label')
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setFont(self.gui.bold_font)
-        container_layout.addWidget(title_label, 0, 0, 1, 2)
+        self.title_label = QLabel('Order of Service')
+        self.title_label.setObjectName('title_label')
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.title_label.setFont(self.gui.bold_font)
+        container_layout.addWidget(self.title_label, 0, 0, 1, 2)
 
         self.oos_list_widget = CustomListWidget(self.gui)
         self.oos_list_widget.setObjectName('oos_list_widget')
+        self.oos_list_widget.setItemDelegate(StandardItemDelegate(self.gui, self.oos_list_widget))
         self.oos_list_widget.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.oos_list_widget.verticalScrollBar().setSingleStep(15)
         self.oos_list_widget.setFont(self.gui.bold_font)
         container_layout.addWidget(self.oos_list_widget, 1, 0, 2, 1)
 
+        # publish the order of service to the web remotes whenever it changes, once per burst of changes
+        self.remote_update_timer = QTimer()
+        self.remote_update_timer.setSingleShot(True)
+        self.remote_update_timer.setInterval(0)
+        self.remote_update_timer.timeout.connect(self.update_remote_oos)
+        oos_model = self.oos_list_widget.model()
+        oos_model.rowsInserted.connect(lambda *args: self.remote_update_timer.start())
+        oos_model.rowsRemoved.connect(lambda *args: self.remote_update_timer.start())
+        oos_model.rowsMoved.connect(lambda *args: self.remote_update_timer.start())
+        oos_model.dataChanged.connect(lambda *args: self.remote_update_timer.start())
+        oos_model.modelReset.connect(lambda *args: self.remote_update_timer.start())
+
         move_up_button = QPushButton()
         move_up_button.setIcon(QIcon('resources/gui_icons/item_up.svg'))
         move_up_button.setIconSize(QSize(10, 30))
@@ -72,6 +87,25 @@ class OOSWidget(QWidget):
         move_down_button.clicked.connect(self.move_item_down)
         container_layout.addWidget(move_down_button, 2, 1)
 
+    def update_remote_oos(self):
+        """
+        Method to publish the current order of service to the web remotes
+        """
+        if self.gui.main.remote_server:
+            self.gui.main.remote_server.update_remote_oos()
+
+    def show_repagination_progress(self, done, total):
+        """
+        Method to show, in the title, how many of the order of service's items have been split into slides for a new
+        display or font
+        :param int done: The number of items finished
+        :param int total: The number of items being split, or 0 once they are all finished
+        """
+        if total > 0:
+            self.title_label.setText(f'Order of Service (updating slides {done}/{total})')
+        else:
+            self.title_label.setText('Order of Service')
+
     def move_item_up(self):
         """
         Method to move a QListWidgetItem up based on user's button click.
@@ -157,37 +191,35 @@ class CustomListWidget(QListWidget):
         if evt.source() == self:
             super().dropEvent(evt)
             return
+
+        # add the item as it is in the library's catalog, in case it has changed since it was listed
+        source_data = evt.source().currentItem().data(Qt.ItemDataRole.UserRole)
+        item_type = source_data['type']
+        item_data = self.gui.media_widget.catalog.get(item_type, source_data['title'])
+        if not item_data:
+            return
+        item_data = item_data.copy()
+        if item_type == 'song':
+            item_data['parsed_text'] = parsers.parse_song_data(self.gui, item_data)
+
         item = evt.source().currentItem().clone()
         item.setText('')
+        item.setData(Qt.ItemDataRole.UserRole, item_data)
         row = self.row(self.itemAt(QPoint(int(evt.pos().x()), int(evt.pos().y()))))
         if row == -1:
             row = self.count()
 
-        if evt.source().currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'song':
+        if item_type == 'song':
             self.gui.media_widget.add_song_to_service(item, row)
-        elif evt.source().currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'custom':
+        elif item_type == 'custom':
             self.gui.media_widget.add_custom_to_service(item, row)
-        elif evt.source().currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'image':
+        elif item_type == 'image':
             self.gui.media_widget.add_image_to_service(item, row)
-        elif evt.source().currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'video':
+        elif item_type == 'video':
             self.gui.media_widget.add_video_to_service(item, row)
-        elif evt.source().currentItem().data(Qt.ItemDataRole.UserRole)['type'] == 'web':
+        elif item_type == 'web':
             self.gui.media_widget.add_web_to_service(item, row)
 
-        remote_oos_buttons = ''
-        for i in range(self.count()):
-            if self.item(i).data(Qt.ItemDataRole.UserRole): # a placeholder item in oos will not have any data
-                title = self.item(i).data(Qt.ItemDataRole.UserRole)['title']
-                remote_oos_buttons += f"""
-                    <button id="{title}" type="submit" name="oos_button" value="{title}">
-                        <span class="title">
-                            {title}
-                        </span>
-                    </button>
-                    <br />"""
-        if self.gui.main.remote_server:
-            self.gui.main.remote_server.socketio.emit('update_oos', remote_oos_buttons)
-
         self.gui.changes = True
 
     def context_menu(self):
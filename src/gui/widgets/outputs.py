@@ -0,0 +1,365 @@
+from PyQt5.QtCore import Qt, QObject, QRectF, QSize, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter, QColor, QFont
+from PyQt5.QtWidgets import QWidget
+
+from core.runnables import SaveOutputFrame
+from dataHandling.lyricMarkup import get_plain_text
+
+# the layout templates an output can use
+LAYOUTS = ('full', 'text_overlay', 'confidence')
+
+
+class RenderedSlide:
+    """
+    Provides the result of rendering a slide once on the display widget: the finished frame along with the text layers
+    and slide information that layouts other than 'full' are built from. Outputs never lay out text or decode
+    backgrounds themselves.
+    """
+    __slots__ = ('frame', 'shade_rect', 'shade_color', 'shadow_layer', 'text_layer', 'slide_info', 'next_text')
+
+    def __init__(self, frame, lyric_widget=None, slide_info='', next_text=''):
+        """
+        Provides the result of rendering a slide once on the display widget
+        :param QImage frame: The grab of the display widget
+        :param LyricDisplayWidget lyric_widget: The display's lyric widget, whose cached layers hold the slide's text
+        :param str slide_info: The slide info text, i.e. 'Slide 1 of 4'
+        :param str next_text: The plain text of the next slide
+        """
+        self.frame = frame
+        self.slide_info = slide_info
+        self.next_text = next_text
+        self.shade_rect = None
+        self.shade_color = None
+        self.shadow_layer = None
+        self.text_layer = None
+        if lyric_widget:
+            if lyric_widget.use_shade:
+                self.shade_rect = lyric_widget.shade_rect
+                self.shade_color = QColor(
+                    lyric_widget.shade_color, lyric_widget.shade_color, lyric_widget.shade_color,
+                    lyric_widget.shade_opacity)
+            self.shadow_layer = lyric_widget.shadow_layer
+            self.text_layer = lyric_widget.text_layer
+
+
+def compose_full(rendered_slide, size, settings):
+    """
+    Method to fit the display frame to an output, letterboxing it if the aspect ratios differ
+    :param RenderedSlide rendered_slide: The rendered slide
+    :param QSize size: The output's size
+    :param dict settings: The output's settings
+    :return QImage: The composed frame
+    """
+    if rendered_slide.frame.size() == size:
+        return rendered_slide.frame
+
+    image = QImage(size, QImage.Format.Format_RGB32)
+    image.fill(Qt.GlobalColor.black)
+    scaled = rendered_slide.frame.scaled(
+        size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    painter = QPainter(image)
+    painter.drawImage(int((size.width() - scaled.width()) / 2), int((size.height() - scaled.height()) / 2), scaled)
+    painter.end()
+    return image
+
+
+def compose_text_overlay(rendered_slide, size, settings):
+    """
+    Method to composite only the slide's text, with its shade and shadow, over a key color (or transparency) so it
+    can be keyed over a livestream
+    :param RenderedSlide rendered_slide: The rendered slide
+    :param QSize size: The output's size
+    :param dict settings: The output's settings, optionally including 'key_color' as [r, g, b], or [] for transparency
+    :return QImage: The composed frame
+    """
+    key_color = settings.get('key_color', [0, 255, 0])
+    image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    if key_color:
+        image.fill(QColor(key_color[0], key_color[1], key_color[2]))
+    else:
+        image.fill(Qt.GlobalColor.transparent)
+    if rendered_slide.text_layer is None:
+        return image
+
+    frame_size = rendered_slide.frame.size()
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    painter.scale(size.width() / frame_size.width(), size.height() / frame_size.height())
+    if rendered_slide.shade_rect:
+        painter.fillRect(rendered_slide.shade_rect, rendered_slide.shade_color)
+    if rendered_slide.shadow_layer is not None:
+        painter.drawImage(0, 0, rendered_slide.shadow_layer)
+    painter.drawImage(0, 0, rendered_slide.text_layer)
+    painter.end()
+    return image
+
+
+def compose_confidence(rendered_slide, size, settings):
+    """
+    Method to show the display frame in the top of the output, with the slide info and the next slide's text below it
+    for those leading from the front
+    :param RenderedSlide rendered_slide: The rendered slide
+    :param QSize size: The output's size
+    :param dict settings: The output's settings, optionally including 'font_family'
+    :return QImage: The composed frame
+    """
+    image = QImage(size, QImage.Format.Format_RGB32)
+    image.fill(Qt.GlobalColor.black)
+
+    frame_height = int(size.height() * 2 / 3)
+    scaled = rendered_slide.frame.scaled(
+        QSize(size.width(), frame_height), Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.drawImage(int((size.width() - scaled.width()) / 2), 0, scaled)
+
+    margin = int(size.width() / 50)
+    font_size = max(8, int(size.height() / 30))
+    text_rect = QRectF(
+        margin, frame_height + margin, size.width() - margin * 2, size.height() - frame_height - margin * 2)
+
+    painter.setFont(QFont(settings.get('font_family', 'Arial'), font_size, QFont.Weight.Bold))
+    painter.setPen(QColor(255, 204, 0))
+    painter.drawText(text_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop, rendered_slide.slide_info)
+    painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, 'Next:')
+
+    painter.setFont(QFont(settings.get('font_family', 'Arial'), font_size))
+    painter.setPen(QColor(200, 200, 200))
+    painter.drawText(
+        text_rect.adjusted(0, font_size * 2, 0, 0),
+        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+        rendered_slide.next_text
+    )
+    painter.end()
+    return image
+
+
+LAYOUT_COMPOSERS = {
+    'full': compose_full,
+    'text_overlay': compose_text_overlay,
+    'confidence': compose_confidence
+}
+
+
+class OutputWindow(QWidget):
+    """
+    Provides a frameless, full screen window on one screen that shows the frames routed to it
+    :param gui.GUI gui: The current instance of GUI
+    :param dict settings: The output's settings
+    """
+    def __init__(self, gui, settings):
+        """
+        Provides a frameless, full screen window on one screen that shows the frames routed to it
+        :param gui.GUI gui: The current instance of GUI
+        :param dict settings: The output's settings, including 'name', 'layout', and 'screen_name'
+        """
+        super().__init__()
+        self.gui = gui
+        self.settings = settings
+        self.frame = None
+
+        self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
+        self.setWindowTitle(f'ProjectOn {settings.get("name", "Output")}')
+        self.setCursor(Qt.CursorShape.BlankCursor)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        for screen in self.gui.main.app.screens():
+            if screen.name() == settings.get('screen_name'):
+                self.setGeometry(screen.geometry())
+                break
+
+    def get_size(self):
+        """
+        Method to get the size frames should be composed at for this output
+        :return QSize: The size
+        """
+        return self.size()
+
+    def is_active(self):
+        return self.isVisible()
+
+    def present(self, frame):
+        """
+        Method to show a composed frame
+        :param QImage frame: The frame
+        """
+        self.frame = frame
+        self.update()
+
+    def paintEvent(self, evt):
+        painter = QPainter(self)
+        if self.frame:
+            painter.drawImage(0, 0, self.frame)
+        else:
+            painter.fillRect(self.rect(), Qt.GlobalColor.black)
+        painter.end()
+
+
+class FrameSinkOutput(QObject):
+    """
+    Provides an offscreen output that holds the latest composed frame, announces it with frame_ready, and, if given a
+    file, saves it there in the background for other software (i.e. an image source in streaming software) to pick up
+    :param gui.GUI gui: The current instance of GUI
+    :param dict settings: The output's settings
+    """
+    frame_ready = pyqtSignal(QImage)
+
+    def __init__(self, gui, settings):
+        """
+        Provides an offscreen output that holds the latest composed frame
+        :param gui.GUI gui: The current instance of GUI
+        :param dict settings: The output's settings, including 'name', 'layout', 'width', 'height', and optionally
+            'file'
+        """
+        super().__init__()
+        self.gui = gui
+        self.settings = settings
+        self.frame = None
+
+    def get_size(self):
+        return QSize(int(self.settings.get('width', 1920)), int(self.settings.get('height', 1080)))
+
+    def is_active(self):
+        return True
+
+    def present(self, frame):
+        """
+        Method to hold, announce, and save a composed frame
+        :param QImage frame: The frame
+        """
+        self.frame = frame
+        self.frame_ready.emit(frame)
+        if self.settings.get('file'):
+            self.gui.main.thread_pool.start(SaveOutputFrame(self.gui.main, frame, self.settings['file']))
+
+
+class StageEncoderOutput:
+    """
+    Provides an output feeding the stage view's frame encoder when the stage display is set to mirror the display
+    :param gui.GUI gui: The current instance of GUI
+    """
+    settings = {'name': 'Stage View', 'layout': 'full'}
+
+    def __init__(self, gui):
+        """
+        Provides an output feeding the stage view's frame encoder
+        :param gui.GUI gui: The current instance of GUI
+        """
+        self.gui = gui
+        self.slide_info = ''
+
+    def get_size(self):
+        # the encoder scales to each stage client's width itself
+        return self.gui.display_widget.size()
+
+    def is_active(self):
+        settings = self.gui.main.settings
+        return (
+            'mirror_stage_display' in settings.keys()
+            and settings['mirror_stage_display']
+            and self.gui.stage_frame_encoder.has_subscribers()
+        )
+
+    def present(self, frame):
+        self.gui.stage_frame_encoder.submit(frame, self.slide_info)
+
+
+class OutputRouter:
+    """
+    Provides the routing of each rendered slide to every output. Each output gets the slide composed with its own
+    layout at its own size, and outputs sharing a layout and size share a single composition.
+    :param gui.GUI gui: The current instance of GUI
+    """
+    def __init__(self, gui):
+        """
+        Provides the routing of each rendered slide to every output
+        :param gui.GUI gui: The current instance of GUI
+        """
+        self.gui = gui
+        self.stage_output = StageEncoderOutput(gui)
+        self.outputs = [self.stage_output]
+
+    def load_outputs(self):
+        """
+        Method to create the outputs listed in the 'display_outputs' setting. Each is a dict with a 'type' of
+        'screen' or 'frame_sink', a 'name', a 'layout' from LAYOUTS, and the settings for that type of output.
+        """
+        for output in self.outputs:
+            if isinstance(output, OutputWindow):
+                output.close()
+        self.outputs = [self.stage_output]
+
+        if 'display_outputs' not in self.gui.main.settings.keys():
+            return
+        for output_settings in self.gui.main.settings['display_outputs']:
+            if output_settings.get('layout', 'full') not in LAYOUTS:
+                self.gui.main.error_log(
+                    f'Unknown layout "{output_settings.get("layout")}" for output "{output_settings.get("name")}"')
+                continue
+
+            if output_settings.get('type') == 'screen':
+                output = OutputWindow(self.gui, output_settings)
+                output.showFullScreen()
+            elif output_settings.get('type') == 'frame_sink':
+                output = FrameSinkOutput(self.gui, output_settings)
+            else:
+                self.gui.main.error_log(
+                    f'Unknown type "{output_settings.get("type")}" for output "{output_settings.get("name")}"')
+                continue
+            self.outputs.append(output)
+
+    def has_active_outputs(self):
+        for output in self.outputs:
+            if output.is_active():
+                return True
+        return False
+
+    def get_next_slide_text(self):
+        """
+        Method to get the plain text of the live slide after the current one
+        :return str: The text, or an empty string if the current slide is the last one
+        """
+        slide_list = self.gui.live_widget.slide_list
+        next_row = slide_list.currentRow() + 1
+        if next_row < 1 or next_row >= slide_list.count():
+            return ''
+        slide_data = slide_list.item(next_row).data(Qt.ItemDataRole.UserRole)
+        if slide_data['type'] == 'song':
+            return get_plain_text(slide_data['parsed_text']['text'])
+        elif slide_data['type'] in ('bible', 'custom'):
+            return get_plain_text(slide_data['parsed_text'])
+        return slide_data['title']
+
+    def route(self, pixmap, slide_info='', use_text_layers=True):
+        """
+        Method to send a grab of the display widget to every active output. Must be called from the GUI thread.
+        :param QPixmap pixmap: The grab of the display widget
+        :param str slide_info: The slide info text
+        :param bool use_text_layers: Whether the lyric widget's text layers belong to this frame
+        """
+        if not self.has_active_outputs():
+            return
+
+        rendered_slide = RenderedSlide(
+            pixmap.toImage(),
+            self.gui.lyric_widget if use_text_layers else None,
+            slide_info,
+            self.get_next_slide_text()
+        )
+        self.stage_output.slide_info = slide_info
+
+        composed = {}
+        for output in self.outputs:
+            if not output.is_active():
+                continue
+            try:
+                layout = output.settings.get('layout', 'full')
+                size = output.get_size()
+                key = (layout, size.width(), size.height(), str(output.settings.get('key_color')))
+                if key not in composed:
+                    composed[key] = LAYOUT_COMPOSERS[layout](rendered_slide, size, output.settings)
+                output.present(composed[key])
+            except Exception:
+                self.gui.main.error_log()
@@ -1,5 +1,7 @@
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QLabel, QListWidget, QGridLayout, QAbstractItemView
+from PyQt5.QtWidgets import QWidget, QLabel, QGridLayout, QAbstractItemView
+
+from gui.widgets.slideList import SlideListView
 
 
 class PreviewWidget(QWidget):
@@ -51,8 +53,8 @@ class PreviewWidget(QWidget):
         self.slide_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.slide_list.verticalScrollBar().setSingleStep(15)
         self.slide_list.setFont(self.gui.standard_font)
-        self.slide_list.itemClicked.connect(self.show_preview)
-        self.slide_list.currentItemChanged.connect(self.show_preview)
+        self.slide_list.clicked.connect(self.show_preview)
+        self.slide_list.slide_changed_signal.connect(self.show_preview)
         container_layout.addWidget(self.slide_list, 1, 0)
 
         self.preview_label = QLabel()
@@ -63,13 +65,12 @@ class PreviewWidget(QWidget):
         self.gui.change_display('sample')
 
 
-class CustomListWidget(QListWidget):
+class CustomListWidget(SlideListView):
     """
-    Implements QListWidget to add send-to-live functionality using the space bar
+    Implements SlideListView to add send-to-live functionality using the space bar
     """
     def __init__(self, gui):
-        super().__init__()
-        self.gui = gui
+        super().__init__(gui)
         self.setObjectName('CustomListWidget')
 
     def keyPressEvent(self, evt):
@@ -0,0 +1,159 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+
+from dataHandling.lyricMarkup import get_plain_text
+from gui.widgets.widgets import StandardItemDelegate, SUBTITLE_ROLE, WRAP_SUBTITLE_ROLE
+
+
+class SlideListModel(QAbstractListModel):
+    """
+    Holds the slides of the item in the preview or live widget as a list of slide data dictionaries, one per slide. The
+    title, subtitle and thumbnail shown for each slide are worked out the first time the slide is painted and kept
+    until the slides are replaced.
+    :param gui.GUI gui: The current instance of GUI
+    """
+    def __init__(self, gui):
+        """
+        Holds the slides of the item in the preview or live widget as a list of slide data dictionaries.
+        :param gui.GUI gui: The current instance of GUI
+        """
+        super().__init__()
+        self.gui = gui
+        self.slides = []
+        self.display_cache = {}
+
+    def set_slides(self, slides):
+        """
+        Method to replace all the slides at once
+        :param list of dict slides: The data of each slide
+        """
+        self.beginResetModel()
+        self.slides = slides
+        self.display_cache = {}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.slides)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.slides):
+            return None
+
+        if role == Qt.ItemDataRole.UserRole:
+            return self.slides[index.row()]
+        elif role == Qt.ItemDataRole.DisplayRole:
+            return self.get_display(index.row())['title']
+        elif role == SUBTITLE_ROLE:
+            return self.get_display(index.row())['subtitle']
+        elif role == Qt.ItemDataRole.DecorationRole:
+            return self.get_display(index.row())['icon']
+        elif role == WRAP_SUBTITLE_ROLE:
+            return True
+        return None
+
+    def get_display(self, row):
+        """
+        Method to get the title, subtitle and thumbnail shown for a slide
+        :param int row: The slide's row
+        :return dict: {'title', 'subtitle', 'icon'}
+        """
+        if row in self.display_cache:
+            return self.display_cache[row]
+
+        slide_data = self.slides[row]
+        title = slide_data['title']
+        subtitle = ''
+        icon = None
+        if slide_data['type'] == 'song':
+            title = slide_data['parsed_text']['title']
+            subtitle = slide_data['parsed_text']['text']
+        elif slide_data['type'] in ('bible', 'custom'):
+            subtitle = slide_data['parsed_text']
+        elif slide_data['type'] == 'image':
+            title = slide_data['file_name']
+        elif slide_data['type'] == 'video':
+            title = slide_data['file_name'].split('.')[0]
+            icon = QPixmap(self.gui.main.video_dir + '/' + title + '.jpg').scaled(
+                96, 54, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        elif slide_data['type'] == 'web':
+            subtitle = slide_data['url']
+
+        display = {
+            'title': title,
+            'subtitle': get_plain_text(subtitle) if subtitle else '',
+            'icon': icon
+        }
+        self.display_cache[row] = display
+        return display
+
+
+class SlideListView(QListView):
+    """
+    Provides the list of slides in the preview and live widgets as a view over a SlideListModel, painted by a
+    StandardItemDelegate, so that changing to a different item only resets the model instead of building widgets for
+    every slide. Offers the parts of QListWidget's interface the rest of the program uses; item() and currentItem()
+    return QModelIndexes, which answer data() the same way a QListWidgetItem does.
+    :param gui.GUI gui: The current instance of GUI
+    """
+    slide_changed_signal = pyqtSignal()
+
+    def __init__(self, gui):
+        """
+        Provides the list of slides in the preview and live widgets as a view over a SlideListModel.
+        :param gui.GUI gui: The current instance of GUI
+        """
+        super().__init__()
+        self.gui = gui
+        self.slide_model = SlideListModel(gui)
+        self.setModel(self.slide_model)
+        self.setItemDelegate(StandardItemDelegate(gui, self))
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+
+    def set_slides(self, slides):
+        """
+        Method to show a new set of slides, with none of them selected
+        :param list of dict slides: The data of each slide
+        """
+        had_current = self.currentIndex().isValid()
+        self.slide_model.set_slides(slides)
+        if had_current:
+            self.slide_changed_signal.emit()
+
+    def slides(self):
+        """
+        Method to get the data of every slide in the list
+        :return list of dict: The slides' data
+        """
+        return self.slide_model.slides
+
+    def clear(self):
+        self.set_slides([])
+
+    def count(self):
+        return self.slide_model.rowCount()
+
+    def item(self, row):
+        index = self.slide_model.index(row)
+        if not index.isValid():
+            return None
+        return index
+
+    def currentItem(self):
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return index
+
+    def currentRow(self):
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row):
+        self.setCurrentIndex(self.slide_model.index(row))
+
+    def currentChanged(self, current, previous):
+        super().currentChanged(current, previous)
+        self.slide_changed_signal.emit()
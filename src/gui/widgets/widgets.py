@@ -1,5 +1,4 @@
 import os
-import re
 import shutil
 import sqlite3
 import sys
@@ -12,10 +11,21 @@ from PyQt5.QtPrintSupport import QPrinterInfo, QPrinter
 from PyQt5.QtWidgets import QListWidget, QLabel, QListWidgetItem, QComboBox, QListView, QWidget, QVBoxLayout, \
     QGridLayout, QSlider, QMainWindow, QMessageBox, QScrollArea, QLineEdit, QHBoxLayout, \
     QSpinBox, QRadioButton, QButtonGroup, QCheckBox, QColorDialog, QGraphicsRectItem, QDialog, QTextEdit, QPushButton, \
-    QApplication, QFontComboBox, QGroupBox, QTabWidget, QTimeEdit, QFileDialog, QStyledItemDelegate
+    QApplication, QFontComboBox, QGroupBox, QTabWidget, QTimeEdit, QFileDialog, QStyledItemDelegate, \
+    QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect, QStyle, QStyleOptionViewItem
 
+from dataHandling.lyricMarkup import get_plain_text, normalize_lyrics, strip_tags
+from dataHandling.textLayout import metrics_cache, wrap_text, build_line_path
 from importExport.openlpImport import OpenLPImport
 
+# the item data roles StandardItemDelegate paints a row's subtitle from, alongside its title in the DisplayRole and its
+# thumbnail in the DecorationRole
+SUBTITLE_ROLE = Qt.ItemDataRole.UserRole + 1
+WRAP_SUBTITLE_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# the maximum number of cached elided texts or subtitle heights before a cache is cleared
+MAX_CACHED_ELISIONS = 5000
+
 
 class AutoSelectLineEdit(QLineEdit):
     """
@@ -841,6 +851,7 @@ class FontWidget(QWidget):
             self.gui.main.settings[f'{self.slide_type}_use_shade'] = self.shade_behind_text_checkbox.isChecked()
             self.gui.main.settings[f'{self.slide_type}_shade_color'] = self.shade_color_slider.color_slider.value()
             self.gui.main.settings[f'{self.slide_type}_shade_opacity'] = self.shade_opacity_slider.color_slider.value()
+            self.gui.schedule_repagination()
 
         self.change_font_sample()
         self.font_sample.repaint()
@@ -995,10 +1006,7 @@ class ImageCombobox(QComboBox):
                         pixmap = self.itemIcon(self.currentIndex()).pixmap(QSize(50, 27))
 
             if pixmap:
-                widget = self.gui.oos_widget.oos_list_widget.itemWidget(item)
-                widget.icon.setPixmap(pixmap)
-                widget.adjustSize()
-                item.setSizeHint(widget.sizeHint())
+                item.setData(Qt.ItemDataRole.DecorationRole, pixmap)
 
         if not self.suppress_autosave:
             self.gui.main.save_settings()
@@ -1078,7 +1086,8 @@ class LyricDisplayWidget(QWidget):
             shadow_offset=5,
             use_shade=False,
             shade_color=0,
-            shade_opacity=75):
+            shade_opacity=75,
+            shadow_blur=0):
         """
         Provide a standardized QWidget to be used for showing lyrics on the display and sample widgets.py
         :param gui.GUI gui: The current instance of GUI
@@ -1090,6 +1099,7 @@ class LyricDisplayWidget(QWidget):
         :param use_shadow: Whether the font is to be shadowed
         :param shadow_color: The shade of the font shadow (QColor(x, x, x))
         :param shadow_offset: The offset, in px, of the shadow
+        :param int shadow_blur: The blur radius, in px, of the shadow (0 for a hard shadow)
         """
         super().__init__()
         self.gui = gui
@@ -1104,10 +1114,17 @@ class LyricDisplayWidget(QWidget):
         self.use_shade = use_shade
         self.shade_color = shade_color
         self.shade_opacity = shade_opacity
+        self.shadow_blur = shadow_blur
 
         self.text = ''
         self.total_height = 0
 
+        # cached, pre-rendered layers and the key describing what they were rendered from
+        self.layer_key = None
+        self.shade_rect = None
+        self.shadow_layer = None
+        self.text_layer = None
+
         margins = QMargins(0, 0, 0, 0)
         self.setContentsMargins(margins)
 
@@ -1148,14 +1165,130 @@ class LyricDisplayWidget(QWidget):
         """
 
         painter = QPainter(self)
-        self.calculate_painted_text(painter)
+        if self.layer_key and self.layer_key == self.get_layer_key():
+            self.composite_layers(painter)
+        else:
+            self.calculate_painted_text(painter)
+        painter.end()
+
+    def get_layer_key(self):
+        """
+        Method to create a key describing everything that affects the rendered text layers. If the key hasn't changed
+        since the layers were last rendered, the cached layers can be composited as they are.
+        :return tuple: The layer key
+        """
+        font = self.font()
+        footer_text = ''
+        if not self.footer_label.isHidden():
+            footer_text = self.footer_label.text()
+        return (
+            self.text,
+            font.family(),
+            font.pointSize(),
+            self.fill_color.rgba(),
+            self.use_outline,
+            self.outline_color.rgba(),
+            self.outline_width,
+            self.use_shadow,
+            self.shadow_color.rgba(),
+            self.shadow_offset,
+            self.shadow_blur,
+            self.use_shade,
+            self.shade_color,
+            self.shade_opacity,
+            self.gui.display_widget.width(),
+            self.gui.display_widget.height(),
+            footer_text
+        )
+
+    def render_layers(self, painter_paths, shade_rect):
+        """
+        Method to rasterize the shadow and the filled and outlined text into ARGB images that can be reused for
+        subsequent paints until the text or its appearance changes.
+        :param list of QPainterPath painter_paths: The positioned paths of each line of text
+        :param QRectF shade_rect: The rect of the text's background shade
+        """
+        layer_size = self.gui.display_widget.size()
+        self.shade_rect = shade_rect
+
+        self.shadow_layer = None
+        if self.use_shadow:
+            self.shadow_layer = QImage(layer_size, QImage.Format.Format_ARGB32_Premultiplied)
+            self.shadow_layer.fill(Qt.GlobalColor.transparent)
+            shadow_painter = QPainter(self.shadow_layer)
+            shadow_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            shadow_brush = QBrush()
+            shadow_brush.setColor(self.shadow_color)
+            shadow_brush.setStyle(Qt.BrushStyle.SolidPattern)
+            for path in painter_paths:
+                shadow_painter.fillPath(path.translated(self.shadow_offset, self.shadow_offset), shadow_brush)
+            shadow_painter.end()
+
+            if self.shadow_blur > 0:
+                self.shadow_layer = self.blur_image(self.shadow_layer, self.shadow_blur)
+
+        self.text_layer = QImage(layer_size, QImage.Format.Format_ARGB32_Premultiplied)
+        self.text_layer.fill(Qt.GlobalColor.transparent)
+        text_painter = QPainter(self.text_layer)
+        text_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        brush = QBrush()
+        brush.setColor(self.fill_color)
+        brush.setStyle(Qt.BrushStyle.SolidPattern)
+        pen = QPen()
+        pen.setColor(self.outline_color)
+        pen.setWidth(self.outline_width)
+        for path in painter_paths:
+            text_painter.fillPath(path, brush)
+            if self.use_outline:
+                text_painter.strokePath(path, pen)
+        text_painter.end()
+
+    def blur_image(self, image, radius):
+        """
+        Method to apply a gaussian blur to an image by rendering it through a QGraphicsBlurEffect
+        :param QImage image: The image to be blurred
+        :param int radius: The blur radius, in px
+        :return QImage: The blurred image
+        """
+        scene = QGraphicsScene()
+        pixmap_item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+        blur_effect = QGraphicsBlurEffect()
+        blur_effect.setBlurRadius(radius)
+        blur_effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+        pixmap_item.setGraphicsEffect(blur_effect)
+        scene.addItem(pixmap_item)
+
+        blurred_image = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        blurred_image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(blurred_image)
+        scene.render(painter, QRectF(blurred_image.rect()), QRectF(0, 0, image.width(), image.height()))
+        painter.end()
+        return blurred_image
+
+    def composite_layers(self, painter):
+        """
+        Method to paint the shade and the cached shadow and text layers onto the given painter
+        :param QPainter painter: The painter to composite the layers onto
+        """
+        if self.text_layer is None:
+            return
+
+        if self.use_shade and self.shade_rect:
+            painter.fillRect(
+                self.shade_rect,
+                QColor(self.shade_color, self.shade_color, self.shade_color, self.shade_opacity)
+            )
+        if self.shadow_layer is not None:
+            painter.drawImage(0, 0, self.shadow_layer)
+        painter.drawImage(0, 0, self.text_layer)
 
     def calculate_painted_text(self, painter=None):
         """
         Provides a method for performing all the drawing operations for the text that will be shown on the slide,
         but it does so outside of the paintEvent. If the text is actually to be drawn, the widget's painter can be
-        passed to this method and the text will be painted on to it. If not, it will create its own painter and will
-        return the size of the text background rect in order to give feedback on the final size of the text + background
+        passed to this method; the text will be rendered into cached layers and composited on to it. If not, only the
+        size of the text background rect is returned in order to give feedback on the final size of the text +
+        background
         :param painter: QPainter
         :return: QRectF
 
@@ -1164,22 +1297,15 @@ class LyricDisplayWidget(QWidget):
         self.footer_label.setPalette(palette)"""
 
         self.total_height = 0
-        self.text = re.sub('<p.*?>', '', self.text)
-        self.text = re.sub('</p>', '', self.text)
-        self.text = re.sub('\n', '<br />', self.text)
-        self.text = re.sub('<br/>', '<br />', self.text)
-
-        BOLD = 0
-        ITALIC = 1
-        UNDERLINE = 2
-
         font = self.font()
+        font_family = font.family()
         font_size = font.pointSize() + 2
-        painter_paths = []
+        laid_out_lines = []
         longest_line = 0
+        line_height = 0
         self.footer_label.adjustSize()
 
-        # build paths for each line, creating a new path whenever the line becomes too long
+        # wrap the lines, shrinking the font until the wrapped text fits in the usable height
         footer_height = self.footer_label.height()
         if self.footer_label.isHidden() or len(self.footer_label.text().strip()) == 0:
             footer_height = 0
@@ -1187,61 +1313,21 @@ class LyricDisplayWidget(QWidget):
                             self.gui.display_widget.height() - footer_height - 40)
         self.total_height = -1
         while self.total_height == -1 or self.total_height > usable_rect.height():
-            longest_line = 0
-            painter_paths = []
-            word_path = QPainterPath()
-            path_index = -1
-
             font_size -= 2
-            font = QFont(font.family(), font_size)
+            if font_size < 1:
+                break
+            font = QFont(font_family, font_size)
             self.setFont(font)
-            line_height = self.fontMetrics().boundingRect('Way').height()
-            space_width = self.fontMetrics().horizontalAdvance(' ')
-
-            lines = self.text.split('<br />')
-            for i in range(len(lines)):
-                # if len(re.sub('<.*?>', '', lines[i]).strip()) > 0:
-                x = 0
-                y = 0
-                line_words = lines[i].split(' ')
-                if len(line_words) == 0:
-                    line_words = [' ']
-                painter_paths.append(QPainterPath())
-                path_index += 1
-                for word in line_words:
-                    # if len(re.sub('<.*?>', '', word).strip()) > 0:
-                    word_path.clear()
-                    if '<b>' in word:
-                        font.setWeight(1000)
-                    if '<i>' in word:
-                        font.setItalic(True)
-                    if '<u>' in word:
-                        font.setUnderline(True)
-
-                    word_path.addText(QPointF(x, y), font, re.sub('<.*?>', '', word))
-                    if (painter_paths[path_index].boundingRect().width() + word_path.boundingRect().width()
-                            > self.gui.display_widget.width() - 40):
-                        painter_paths.append(QPainterPath())
-                        x = 0
-                        y = 0
-                        path_index += 1
-                    painter_paths[path_index].addText(QPointF(x, y), font, re.sub('<.*?>', '', word))
-                    x = painter_paths[path_index].boundingRect().width() + space_width
+            line_height = metrics_cache.get_metrics(font_family, font_size).boundingRect('Way').height()
 
-                    if '</b>' in word:
-                        font.setWeight(QFont.Weight.Normal)
-                    if '</i>' in word:
-                        font.setItalic(False)
-                    if '</u>' in word:
-                        font.setUnderline(False)
+            laid_out_lines = wrap_text(self.text, font_family, font_size, self.gui.display_widget.width() - 40)
 
-            # get the total size of the paths that will be drawn for creating the shading rectangle
-            self.total_height = 0
-            for path in painter_paths:
-                # if path.boundingRect().width() > 0:
-                self.total_height += line_height
-                if path.boundingRect().width() > longest_line:
-                    longest_line = path.boundingRect().width()
+            # get the total size of the lines that will be drawn for creating the shading rectangle
+            self.total_height = line_height * len(laid_out_lines)
+            longest_line = 0
+            for line in laid_out_lines:
+                if line.width > longest_line:
+                    longest_line = line.width
 
             if self.for_sample:
                 break
@@ -1250,49 +1336,30 @@ class LyricDisplayWidget(QWidget):
         # the font's ascent (to account for the path's y being the baseline of the text) plus a 20px margin at the top
         path_y = (usable_rect.height() / 2) - (self.total_height / 2) + self.fontMetrics().ascent() + 20
         starting_y = path_y
-        if not painter:
-            painter = QPainter()
-        brush = QBrush()
-        painter.setBrush(brush)
-        pen = QPen()
-        painter.setPen(pen)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        opacity = self.shade_opacity
-        if not self.use_shade:
-            opacity = 0
         shade_rect = QRectF(
             int((self.gui.display_widget.width() / 2) - (longest_line / 2)) - 20,
             starting_y - self.fontMetrics().ascent() - 20,
             longest_line + 40,
             self.total_height + 40
         )
-        painter.fillRect(shade_rect, QColor(self.shade_color, self.shade_color, self.shade_color, opacity))
-
-        for path in painter_paths:
-            path_x = (self.gui.display_widget.width() / 2) - (path.boundingRect().width() / 2)
-            path.translate(path_x, path_y)
-
-            if self.use_shadow:
-                path.translate(self.shadow_offset, self.shadow_offset)
-                shadow_brush = QBrush()
-                shadow_brush.setColor(self.shadow_color)
-                shadow_brush.setStyle(Qt.BrushStyle.SolidPattern)
-                painter.fillPath(path, shadow_brush)
-                path.translate(-self.shadow_offset, -self.shadow_offset)
-
-            brush.setColor(self.fill_color)
-            brush.setStyle(Qt.BrushStyle.SolidPattern)
-            pen.setColor(self.outline_color)
-            pen.setWidth(self.outline_width)
-            painter.setPen(pen)
 
-            painter.fillPath(path, brush)
-            if self.use_outline:
-                painter.strokePath(path, pen)
+        # nothing more is needed if this was only called to measure the text
+        if not painter:
+            return shade_rect, footer_height
 
+        painter_paths = []
+        for line in laid_out_lines:
+            path = build_line_path(line, font_family, self.font().pointSize())
+            path_x = (self.gui.display_widget.width() / 2) - (line.width / 2)
+            path.translate(path_x, path_y)
+            painter_paths.append(path)
             path_y += line_height
 
+        self.render_layers(painter_paths, shade_rect)
+        self.layer_key = self.get_layer_key()
+        self.composite_layers(painter)
+
         return shade_rect, footer_height
 
 
@@ -1594,6 +1661,7 @@ class NewFontWidget(QWidget):
             self.gui.main.settings[f'{self.slide_type}_use_shade'] = self.shade_behind_text_checkbox.isChecked()
             self.gui.main.settings[f'{self.slide_type}_shade_color'] = self.shade_color_slider.color_slider.value()
             self.gui.main.settings[f'{self.slide_type}_shade_opacity'] = self.shade_opacity_slider.color_slider.value()
+            self.gui.schedule_repagination()
 
         self.change_font_sample()
         self.font_sample.repaint()
@@ -2013,54 +2081,151 @@ class StandardDialog(QDialog):
         return self.exec()
 
 
-class StandardItemWidget(QWidget):
+class StandardItemDelegate(QStyledItemDelegate):
     """
-    Provides a standardized QWidget to be used as a QListWidget ItemWidget
+    Paints the standard list row: an optional thumbnail taken from the DecorationRole, a bold title from the
+    DisplayRole, and a subtitle from the SUBTITLE_ROLE, word wrapped if the WRAP_SUBTITLE_ROLE is set. No widgets are
+    created for the rows, so a list only costs what it takes to paint its visible rows. Elided titles and subtitles,
+    and the heights of wrapped subtitles, are cached by text and width.
+    :param gui.GUI gui: The current instance of GUI
+    :param QAbstractItemView parent: The view this delegate paints for
     """
-    def __init__(self, gui, title, subtitle=None, icon=None, wrap_subtitle=False):
-        super().__init__()
+    margin = 9
+    spacing = 4
+
+    def __init__(self, gui, parent=None):
+        """
+        Paints the standard list row of thumbnail, title and subtitle, without creating any widgets for it.
+        :param gui.GUI gui: The current instance of GUI
+        :param QAbstractItemView parent: The view this delegate paints for
+        """
+        super().__init__(parent)
         self.gui = gui
-        self.setObjectName('item_widget')
-        layout = QHBoxLayout(self)
-
-        self.subtitle = None
-        self.icon = None
-
-        if icon:
-            self.icon = QLabel()
-            self.icon.setAutoFillBackground(False)
-            self.icon.setPixmap(icon)
-            self.icon.adjustSize()
-            layout.addWidget(self.icon)
-
-        text_container = QWidget()
-        text_layout = QVBoxLayout(text_container)
-        layout.addWidget(text_container)
-
-        self.title = QLabel(title)
-        self.title.setAutoFillBackground(False)
-        self.title.setObjectName('lyric_item_widget_title')
-        self.title.setFont(self.gui.list_title_font)
-        self.title.adjustSize()
-        text_layout.addWidget(self.title)
+        self.title_metrics = QFontMetrics(self.gui.list_title_font)
+        self.subtitle_metrics = QFontMetrics(self.gui.list_font)
+        self.elided_texts = {}
+        self.subtitle_heights = {}
 
-        if subtitle:
-            subtitle = re.sub('<br.*?>', '\n', subtitle)
-            subtitle = re.sub('<.*?>', '', subtitle)
+    def get_elided_text(self, metrics, text, width):
+        """
+        Method to shorten a line of text with an ellipsis so that it fits the given width, only measuring it if it
+        hasn't been measured at that width before
+        :param QFontMetrics metrics: The metrics of the font the text is painted in
+        :param str text: The text
+        :param int width: The width available
+        :return str: The text, elided if necessary
+        """
+        key = (metrics is self.title_metrics, text, width)
+        elided_text = self.elided_texts.get(key)
+        if elided_text is None:
+            if len(self.elided_texts) > MAX_CACHED_ELISIONS:
+                self.elided_texts.clear()
+            elided_text = metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+            self.elided_texts[key] = elided_text
+        return elided_text
+
+    def get_text_rect(self, rect, icon):
+        """
+        Method to get the part of a row that is left for its title and subtitle after its margins and thumbnail
+        :param QRect rect: The row's rect
+        :param QPixmap icon: The row's thumbnail, or None
+        :return QRect: The text's rect
+        """
+        text_rect = rect.adjusted(self.margin, self.margin, -self.margin, -self.margin)
+        if icon and not icon.isNull():
+            text_rect.setLeft(text_rect.left() + icon.width() + self.margin)
+        return text_rect
+
+    def get_subtitle_height(self, index, width):
+        """
+        Method to measure the height a row's subtitle needs at a given width
+        :param QModelIndex index: The row's index
+        :param int width: The width available for the subtitle
+        :return int: The height, or 0 if the row has no subtitle
+        """
+        subtitle = index.data(SUBTITLE_ROLE)
+        if not subtitle:
+            return 0
+        if not index.data(WRAP_SUBTITLE_ROLE):
+            return self.subtitle_metrics.height() * (subtitle.count('\n') + 1)
+
+        key = (subtitle, width)
+        height = self.subtitle_heights.get(key)
+        if height is None:
+            if len(self.subtitle_heights) > MAX_CACHED_ELISIONS:
+                self.subtitle_heights.clear()
+            bounds = QRect(0, 0, max(width, 1), 100000)
+            height = self.subtitle_metrics.boundingRect(bounds, Qt.TextFlag.TextWordWrap, subtitle).height()
+            self.subtitle_heights[key] = height
+        return height
 
-            self.subtitle = QLabel(subtitle)
-            self.subtitle.setAutoFillBackground(False)
-            self.title.setObjectName('lyric_item_widget_text')
-            if wrap_subtitle:
-                self.subtitle.setWordWrap(True)
-            self.subtitle.setFont(self.gui.list_font)
-            self.subtitle.adjustSize()
-            text_layout.addWidget(self.subtitle)
+    def sizeHint(self, option, index):
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        width = option.rect.width()
+        if width <= 0 and self.parent():
+            width = self.parent().viewport().width()
+
+        text_height = self.title_metrics.height()
+        if index.data(SUBTITLE_ROLE):
+            text_width = self.get_text_rect(QRect(0, 0, width, 0), icon).width()
+            text_height += self.spacing + self.get_subtitle_height(index, text_width)
+        if icon and not icon.isNull():
+            text_height = max(text_height, icon.height())
+        return QSize(width, text_height + self.margin * 2)
+
+    def paint(self, painter, option, index):
+        # let the style draw the row's background so that the stylesheet's hover and selection colors still apply
+        background_option = QStyleOptionViewItem(option)
+        self.initStyleOption(background_option, index)
+        background_option.text = ''
+        background_option.icon = QIcon()
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, background_option, painter, widget)
+
+        painter.save()
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        text_rect = self.get_text_rect(option.rect, icon)
+        if icon and not icon.isNull():
+            painter.drawPixmap(
+                option.rect.left() + self.margin,
+                option.rect.top() + int((option.rect.height() - icon.height()) / 2),
+                icon
+            )
+
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.setFont(self.gui.list_title_font)
+        title = self.get_elided_text(
+            self.title_metrics, index.data(Qt.ItemDataRole.DisplayRole) or '', text_rect.width())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, title)
+
+        subtitle = index.data(SUBTITLE_ROLE)
+        if subtitle:
+            text_rect.setTop(text_rect.top() + self.title_metrics.height() + self.spacing)
+            painter.setFont(self.gui.list_font)
+            flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+            if index.data(WRAP_SUBTITLE_ROLE):
+                flags |= Qt.TextFlag.TextWordWrap
+            else:
+                subtitle = '\n'.join(self.get_elided_text(self.subtitle_metrics, line, text_rect.width())
+                                     for line in subtitle.split('\n'))
+            painter.drawText(text_rect, flags, subtitle)
+        painter.restore()
 
-        if not wrap_subtitle:
-            layout.addStretch()
 
-        self.adjustSize()
+def set_standard_item_data(item, title, subtitle=None, icon=None, wrap_subtitle=False):
+    """
+    Method to give a QListWidgetItem the title, subtitle and thumbnail a StandardItemDelegate paints it from
+    :param QListWidgetItem item: The item
+    :param str title: The item's title
+    :param str subtitle: Optional: the item's subtitle, which may contain lyric markup
+    :param QPixmap icon: Optional: the item's thumbnail
+    :param bool wrap_subtitle: Whether to word wrap the subtitle
+    """
+    item.setData(Qt.ItemDataRole.DisplayRole, title)
+    item.setData(SUBTITLE_ROLE, get_plain_text(subtitle) if subtitle else None)
+    item.setData(Qt.ItemDataRole.DecorationRole, icon)
+    item.setData(WRAP_SUBTITLE_ROLE, wrap_subtitle)
 
 
 class SettingsWidget(QWidget):
@@ -4192,10 +4357,7 @@ class TextLayoutLyricWidget(QWidget):
 
     def paintEvent(self, evt):
         self.total_height = 0
-        self.text = re.sub('<p.*?>', '', self.text)
-        self.text = re.sub('</p>', '', self.text)
-        self.text = re.sub('\n', '<br />', self.text)
-        self.text = re.sub('<br/>', '<br />', self.text)
+        self.text = normalize_lyrics(self.text)
 
         BOLD = 0
         ITALIC = 1
@@ -4241,14 +4403,14 @@ class TextLayoutLyricWidget(QWidget):
                     if '<u>' in word:
                         font.setUnderline(True)
 
-                    word_path.addText(QPointF(x, y), font, re.sub('<.*?>', '', word))
+                    word_path.addText(QPointF(x, y), font, strip_tags(word))
                     if (painter_paths[path_index].boundingRect().width() + word_path.boundingRect().width()
                             > self.gui.display_widget.width() - 40):
                         painter_paths.append(QPainterPath())
                         x = 0
                         y = 0
                         path_index += 1
-                    painter_paths[path_index].addText(QPointF(x, y), font, re.sub('<.*?>', '', word))
+                    painter_paths[path_index].addText(QPointF(x, y), font, strip_tags(word))
                     x = painter_paths[path_index].boundingRect().width() + space_width
 
                     if '</b>' in word:
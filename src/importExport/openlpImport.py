@@ -1,15 +1,13 @@
-import json
-import os.path
 import os.path
 import re
 import sqlite3
 from xml.etree import ElementTree as ET
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QLineEdit, QPushButton, QProgressBar, \
-    QFileDialog, QMessageBox, QDialog
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QLineEdit, QPushButton, QFileDialog, \
+    QMessageBox, QDialog
 
 from dataHandling.declarations import SLIDE_DATA_DEFAULTS
-from dataHandling.parsers import parse_song_data
+from dataHandling.lyricMarkup import BREAK_TAG, trim_breaks
 
 
 class OpenLPImport:
@@ -26,8 +24,7 @@ class OpenLPImport:
 
     def init_components(self):
         """
-        Creates and lays out the widget prompting the user to import their database and shows a progress bar when
-        importing.
+        Creates and lays out the widget prompting the user to import their database.
         """
         self.widget = QDialog()
         layout = QVBoxLayout()
@@ -57,13 +54,6 @@ class OpenLPImport:
         cancel_button.setFont(self.gui.standard_font)
         cancel_button.clicked.connect(lambda: self.widget.done(0))
 
-        self.song_label = QLabel()
-        self.song_label.setFont(self.gui.standard_font)
-        layout.addWidget(self.song_label)
-
-        self.progress_bar = QProgressBar()
-        layout.addWidget(self.progress_bar)
-
         self.start_button = QPushButton('Start Import')
         self.start_button.setFont(self.gui.standard_font)
         self.start_button.clicked.connect(self.start_import)
@@ -87,80 +77,104 @@ class OpenLPImport:
 
     def start_import(self):
         """
-        Method to perform the task of retrieving the song data from the OpenLP database.
+        Method to read the songs from the OpenLP database and hand them to the song importer, which parses and saves
+        them in the background.
         """
-        connection = None
         try:
-            connection = sqlite3.connect(self.openlp_database_file)
-            cursor = connection.cursor()
-
-            result = cursor.execute('SELECT * FROM songs').fetchall()
-            num_songs = len(result)
-            self.progress_bar.setRange(0, num_songs)
-            self.progress_bar.setValue(0)
-
-            for song in result:
-                self.song_label.setText(song[1])
-                title = song[1]
-                auth_num = cursor.execute('SELECT song_id FROM authors_songs WHERE song_id = ' + str(song[0])).fetchone()
-                author = cursor.execute('SELECT display_name FROM authors WHERE id = ' + str(auth_num[0])).fetchone()
-                if author:
-                    author = author[0]
-                else:
-                    author = ''
-
-                # remove 'o' tags and convert to 't' tags
-                verse_order = song[4]
-                verse_order_split = verse_order.strip().split(' ')
-                for i in range(len(verse_order_split)):
-                    if verse_order_split[i][0] == 'o':
-                        if len(verse_order_split[i]) > 1:
-                            verse_order_split[i] = 't' + verse_order_split[i][1]
-                        else:
-                            verse_order_split[i] = 't1'
-                verse_order = ' '.join(verse_order_split)
-
-                data = SLIDE_DATA_DEFAULTS
-                data['type'] = 'song'
-                data['title'] = title
-                data['author'] = author
-                data['copyright'] = song[5]
-                data['ccli_song_number'] = song[7]
-                data['verse_order'] = verse_order
-                data['text'] = self.convert_lyrics(song[3])
-                data['parsed_text'] = parse_song_data(self.gui, data)
-
-                self.gui.main.save_song(data)
-
-            self.gui.media_widget.populate_song_list()
-            self.widget.done(0)
-
+            records = read_openlp_songs(self.openlp_database_file)
         except Exception as ex:
-            self.gui.main.error_log()
-            if connection:
-                connection.close()
+            self.gui.main.error_log(f'Unable to read OpenLP database {self.openlp_database_file}: {ex}')
             QMessageBox.information(
                 self.widget,
                 'Import Error',
                 'File is not a valid OpenLP Database' + str(ex),
                 QMessageBox.StandardButton.Ok)
+            return
 
-    def convert_lyrics(self, lyrics):
-        """
-        Method to change OpenLp's segment tags to this program's segment tags.
-        :param str lyrics: The song's lyrics
-        :return str converted_lyrics: The reformatted lyrics
-        """
-        root = ET.fromstring(lyrics)
-        lyrics = root.find('lyrics')
-        converted_lyrics = ''
-        for element in lyrics:
-            text = re.sub(r'\{.*?\}', '', element.text).strip()
-            text = text.replace('[---]\n', '')
-            text = text.replace('\n', '<br />')
-            type = element.attrib['type'][0].lower()
-            if type == 'o':
-                type = 't'
-            converted_lyrics += '[' + type + element.attrib['label'] + ']<p>' + text + '</p>'
-
-        return converted_lyrics.strip()
+        self.widget.done(0)
+        self.gui.main.import_songs(records, parse_openlp_song)
+
+
+def read_openlp_songs(database_file):
+    """
+    Method to retrieve the song records from an OpenLP database, along with each song's authors.
+    :param str database_file: The location of the OpenLP database
+    :return list of dict: The title, authors, copyright, ccli song number, verse order, and lyrics xml of each song
+    """
+    connection = sqlite3.connect(database_file)
+    try:
+        cursor = connection.cursor()
+        result = cursor.execute('SELECT * FROM songs').fetchall()
+
+        authors = {}
+        author_rows = cursor.execute(
+            'SELECT authors_songs.song_id, authors.display_name FROM authors_songs '
+            'JOIN authors ON authors.id = authors_songs.author_id').fetchall()
+        for song_id, display_name in author_rows:
+            if display_name:
+                authors.setdefault(song_id, []).append(display_name)
+    finally:
+        connection.close()
+
+    records = []
+    for song in result:
+        records.append({
+            'title': song[1],
+            'author': ' | '.join(authors.get(song[0], [])),
+            'copyright': song[5],
+            'ccli_song_number': song[7],
+            'verse_order': song[4],
+            'lyrics': song[3]
+        })
+    return records
+
+
+def parse_openlp_song(record):
+    """
+    Method to convert a song record from an OpenLP database into song data. Touches nothing but the record, so it can
+    be run on a worker thread.
+    :param dict record: The song's record, from read_openlp_songs
+    :return dict: The song's data
+    """
+    # remove 'o' tags and convert to 't' tags
+    verse_order = record['verse_order'] or ''
+    verse_order_split = verse_order.strip().split(' ')
+    for i in range(len(verse_order_split)):
+        if verse_order_split[i] and verse_order_split[i][0] == 'o':
+            if len(verse_order_split[i]) > 1:
+                verse_order_split[i] = 't' + verse_order_split[i][1]
+            else:
+                verse_order_split[i] = 't1'
+    verse_order = ' '.join(verse_order_split)
+
+    data = SLIDE_DATA_DEFAULTS.copy()
+    data['type'] = 'song'
+    data['title'] = record['title']
+    data['author'] = record['author']
+    data['copyright'] = record['copyright'] or ''
+    data['ccli_song_number'] = record['ccli_song_number'] or ''
+    data['verse_order'] = verse_order
+    data['text'] = convert_lyrics(record['lyrics'])
+    return data
+
+
+def convert_lyrics(lyrics):
+    """
+    Method to change OpenLp's segment tags to this program's segment tags.
+    :param str lyrics: The song's lyrics
+    :return str converted_lyrics: The reformatted lyrics
+    """
+    root = ET.fromstring(lyrics)
+    lyrics = root.find('lyrics')
+    converted_lyrics = ''
+    for element in lyrics:
+        text = re.sub(r'\{.*?\}', '', element.text).strip()
+        text = text.replace('[---]\n', '')
+        text = text.replace('\n', '<br />')
+        type = element.attrib['type'][0].lower()
+        if type == 'o':
+            type = 't'
+        # each marker goes on its own line so that the lyrics are stored as tagged segments
+        converted_lyrics += f'[{type}{element.attrib["label"]}]{BREAK_TAG}{text}{BREAK_TAG}'
+
+    return trim_breaks(converted_lyrics.strip())
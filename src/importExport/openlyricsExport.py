@@ -1,11 +1,12 @@
 import os
-import re
 from xml.etree import ElementTree
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListWidget, QListWidgetItem, QHBoxLayout, QPushButton, QLabel, \
     QMessageBox, QFileDialog, QApplication
 
+from dataHandling.lyricMarkup import BREAK_TAG, get_plain_line, get_short_marker, get_structured_lyrics, trim_breaks, \
+    get_lyric_segments, decode_lyrics, get_plain_text
 from gui.widgets.widgets import SimpleSplash
 
 
@@ -141,29 +142,27 @@ class OpenlyricsExport(QWidget):
 
                     lyrics = ElementTree.SubElement(song, 'lyrics')
 
-                    if '[' in song_data[4]:
-                        lyric_split = song_data[4].split('[')
-                        for segment in lyric_split:
-                            if len(segment) > 0:
-                                tag_split = segment.split(']')
-                                tag = tag_split[0]
-                                short_tag_split = tag.split(' ')
-                                short_tag = short_tag_split[0][0].lower() + short_tag_split[1].strip()
-
-                                segment_split = re.split('<br.*?>', tag_split[1])
-                                for i in range(len(segment_split)):
-                                    segment_split[i] = re.sub('<.*?>', '', segment_split[i])
-                                lyrics_text = '<br />'.join(segment_split)
-                                if lyrics_text.startswith('<br />'):
-                                    lyrics_text = lyrics_text[6:]
-                                if lyrics_text.endswith('<br />'):
-                                    lyrics_text = lyrics_text[:-6]
-
-                                verse_element = ElementTree.SubElement(lyrics, 'verse')
-                                verse_element.set('name', short_tag)
-
-                                lines = ElementTree.SubElement(verse_element, 'lines')
-                                lines.text = lyrics_text
+                    segments = []
+                    for tag, lines in get_structured_lyrics(song_data[4])['segments']:
+                        # any lines before the first segment marker don't belong to a verse
+                        if tag is None:
+                            continue
+                        segments.append((
+                            get_short_marker('[' + tag + ']')[1:-1],
+                            trim_breaks(BREAK_TAG.join(get_plain_line(line) for line in lines))
+                        ))
+
+                    # lyrics without any segment markers are split into verses the same way they are shown
+                    if not segments:
+                        for marker, text in get_lyric_segments(decode_lyrics(song_data[4])).items():
+                            segments.append((marker[1:-1], get_plain_text(text).replace('\n', BREAK_TAG)))
+
+                    for short_tag, lyrics_text in segments:
+                        verse_element = ElementTree.SubElement(lyrics, 'verse')
+                        verse_element.set('name', short_tag)
+
+                        lines = ElementTree.SubElement(verse_element, 'lines')
+                        lines.text = lyrics_text
 
                     ElementTree.indent(song, '   ', 0)
                     file_contents = ElementTree.tostring(song, encoding='unicode')
@@ -13,8 +13,7 @@ from PyQt5.QtWidgets import QLabel, QHBoxLayout, QPushButton, QWidget, QLineEdit
 from cryptography.fernet import Fernet
 
 from dataHandling.declarations import SLIDE_DATA_DEFAULTS
-from dataHandling.parsers import parse_song_data
-from gui.widgets.widgets import SimpleSplash
+from dataHandling.lyricMarkup import BREAK_PATTERN
 
 
 class SongselectImport(QDialog):
@@ -283,15 +282,11 @@ class SongselectImport(QDialog):
 
     def download_finished(self):
         """
-        Callback for when download has finished. Parses the downloaded file into song data to be saved to the database.
+        Callback for when download has finished. Hands the downloaded files to the song importer to be parsed and saved
+        to the database.
         """
         #if self.current_download_item:
         #    if self.current_download_item.isFinished():
-        song_title = ''
-        author = ''
-        copyright = ''
-        song_number = ''
-
         #song_filename = os.path.join(self.current_download_item.downloadDirectory(),
         #                             self.current_download_item.downloadFileName())
 
@@ -329,9 +324,9 @@ class SongselectImport(QDialog):
                 self.gui.main.settings['show_songselect_warning'] = False
                 self.gui.main.save_settings()
 
-        result = QFileDialog.getOpenFileName(
+        result = QFileDialog.getOpenFileNames(
             self.gui.main_window,
-            'SongSelect Lyrics File',
+            'SongSelect Lyrics Files',
             os.path.expanduser('~/Downloads'),
             'SongSelect Lyrics File (*.txt)'
         )
@@ -339,80 +334,79 @@ class SongselectImport(QDialog):
         if len(result[0]) == 0:
             return
 
-        song_filename = result[0]
-        with open(song_filename, 'r', encoding='utf-8') as file:
-            song_text = file.read()
-
-        song_text = re.sub('<br.*?>', '', song_text)
-
-        paragraphs = song_text.split('\n\n')
-        song_title = paragraphs[0].strip()
-
-        copyright_info = paragraphs[-1]
-        copyright_lines = copyright_info.split('\n')
-        author = copyright_lines[0].strip()
-        copyright = copyright_lines[2]
-        song_number = copyright_lines[1].split('#')[-1]
-
-        song_text = '\n\n'.join(paragraphs[1:-1])
-
-        song_text_split = song_text.split('\n')
-        segment_markers = [
-            'intro',
-            'verse',
-            'pre-chorus',
-            'chorus',
-            'bridge',
-            'tag',
-            'ending'
-        ]
-        segment_marker_indices = []
-        for i in range(len(song_text_split)):
-            for marker in segment_markers:
-                if marker in song_text_split[i].lower() and len(song_text_split[i]) < len(marker) + 3:
-                    segment_marker_indices.append(i)
-                    break
-
-        index = 0
-        formatted_song_text = ''
-        order = []
-        while index < len(song_text_split):
-            if index in segment_marker_indices:
-                marker = song_text_split[index].strip()
-                has_digit = any(char.isdigit() for char in marker)
-                if not has_digit:
-                    marker += ' 1'
-                formatted_marker = f'[{marker.capitalize()}]'
-                formatted_song_text += formatted_marker + '\n'
-
-                marker = marker.split(' ')[0][0].lower() + marker.split(' ')[1]
-                order.append(marker)
-            else:
-                formatted_song_text += song_text_split[index] + '\n'
-            index += 1
-        formatted_song_text = formatted_song_text.strip()
-        order = ' '.join(order)
-
-        song_data = SLIDE_DATA_DEFAULTS.copy()
-        song_data['type'] = 'song'
-        song_data['title'] = song_title
-        song_data['text'] = formatted_song_text
-        song_data['author'] = author
-        song_data['copyright'] = copyright
-        song_data['ccli_song_number'] = song_number
-        song_data['verse_order'] = order
-        song_data['parsed_text'] = parse_song_data(self.gui, song_data)
-
-        save_widget = SimpleSplash(self.gui, 'Saving...')
-
-        self.gui.main.save_song(song_data)
-        self.gui.media_widget.populate_song_list()
-
-        self.gui.media_widget.song_list.setCurrentItem(
-            self.gui.media_widget.song_list.findItems(song_title, Qt.MatchFlag.MatchExactly)[0])
-
-        save_widget.widget.deleteLater()
         self.done(0)
+        self.gui.main.import_songs(result[0], parse_songselect_file)
+
+
+def parse_songselect_file(file_name):
+    """
+    Method to read a lyrics file downloaded from SongSelect into song data. Touches nothing but the file, so it can be
+    run on a worker thread.
+    :param str file_name: The file's location
+    :return dict: The song's data
+    """
+    with open(file_name, 'r', encoding='utf-8') as file:
+        song_text = file.read()
+
+    song_text = BREAK_PATTERN.sub('', song_text)
+
+    paragraphs = song_text.split('\n\n')
+    song_title = paragraphs[0].strip()
+
+    copyright_info = paragraphs[-1]
+    copyright_lines = copyright_info.split('\n')
+    author = copyright_lines[0].strip()
+    copyright = copyright_lines[2]
+    song_number = copyright_lines[1].split('#')[-1]
+
+    song_text = '\n\n'.join(paragraphs[1:-1])
+
+    song_text_split = song_text.split('\n')
+    segment_markers = [
+        'intro',
+        'verse',
+        'pre-chorus',
+        'chorus',
+        'bridge',
+        'tag',
+        'ending'
+    ]
+    segment_marker_indices = []
+    for i in range(len(song_text_split)):
+        for marker in segment_markers:
+            if marker in song_text_split[i].lower() and len(song_text_split[i]) < len(marker) + 3:
+                segment_marker_indices.append(i)
+                break
+
+    index = 0
+    formatted_song_text = ''
+    order = []
+    while index < len(song_text_split):
+        if index in segment_marker_indices:
+            marker = song_text_split[index].strip()
+            has_digit = any(char.isdigit() for char in marker)
+            if not has_digit:
+                marker += ' 1'
+            formatted_marker = f'[{marker.capitalize()}]'
+            formatted_song_text += formatted_marker + '\n'
+
+            marker = marker.split(' ')[0][0].lower() + marker.split(' ')[1]
+            order.append(marker)
+        else:
+            formatted_song_text += song_text_split[index] + '\n'
+        index += 1
+    formatted_song_text = formatted_song_text.strip()
+    order = ' '.join(order)
+
+    song_data = SLIDE_DATA_DEFAULTS.copy()
+    song_data['type'] = 'song'
+    song_data['title'] = song_title
+    song_data['text'] = formatted_song_text
+    song_data['author'] = author
+    song_data['copyright'] = copyright
+    song_data['ccli_song_number'] = song_number
+    song_data['verse_order'] = order
+    return song_data
 
 
 class WebEnginePage (QWebEnginePage):
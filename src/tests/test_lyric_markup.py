@@ -0,0 +1,107 @@
+"""
+Tests for the lyric markup handling in dataHandling.lyricMarkup. Run from the src directory:
+
+    python -m unittest discover tests
+"""
+import unittest
+
+from benchmarks.lyric_corpus import SONGS, to_qt_html, to_openlp_lyrics, to_simplified_lyrics
+from dataHandling.lyricMarkup import encode_lyrics, decode_lyrics, get_structured_lyrics, normalize_lyrics, \
+    get_lyric_segments, get_span_tags, split_custom_slides
+
+
+class StructuredLyricsTest(unittest.TestCase):
+    """
+    Checks that lyrics stored in the structured form read back into the editor unchanged, with their segments tagged
+    """
+    def assert_round_trip(self, lyrics):
+        """
+        Method to check that lyrics read back from the structured form as the same simplified markup
+        :param str lyrics: The lyrics, in simplified markup
+        """
+        self.assertEqual(decode_lyrics(encode_lyrics(lyrics)), normalize_lyrics(lyrics))
+
+    def test_bracketed_text_inside_a_line_is_kept(self):
+        lyrics = '[Verse 1]<br />Sing it again [x2]<br />more'
+        self.assert_round_trip(lyrics)
+        self.assertEqual(
+            get_structured_lyrics(encode_lyrics(lyrics))['segments'],
+            [['Verse 1', ['Sing it again [x2]', 'more']]]
+        )
+
+    def test_bracketed_text_at_the_end_of_the_lyrics_is_kept(self):
+        lyrics = '[Chorus]<br />Hallelujah [Repeat]'
+        self.assert_round_trip(lyrics)
+        self.assertEqual(
+            get_structured_lyrics(encode_lyrics(lyrics))['segments'],
+            [['Chorus', ['Hallelujah [Repeat]']]]
+        )
+
+    def test_styled_lines_and_blank_lines_round_trip(self):
+        self.assert_round_trip(
+            '[Verse 1]<br />Hello <b>there</b><br /><br />[Chorus 1]<br /><i>Yes</i> <u>and</u> amen')
+
+    def test_lyrics_without_markers_round_trip(self):
+        lyrics = 'no markers<br />at all'
+        self.assert_round_trip(lyrics)
+        self.assertEqual(get_structured_lyrics(encode_lyrics(lyrics))['segments'], [[None, ['no markers', 'at all']]])
+
+    def test_openlp_inline_markers_start_segments(self):
+        lyrics = '[v1]<p>Amazing grace<br />how sweet</p>[c1]<p>chorus line</p>'
+        self.assertEqual(
+            get_structured_lyrics(encode_lyrics(lyrics))['segments'],
+            [['v1', ['Amazing grace', 'how sweet']], ['c1', ['chorus line']]]
+        )
+
+
+class LyricCorpusTest(unittest.TestCase):
+    """
+    Checks the lyric markup handling against the songs in benchmarks.lyric_corpus, in each form they are stored in
+    """
+    def test_editor_html_normalizes_to_the_corpus_markup(self):
+        for song in SONGS:
+            with self.subTest(song['title']):
+                self.assertEqual(normalize_lyrics(to_qt_html(song)), to_simplified_lyrics(song))
+
+    def test_segments_read_from_html_match_the_stored_lyrics(self):
+        for song in SONGS:
+            with self.subTest(song['title']):
+                self.assertEqual(
+                    get_lyric_segments(to_qt_html(song)), get_lyric_segments(to_simplified_lyrics(song)))
+
+    def test_structured_lyrics_round_trip(self):
+        for song in SONGS:
+            with self.subTest(song['title']):
+                lyrics = to_simplified_lyrics(song)
+                self.assertEqual(decode_lyrics(encode_lyrics(lyrics)), lyrics)
+                self.assertEqual(
+                    [tag for tag, lines in get_structured_lyrics(encode_lyrics(lyrics))['segments']],
+                    [marker for marker, lines in song['segments']]
+                )
+
+    def test_openlp_lyrics_keep_their_segments(self):
+        for song in SONGS:
+            with self.subTest(song['title']):
+                lyrics = to_openlp_lyrics(song)
+                stored = encode_lyrics(lyrics)
+                self.assertNotIn(None, [tag for tag, lines in get_structured_lyrics(stored)['segments']])
+                self.assertEqual(get_lyric_segments(decode_lyrics(stored)), get_lyric_segments(lyrics))
+
+
+class MarkupHelpersTest(unittest.TestCase):
+    """
+    Checks the smaller helpers that the editor and the display use
+    """
+    def test_span_tags_close_in_reverse_order(self):
+        prefix, suffix = get_span_tags(' style=" font-weight:700; font-style:italic; text-decoration: underline;"')
+        self.assertEqual(prefix + 'y' + suffix, '<b><i><u>y</u></i></b>')
+
+    def test_custom_slides_split_on_blank_lines(self):
+        self.assertEqual(
+            split_custom_slides('one<br />line<br /><br />two<br /><br /><br />three'),
+            ['one<br />line', 'two', 'three']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()